@@ -0,0 +1,139 @@
+"""
+Benchmark: time to first token of /api/chat/stream against the local fake model
+Serves the app with uvicorn on a local port (ASGITransport would buffer the
+whole body), with CHAT_MODEL_BACKEND=fake emitting --tokens words every
+--token-delay-ms. Reports time to first token and to the final "done" event at
+--concurrency streams in flight, then checks that a client disconnecting
+after the first token stops the model and frees its chat slot.
+
+Run from backend/:  python benchmarks/bench_chat_stream.py --requests 100 --concurrency 20
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--tokens", type=int, default=60, help="words per fake answer")
+    parser.add_argument("--token-delay-ms", type=float, default=30)
+    return parser.parse_args()
+
+
+ARGS = parse_args()
+
+# The app reads its settings at import time; the database is empty (no lifespan), so the
+# chat features that read it are off and only streaming itself is measured
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(prefix='bench_chat_'), 'bench.db')}"
+os.environ["CHAT_MODEL_BACKEND"] = "fake"
+for name in ("CHAT_CACHE_ENABLED", "CHAT_SESSIONS_ENABLED", "RETRIEVAL_ENABLED"):
+    os.environ[name] = "false"
+os.environ["RATE_LIMIT_PER_MINUTE"] = str(10 ** 9)
+# Every stream comes from one client address: admission limits must not get in the way
+os.environ["CHAT_MAX_CONCURRENT"] = os.environ["CHAT_MAX_PER_CLIENT"] = str(ARGS.concurrency + 1)
+for name in ("GEMINI_API_KEY", "ADMIN_PASSWORD_HASH", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+import main  # noqa: E402
+from bench_public import percentile  # noqa: E402
+from chat_engine import chat_engine  # noqa: E402
+from chat_models import FakeChatModel  # noqa: E402
+
+
+class TrackedFakeModel(FakeChatModel):
+    """FakeChatModel that counts the streams still generating"""
+
+    def __init__(self, token_delay_ms: float, tokens: int):
+        super().__init__(token_delay_ms, tokens)
+        self.open_streams = 0
+
+    async def stream(self, history: Any, message: str):
+        self.open_streams += 1
+        try:
+            async for text in super().stream(history, message):
+                yield text
+        finally:
+            self.open_streams -= 1
+
+
+async def timed_stream(client: httpx.AsyncClient, message: str) -> Dict[str, float]:
+    """Milliseconds to the first token event and to the done event"""
+    start = time.perf_counter()
+    first = done = 0.0
+    async with client.stream("POST", "/api/chat/stream", json={"message": message}) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if line == "event: token" and not first:
+                first = time.perf_counter() - start
+            elif line == "event: done":
+                done = time.perf_counter() - start
+    return {"first_token_ms": first * 1000, "done_ms": done * 1000}
+
+
+async def check_disconnect(client: httpx.AsyncClient, model: TrackedFakeModel) -> bool:
+    """Drop the connection after the first token; True if the model stops and the slot is freed"""
+    async with client.stream("POST", "/api/chat/stream", json={"message": "disconnect test"}) as response:
+        async for line in response.aiter_lines():
+            if line == "event: token":
+                break
+    for _ in range(50):
+        await asyncio.sleep(model.token_delay)
+        if model.open_streams == 0 and chat_engine.running == 0:
+            return True
+    return False
+
+
+async def _main() -> None:
+    model = TrackedFakeModel(ARGS.token_delay_ms, ARGS.tokens)
+    main.chat_model = model
+
+    server = uvicorn.Server(uvicorn.Config(main.app, host="127.0.0.1", port=0, lifespan="off", log_level="warning"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=60) as client:
+            pending = list(range(ARGS.requests))
+            results: List[Dict[str, float]] = []
+
+            async def worker() -> None:
+                while pending:
+                    results.append(await timed_stream(client, f"question {pending.pop()} about AI tools"))
+
+            await asyncio.gather(*(worker() for _ in range(ARGS.concurrency)))
+            disconnect_ok = await check_disconnect(client, model)
+    finally:
+        server.should_exit = True
+        await serving
+
+    generation_ms = ARGS.tokens * ARGS.token_delay_ms
+    print(f"Fake model: {ARGS.tokens} words x {ARGS.token_delay_ms} ms = {generation_ms:.0f} ms per answer")
+    print(f"{ARGS.requests} streams, {ARGS.concurrency} in flight")
+    for key, label in (("first_token_ms", "first token"), ("done_ms", "done event")):
+        values = sorted(result[key] for result in results)
+        print(f"  {label:<12} p50 {percentile(values, 50):8.1f} ms   p95 {percentile(values, 95):8.1f} ms"
+              f"   max {values[-1]:8.1f} ms")
+    print(f"{'✅' if disconnect_ok else '❌'} Disconnect after the first token "
+          f"{'stops' if disconnect_ok else 'does not stop'} the model and frees its slot")
+    if not disconnect_ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
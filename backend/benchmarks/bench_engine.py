@@ -0,0 +1,176 @@
+"""
+Benchmark: baseline vs production database engine profile under concurrent load
+Seeds a throwaway SQLite file, then starts two worker processes (like two
+gunicorn workers) per profile. Each worker runs concurrent public list reads
+while one of them also applies counter-style UPDATEs, and reports reads/s,
+writes/s, p95 latency and "database is locked" errors.
+
+  baseline:    echo on, journal_mode=DELETE, synchronous=FULL, default cache
+  production:  the config.Settings defaults (WAL, NORMAL, 64 MB cache, mmap)
+
+Run from backend/:  python benchmarks/bench_engine.py --rows 5000 --seconds 5
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+for name in ("GEMINI_API_KEY", "ADMIN_PASSWORD_HASH", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+PROFILES = {
+    "baseline": {
+        "DATABASE_ECHO": "true",
+        "SQLITE_JOURNAL_MODE": "DELETE",
+        "SQLITE_SYNCHRONOUS": "FULL",
+        "SQLITE_CACHE_SIZE_KB": "0",
+        "SQLITE_MMAP_SIZE_BYTES": "0",
+    },
+    "production": {},
+}
+
+
+def seed(db_path: str, rows: int) -> None:
+    """Create the schema and insert rows published blogs"""
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{db_path}"
+    from database import engine, init_db
+    from models import Blog
+
+    async def run() -> None:
+        await init_db()
+        async with engine.begin() as conn:
+            await conn.execute(Blog.__table__.insert(), [
+                {
+                    "title": f"Benchmark post {i}",
+                    "slug": f"benchmark-post-{i}",
+                    "excerpt": "Benchmark excerpt",
+                    "content": "Benchmark body " * 20,
+                    "author": "Vicky Kumar",
+                    "views": 0,
+                    "likes": 0,
+                    "published": True,
+                    "featured": i % 10 == 0,
+                }
+                for i in range(rows)
+            ])
+        await engine.dispose()
+
+    asyncio.run(run())
+
+
+def worker(db_path: str, profile: str, rows: int, seconds: float, readers: int, writer: bool, results) -> None:
+    """One server process: concurrent readers plus (optionally) a counter writer"""
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{db_path}"
+    os.environ.update(PROFILES[profile])
+    # echo=True logs every statement to stdout; keep the cost, drop the noise
+    # (SQLAlchemy binds its handler to sys.stdout when the engine is created)
+    sys.stdout = open(os.devnull, "w")
+
+    from sqlalchemy import select, update
+    from database import AsyncSessionLocal, dispose_engines
+    from models import Blog
+    from pagination import keyset_order
+
+    stats = {"reads": 0, "writes": 0, "locked": 0, "latencies": []}
+
+    async def read_loop(deadline: float) -> None:
+        offset = 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                async with AsyncSessionLocal() as db:
+                    result = await db.execute(
+                        select(Blog).where(Blog.published == True)
+                        .order_by(*keyset_order(Blog)).offset(offset).limit(10)
+                    )
+                    result.scalars().all()
+                stats["reads"] += 1
+                stats["latencies"].append(time.perf_counter() - started)
+            except Exception as e:
+                if "locked" not in str(e):
+                    raise
+                stats["locked"] += 1
+            offset = (offset + 10) % max(rows - 10, 1)
+
+    async def write_loop(deadline: float) -> None:
+        item_id = 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(
+                        update(Blog).where(Blog.id == item_id % rows + 1).values(views=Blog.views + 1)
+                    )
+                    await db.commit()
+                stats["writes"] += 1
+                stats["latencies"].append(time.perf_counter() - started)
+            except Exception as e:
+                if "locked" not in str(e):
+                    raise
+                stats["locked"] += 1
+            item_id += 1
+
+    async def run() -> None:
+        deadline = time.perf_counter() + seconds
+        tasks = [read_loop(deadline) for _ in range(readers)]
+        if writer:
+            tasks.append(write_loop(deadline))
+        await asyncio.gather(*tasks)
+        await dispose_engines()
+
+    asyncio.run(run())
+    results.put(stats)
+
+
+def run_profile(profile: str, rows: int, seconds: float, readers: int) -> dict:
+    db_path = os.path.join(tempfile.mkdtemp(prefix=f"bench_engine_{profile}_"), "bench.db")
+    context = multiprocessing.get_context("spawn")
+    seeder = context.Process(target=seed, args=(db_path, rows))
+    seeder.start()
+    seeder.join()
+
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(db_path, profile, rows, seconds, readers, index == 0, results))
+        for index in range(2)
+    ]
+    for process in processes:
+        process.start()
+    collected = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    latencies = sorted(latency for stats in collected for latency in stats["latencies"])
+    p95 = latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0
+    return {
+        "reads/s": sum(stats["reads"] for stats in collected) / seconds,
+        "writes/s": sum(stats["writes"] for stats in collected) / seconds,
+        "p95 ms": p95,
+        "locked": sum(stats["locked"] for stats in collected),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--readers", type=int, default=4, help="concurrent readers per worker process")
+    args = parser.parse_args()
+
+    print(f"{'profile':<12} {'reads/s':>9} {'writes/s':>9} {'p95 ms':>8} {'locked':>7}")
+    for profile in PROFILES:
+        report = run_profile(profile, args.rows, args.seconds, args.readers)
+        print(
+            f"{profile:<12} {report['reads/s']:>9.0f} {report['writes/s']:>9.0f} "
+            f"{report['p95 ms']:>8.2f} {report['locked']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
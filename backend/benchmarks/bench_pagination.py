@@ -0,0 +1,115 @@
+"""
+Benchmark: offset vs keyset (cursor) deep paging on /api/blogs
+Seeds a throwaway SQLite database with published blogs and times page fetches
+at increasing depths through the ASGI app, with the response cache disabled.
+
+Run from backend/:  python benchmarks/bench_pagination.py --rows 100000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+DB_PATH = os.path.join(tempfile.mkdtemp(prefix="bench_pagination_"), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+for name in ("GEMINI_API_KEY", "ADMIN_PASSWORD_HASH", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from database import engine, init_db, AsyncSessionLocal  # noqa: E402
+from models import Blog  # noqa: E402
+from pagination import encode_cursor, keyset_order  # noqa: E402
+from routes_public import router as public_router  # noqa: E402
+
+
+async def seed(rows: int) -> None:
+    """Insert rows published blogs with distinct, descending publish dates"""
+    await init_db()
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    batch = []
+    async with engine.begin() as conn:
+        for i in range(rows):
+            batch.append({
+                "title": f"Benchmark post {i}",
+                "slug": f"benchmark-post-{i}",
+                "excerpt": "Benchmark excerpt",
+                "content": "Benchmark body",
+                "author": "Vicky Kumar",
+                "views": 0,
+                "likes": 0,
+                "published": True,
+                "featured": i % 10 == 0,
+                "published_at": start + timedelta(minutes=i),
+            })
+            if len(batch) == 5000:
+                await conn.execute(Blog.__table__.insert(), batch)
+                batch = []
+        if batch:
+            await conn.execute(Blog.__table__.insert(), batch)
+
+
+async def cursor_at_depth(depth: int) -> str:
+    """Cursor that resumes right after the first depth rows"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Blog.published_at, Blog.id)
+            .where(Blog.published == True)
+            .order_by(*keyset_order(Blog))
+            .offset(depth - 1)
+            .limit(1)
+        )
+        published_at, row_id = result.one()
+    return encode_cursor(published_at, row_id)
+
+
+async def time_requests(client: httpx.AsyncClient, params: dict, repeat: int) -> float:
+    """Mean latency in milliseconds of GET /api/blogs with params"""
+    await client.get("/api/blogs", params=params)  # warm-up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        response = await client.get("/api/blogs", params=params)
+        response.raise_for_status()
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"Seeding {args.rows} blogs into {DB_PATH} ...")
+    await seed(args.rows)
+
+    app = FastAPI()
+    app.include_router(public_router)
+    transport = httpx.ASGITransport(app=app)
+
+    depths = [d for d in (1, 1_000, 10_000, 50_000, args.rows - args.limit) if 0 < d < args.rows]
+    print(f"{'depth':>10} {'offset ms':>12} {'cursor ms':>12}")
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for depth in depths:
+            offset_ms = await time_requests(
+                client, {"skip": depth, "limit": args.limit}, args.repeat
+            )
+            cursor_ms = await time_requests(
+                client, {"cursor": await cursor_at_depth(depth), "limit": args.limit}, args.repeat
+            )
+            print(f"{depth:>10} {offset_ms:>12.2f} {cursor_ms:>12.2f}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,268 @@
+"""
+Benchmark: every public API endpoint at fixed concurrency through the ASGI app
+Seeds a throwaway database with seed_content.py (or reuses the one named by
+BENCH_DATABASE_URL), then drives each routes_public endpoint with
+--concurrency requests in flight through an in-process httpx client and
+reports throughput and p50/p95/p99 latency per endpoint. /api/contact and
+/api/resumes/* are left out (they send email / read files and blobs).
+Results are written as JSON; --compare prints the change against an earlier run.
+
+Run from backend/:  python benchmarks/bench_public.py --blogs 5000 --requests 500 --concurrency 16
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=300, help="measured requests per endpoint")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--no-cache", action="store_true", help="disable the response and detail caches")
+    parser.add_argument("--only", help="comma-separated endpoint names to run")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/public-<time>.json)")
+    parser.add_argument("--compare", help="earlier result file to compare against")
+    parser.add_argument("--seed", type=int, default=42)
+    for name, default in (("blogs", 2000), ("projects", 200), ("tools", 100), ("tags", 200), ("body_kb", 8)):
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=default, help="seed volume")
+    parser.add_argument("--related", action=argparse.BooleanOptionalAction, default=True,
+                        help="build the related-content lists when seeding")
+    return parser.parse_args()
+
+
+ARGS = parse_args()
+
+# The app reads its settings at import time
+DATABASE_URL = os.environ.get("BENCH_DATABASE_URL") or (
+    f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(prefix='bench_public_'), 'bench.db')}"
+)
+os.environ["DATABASE_URL"] = DATABASE_URL
+if ARGS.no_cache:
+    os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+    os.environ["DETAIL_CACHE_ENABLED"] = "false"
+for name in ("GEMINI_API_KEY", "ADMIN_PASSWORD_HASH", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+import httpx  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from counters import counter_buffer  # noqa: E402
+from database import AsyncSessionLocal, dispose_engines, engine  # noqa: E402
+from main import app  # noqa: E402
+from models import Blog, Category, Project, Service, Tag, Tool  # noqa: E402
+from seed_content import TOOL_CATEGORIES, TOPICS, seed_content  # noqa: E402
+
+# name -> (method, builder of the URL from the random source and the sampled slugs)
+Scenario = Tuple[str, Callable[[random.Random, Dict[str, List[str]]], str]]
+
+SCENARIOS: Dict[str, Scenario] = {
+    "blogs list": ("GET", lambda r, s: "/api/blogs"),
+    "blogs page (skip)": ("GET", lambda r, s: f"/api/blogs?skip={r.randint(0, 50) * 10}"),
+    "blogs page (cursor)": ("GET", lambda r, s: f"/api/blogs?cursor={r.choice(s['cursors'])}"),
+    "blogs featured": ("GET", lambda r, s: "/api/blogs?featured=true&limit=6"),
+    "blogs by category": ("GET", lambda r, s: f"/api/blogs?category={r.choice(s['categories'])}"),
+    "blogs by tag": ("GET", lambda r, s: f"/api/blogs?tag={r.choice(s['tags'])}"),
+    "blogs search": ("GET", lambda r, s: f"/api/blogs?search={r.choice(TOPICS)}"),
+    "blogs full projection": ("GET", lambda r, s: "/api/blogs?projection=full"),
+    "blog detail": ("GET", lambda r, s: f"/api/blogs/{r.choice(s['blogs'])}"),
+    "blog like": ("POST", lambda r, s: f"/api/blogs/{r.choice(s['blogs'])}/like"),
+    "blog related": ("GET", lambda r, s: f"/api/blogs/{r.choice(s['blogs'])}/related"),
+    "projects list": ("GET", lambda r, s: "/api/projects"),
+    "projects featured": ("GET", lambda r, s: "/api/projects?featured=true&limit=6"),
+    "project detail": ("GET", lambda r, s: f"/api/projects/{r.choice(s['projects'])}"),
+    "project related": ("GET", lambda r, s: f"/api/projects/{r.choice(s['projects'])}/related"),
+    "services list": ("GET", lambda r, s: "/api/services"),
+    "service detail": ("GET", lambda r, s: f"/api/services/{r.choice(s['services'])}"),
+    "tools list": ("GET", lambda r, s: "/api/tools"),
+    "tools by category": ("GET", lambda r, s: f"/api/tools?category={r.choice(TOOL_CATEGORIES)}"),
+    "tool detail": ("GET", lambda r, s: f"/api/tools/{r.choice(s['tools'])}"),
+    "tool click": ("POST", lambda r, s: f"/api/tools/{r.choice(s['tools'])}/click"),
+    "categories": ("GET", lambda r, s: "/api/categories"),
+    "tags": ("GET", lambda r, s: "/api/tags"),
+    "stats": ("GET", lambda r, s: "/api/stats"),
+    "home bundle": ("GET", lambda r, s: "/api/bundle/home"),
+}
+
+SAMPLE_SIZE = 1000
+
+
+async def sample_slugs(client: httpx.AsyncClient) -> Dict[str, List[str]]:
+    """Slugs the scenarios pick from, plus cursors for the first pages of /api/blogs"""
+    samples: Dict[str, List[str]] = {}
+    queries = {
+        "blogs": select(Blog.slug).where(Blog.published == True),
+        "projects": select(Project.slug).where(Project.published == True),
+        "services": select(Service.slug).where(Service.active == True),
+        "tools": select(Tool.slug).where(Tool.active == True),
+        "categories": select(Category.slug),
+        "tags": select(Tag.slug),
+    }
+    async with AsyncSessionLocal() as db:
+        for name, query in queries.items():
+            result = await db.execute(query.limit(SAMPLE_SIZE))
+            samples[name] = list(result.scalars().all())
+
+    cursors: List[str] = []
+    cursor: Optional[str] = None
+    for _ in range(20):
+        response = await client.get("/api/blogs", params={"cursor": cursor} if cursor else None)
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        cursors.append(cursor)
+    samples["cursors"] = cursors
+    return samples
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    method: str,
+    build_url: Callable[[random.Random, Dict[str, List[str]]], str],
+    samples: Dict[str, List[str]],
+    requests: int,
+    concurrency: int,
+    rng: random.Random
+) -> Dict[str, Any]:
+    """Send requests with concurrency in flight; latency and throughput summary"""
+    urls = [build_url(rng, samples) for _ in range(requests)]
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        while urls:
+            url = urls.pop()
+            start = time.perf_counter()
+            response = await client.request(method, url)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / wall, 1) if wall else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_comparison(previous: Dict[str, Any], current: Dict[str, Any]) -> None:
+    print(f"\nAgainst {previous.get('git_commit')} ({previous.get('started_at')}):")
+    print(f"{'endpoint':<24} {'p95 ms before -> after':>29} {'req/s before -> after':>29}")
+    for name, now in current["endpoints"].items():
+        before = previous.get("endpoints", {}).get(name)
+        if before is None:
+            continue
+        p95_change = (now["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100 if before["p95_ms"] else 0.0
+        rps_change = (
+            (now["throughput_rps"] - before["throughput_rps"]) / before["throughput_rps"] * 100
+            if before["throughput_rps"] else 0.0
+        )
+        print(
+            f"{name:<24} {before['p95_ms']:>12.2f} -> {now['p95_ms']:>7.2f} {p95_change:>+5.0f}%"
+            f" {before['throughput_rps']:>12.1f} -> {now['throughput_rps']:>7.1f} {rps_change:>+5.0f}%"
+        )
+
+
+async def main() -> None:
+    volumes = {
+        "blogs": ARGS.blogs, "projects": ARGS.projects, "tools": ARGS.tools,
+        "tags": ARGS.tags, "body_kb": ARGS.body_kb,
+    }
+    try:
+        seed_report = await seed_content(volumes, seed=ARGS.seed, related=ARGS.related)
+        print(f"Seeded in {seed_report['total_seconds']}s: {seed_report['volumes']}")
+    except RuntimeError:
+        seed_report = {"reused": DATABASE_URL.rsplit("@", 1)[-1]}
+        print("Reusing the content already in BENCH_DATABASE_URL")
+
+    names = [name.strip() for name in ARGS.only.split(",")] if ARGS.only else list(SCENARIOS)
+    rng = random.Random(ARGS.seed)
+    report: Dict[str, Any] = {
+        "benchmark": "public_api",
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "database": engine.dialect.name,
+        "concurrency": ARGS.concurrency,
+        "requests": ARGS.requests,
+        "cache": not ARGS.no_cache,
+        "seed": seed_report,
+        "endpoints": {},
+    }
+
+    counter_buffer.start()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        samples = await sample_slugs(client)
+        print(f"{'endpoint':<24} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+        for name in names:
+            method, build_url = SCENARIOS[name]
+            await run_scenario(client, method, build_url, samples, ARGS.warmup, ARGS.concurrency, rng)
+            result = await run_scenario(
+                client, method, build_url, samples, ARGS.requests, ARGS.concurrency, rng
+            )
+            report["endpoints"][name] = result
+            print(
+                f"{name:<24} {result['throughput_rps']:>9.1f} {result['p50_ms']:>9.2f} "
+                f"{result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f} {result['errors']:>7}"
+            )
+    await counter_buffer.stop()
+    await dispose_engines()
+
+    output = ARGS.output or os.path.join(
+        BENCH_DIR, "results", f"public-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if ARGS.compare:
+        with open(ARGS.compare, encoding="utf-8") as f:
+            print_comparison(json.load(f), report)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
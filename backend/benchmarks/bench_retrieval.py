@@ -0,0 +1,103 @@
+"""
+Benchmark: chat retrieval at --chunks chunks
+Builds synthetic blog items (seed_content's ContentFactory) chunked the way
+retrieval.py chunks CMS content, embeds them with the configured embedder and
+fills a VectorIndex. Reports embedding throughput, matrix memory, query
+latency (embedding the question plus top-k search) and the cost of
+re-indexing one edited item. No database or network is involved.
+
+Run from backend/:  python benchmarks/bench_retrieval.py --chunks 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, BENCH_DIR)
+for name in ("GEMINI_API_KEY", "ADMIN_PASSWORD_HASH", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+import numpy as np  # noqa: E402
+
+from config import settings  # noqa: E402
+from retrieval import VectorIndex, chunk_item, load_embedder  # noqa: E402
+from seed_content import ContentFactory  # noqa: E402
+
+QUESTIONS = (
+    "how do you cache fastapi responses",
+    "kubernetes autoscaling latency",
+    "do you build llm embeddings and vector search",
+    "postgres indexing and pagination performance",
+    "what security tools do you offer",
+    "react typescript design accessibility",
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunks", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--embedder", default=settings.RETRIEVAL_EMBEDDER)
+    parser.add_argument("--dim", type=int, default=settings.RETRIEVAL_DIM)
+    parser.add_argument("--batch", type=int, default=2000, help="chunks embedded per call")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    factory = ContentFactory(args.seed)
+    embedder = load_embedder(args.embedder, args.dim)
+    index = VectorIndex(args.dim)
+
+    # ~2 KB bodies give a handful of windows per item at the default chunk size
+    start = time.perf_counter()
+    chunks = []
+    item_id = 0
+    while len(chunks) < args.chunks:
+        item_id += 1
+        title = factory.title(item_id)
+        chunks.extend(chunk_item(("blogs", item_id), title, f"/blog/{item_id}", factory.body(2, title),
+                                 settings.RETRIEVAL_CHUNK_WORDS, settings.RETRIEVAL_CHUNK_OVERLAP))
+    chunks = chunks[:args.chunks]
+    generate_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for offset in range(0, len(chunks), args.batch):
+        batch = chunks[offset:offset + args.batch]
+        index.add(batch, embedder.embed([f"Blog: {chunk.title}\n{chunk.text}" for chunk in batch]))
+    build_seconds = time.perf_counter() - start
+
+    latencies = []
+    for i in range(args.queries):
+        start = time.perf_counter()
+        vector = embedder.embed([QUESTIONS[i % len(QUESTIONS)]])[0]
+        index.search(vector, settings.RETRIEVAL_TOP_K)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    # An admin edit: drop one item's rows and embed its new text
+    key = chunks[len(chunks) // 2].key
+    start = time.perf_counter()
+    index.remove(key)
+    title = factory.title(key[1])
+    edited = chunk_item(key, title, None, factory.body(2, title),
+                        settings.RETRIEVAL_CHUNK_WORDS, settings.RETRIEVAL_CHUNK_OVERLAP)
+    index.add(edited, embedder.embed([f"Blog: {chunk.title}\n{chunk.text}" for chunk in edited]))
+    update_ms = (time.perf_counter() - start) * 1000
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    print(f"{type(embedder).__name__} dim {args.dim}: {len(index)} chunks from {item_id} items "
+          f"(text generated in {generate_seconds:.1f}s)")
+    print(f"  build      {build_seconds:8.1f} s    {len(chunks) / build_seconds:10.0f} chunks/s")
+    print(f"  matrix     {index.matrix[:len(index)].nbytes / 2 ** 20:8.1f} MB   "
+          f"(allocated {index.matrix.nbytes / 2 ** 20:.1f} MB)")
+    print(f"  query      p50 {p50:6.2f} ms   p95 {p95:6.2f} ms   p99 {p99:6.2f} ms   ({args.queries} queries, "
+          f"top {settings.RETRIEVAL_TOP_K})")
+    print(f"  re-index one edited item ({len(edited)} chunks): {update_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark: FileResponse/StaticFiles frontend delivery vs the in-memory static_site layer
+Builds a throwaway static_dist with a Vite-like bundle and times the hashed JS
+bundle, the SPA fallback and a small public file through both paths, reporting
+mean latency and bytes on the wire per response.
+
+Run from backend/:  python benchmarks/bench_static.py --bundle-kb 600
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+for name in ("GEMINI_API_KEY", "ADMIN_PASSWORD_HASH", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, HTTPException, Request  # noqa: E402
+from fastapi.responses import FileResponse  # noqa: E402
+from fastapi.staticfiles import StaticFiles  # noqa: E402
+
+from static_site import StaticSite  # noqa: E402
+
+BUNDLE = "assets/index-D1Pec2V-.js"
+STYLES = "assets/index-Bq3xZ7kP.css"
+
+WORDS = ["const", "function", "return", "useState", "props", "className", "motion", "div",
+         "export", "default", "import", "from", "React", "await", "async", "=>", "null"]
+
+
+def build_dist(root: str, bundle_kb: int) -> None:
+    """Write index.html, a JS bundle, a stylesheet and robots.txt under root"""
+    random.seed(7)
+    os.makedirs(os.path.join(root, "assets"))
+
+    def text(kb: int) -> str:
+        parts, size = [], 0
+        while size < kb * 1024:
+            word = random.choice(WORDS)
+            parts.append(word)
+            size += len(word) + 1
+        return " ".join(parts)
+
+    files = {
+        "index.html": (
+            '<!doctype html><html><head><meta charset="UTF-8"><title>Devil Labs</title>'
+            f'<script type="module" src="/{BUNDLE}"></script><link rel="stylesheet" href="/{STYLES}">'
+            f'</head><body><div id="root"></div><!-- {text(2)} --></body></html>'
+        ),
+        BUNDLE: text(bundle_kb),
+        STYLES: text(max(bundle_kb // 8, 1)),
+        "robots.txt": "User-agent: *\nAllow: /\n",
+    }
+    for relative, content in files.items():
+        with open(os.path.join(root, relative), "w") as f:
+            f.write(content)
+
+
+def file_response_app(root: str) -> FastAPI:
+    """The previous main.py delivery: /assets mount plus exists/isfile + FileResponse per request"""
+    app = FastAPI()
+    app.mount("/assets", StaticFiles(directory=os.path.join(root, "assets")), name="assets")
+
+    @app.get("/{full_path:path}")
+    async def serve_frontend(full_path: str):
+        if full_path.startswith("api") or full_path.startswith("uploads"):
+            raise HTTPException(status_code=404, detail="Not found")
+        file_path = os.path.join(root, full_path)
+        if os.path.exists(file_path) and os.path.isfile(file_path):
+            return FileResponse(file_path)
+        return FileResponse(os.path.join(root, "index.html"))
+
+    return app
+
+
+def static_site_app(site: StaticSite) -> FastAPI:
+    """The new delivery: manifest lookup and in-memory pre-compressed bodies"""
+    app = FastAPI()
+
+    @app.get("/{full_path:path}")
+    async def serve_frontend(full_path: str, request: Request):
+        if full_path.startswith("api") or full_path.startswith("uploads"):
+            raise HTTPException(status_code=404, detail="Not found")
+        entry = site.lookup(full_path)
+        if entry is not None:
+            return site.response(request, entry)
+        if full_path.startswith("assets/"):
+            raise HTTPException(status_code=404, detail="Not found")
+        return site.response(request, site.index)
+
+    return app
+
+
+async def measure(app: FastAPI, path: str, headers: dict, repeat: int):
+    """(mean ms, bytes on the wire, Content-Encoding, Cache-Control) for GET path"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.get(path, headers=headers)  # warm-up
+        response.raise_for_status()
+        wire_bytes = len(response.content) if "content-encoding" not in response.headers else int(
+            response.headers["content-length"]
+        )
+        started = time.perf_counter()
+        for _ in range(repeat):
+            await client.get(path, headers=headers)
+        elapsed = (time.perf_counter() - started) * 1000 / repeat
+    return elapsed, wire_bytes, response.headers.get("content-encoding", "-"), response.headers.get("cache-control", "-")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bundle-kb", type=int, default=600)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    root = os.path.join(tempfile.mkdtemp(prefix="bench_static_"), "static_dist")
+    build_dist(root, args.bundle_kb)
+
+    site = StaticSite(root)
+    started = time.perf_counter()
+    report = site.load()
+    print(f"Manifest built in {(time.perf_counter() - started) * 1000:.0f} ms: {report}")
+
+    apps = {"FileResponse": file_response_app(root), "static_site": static_site_app(site)}
+    cases = [
+        ("bundle (br, gzip)", f"/{BUNDLE}", {"Accept-Encoding": "gzip, deflate, br"}),
+        ("bundle (gzip)", f"/{BUNDLE}", {"Accept-Encoding": "gzip"}),
+        ("SPA route", "/blog/some-post", {"Accept-Encoding": "gzip, deflate, br"}),
+        ("robots.txt", "/robots.txt", {}),
+    ]
+
+    print(f"{'case':<20} {'path':<14} {'mean ms':>9} {'wire bytes':>11} {'enc':>5}  cache-control")
+    for label, path, headers in cases:
+        for name, app in apps.items():
+            ms, wire_bytes, encoding, cache_control = await measure(app, path, headers, args.repeat)
+            print(f"{label:<20} {name:<14} {ms:>9.3f} {wire_bytes:>11} {encoding:>5}  {cache_control}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,314 @@
+"""
+Synthetic content generator for benchmarks and load tests
+Fills the configured database (DATABASE_URL) with realistic blogs, projects,
+services, tools, tags and categories: category and tag popularity follow a
+Zipf distribution, ~90% of items are published, publish dates spread over
+the five years before DATES_END and view counts are heavy-tailed. The same --seed always
+produces the same content. Derived tables (content versions, site stats,
+related lists) are built the way the app builds them on first start; the
+related rebuild takes ~12 s for 10k blogs, so skip it with --no-related for
+very large volumes.
+
+Run from backend/ against a throwaway database, e.g. 100k blogs with 5 tags and 50 KB bodies:
+    DATABASE_URL=sqlite+aiosqlite:///./bench.db python benchmarks/seed_content.py --blogs 100000 --tags-per-item 5 --body-kb 50 --no-related
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Sequence
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+for name in ("GEMINI_API_KEY", "ADMIN_PASSWORD_HASH", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+from sqlalchemy import func, insert, select  # noqa: E402
+
+from content_versions import ensure_content_versions  # noqa: E402
+from database import AsyncSessionLocal, engine, init_db  # noqa: E402
+from models import Blog, Category, Project, Service, Tag, Tool, blog_tags, project_tags  # noqa: E402
+from related import ensure_related_index  # noqa: E402
+from site_stats import reconcile_site_stats  # noqa: E402
+
+DEFAULT_VOLUMES: Dict[str, int] = {
+    "blogs": 2000,
+    "projects": 200,
+    "services": 12,
+    "tools": 100,
+    "categories": 12,
+    "tags": 200,
+    "tags_per_item": 5,
+    "body_kb": 8,
+}
+
+BATCH_SIZE = 1000
+
+# Publish dates count back from a fixed day so a seed always yields identical rows
+DATES_END = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+TOPICS = (
+    "python fastapi react typescript docker kubernetes postgres sqlite redis kafka rust golang "
+    "llm gemini embeddings vector search caching latency throughput observability prometheus "
+    "terraform azure aws serverless graphql websockets streaming testing security oauth "
+    "design accessibility animation performance compilers databases indexing pagination"
+).split()
+WORDS = (
+    "build ship scale measure profile refactor deploy index cache query stream render parse "
+    "the a an of to in for with on at by from into over under across between through "
+    "fast slow simple robust small large modern legacy async concurrent distributed local "
+    "service request response worker queue table column row page cursor token model prompt "
+    "team user client server browser network disk memory cpu budget metric trace error retry"
+).split()
+TITLE_TEMPLATES = (
+    "How we {verb} {topic} at scale",
+    "A practical guide to {topic} and {topic2}",
+    "{Verb} your {topic} pipeline in a weekend",
+    "Why {topic} beats {topic2} for small teams",
+    "Lessons from running {topic} in production",
+    "{Topic} internals: what happens on every request",
+)
+TOOL_CATEGORIES = ("AI", "DevOps", "Design", "Productivity", "Data", "Security")
+PROJECT_STATUSES = ("completed", "completed", "completed", "in-progress", "planned")
+
+
+def zipf_weights(count: int, exponent: float = 1.1) -> List[float]:
+    """Popularity weights where the n-th item is ~n^-exponent as popular as the first"""
+    return [1 / (rank ** exponent) for rank in range(1, count + 1)]
+
+
+class ContentFactory:
+    """Deterministic text and row builders (one random.Random per run)"""
+
+    def __init__(self, seed: int):
+        self.random = random.Random(seed)
+        # Bodies are stitched from a fixed paragraph pool, so 50 KB bodies stay cheap to generate
+        self.paragraphs = [self.paragraph() for _ in range(400)]
+
+    def sentence(self, words: int = 0) -> str:
+        words = words or self.random.randint(8, 20)
+        text = " ".join(self.random.choice(WORDS if i % 4 else TOPICS) for i in range(words))
+        return text[0].upper() + text[1:] + "."
+
+    def paragraph(self) -> str:
+        return " ".join(self.sentence() for _ in range(self.random.randint(3, 7)))
+
+    def body(self, kb: int, title: str) -> str:
+        # The title sentence keeps every body unique for full-text search
+        parts = [f"{title}.", self.sentence()]
+        size = sum(len(part) for part in parts)
+        while size < kb * 1024:
+            paragraph = self.random.choice(self.paragraphs)
+            parts.append(paragraph)
+            size += len(paragraph) + 2
+        return "\n\n".join(parts)
+
+    def title(self, number: int) -> str:
+        topic, topic2 = self.random.sample(TOPICS, 2)
+        verb = self.random.choice(("build", "profile", "cache", "index", "scale", "ship"))
+        text = self.random.choice(TITLE_TEMPLATES).format(
+            verb=verb, Verb=verb.capitalize(), topic=topic, topic2=topic2, Topic=topic.capitalize()
+        )
+        return f"{text} ({number})"
+
+    def published_at(self) -> datetime:
+        return DATES_END - timedelta(seconds=self.random.randint(0, 5 * 365 * 24 * 3600))
+
+    def views(self) -> int:
+        return int(self.random.paretovariate(1.2) * 20)
+
+
+async def _insert_batches(table: Any, rows: Sequence[Dict[str, Any]], batch_size: int) -> List[int]:
+    """Insert rows in batches and return the new ids in row order"""
+    ids: List[int] = []
+    async with engine.begin() as conn:
+        for start in range(0, len(rows), batch_size):
+            result = await conn.execute(
+                insert(table).returning(table.c.id, sort_by_parameter_order=True),
+                rows[start:start + batch_size]
+            )
+            ids.extend(result.scalars().all())
+    return ids
+
+
+async def _insert_links(association: Any, rows: List[Dict[str, int]], batch_size: int) -> None:
+    async with engine.begin() as conn:
+        for start in range(0, len(rows), batch_size):
+            await conn.execute(insert(association), rows[start:start + batch_size])
+
+
+def _tag_links(factory: ContentFactory, owner: str, owner_ids: List[int], tag_ids: List[int],
+               per_item: int, weights: List[float]) -> List[Dict[str, int]]:
+    links = []
+    per_item = min(per_item, len(tag_ids))
+    for owner_id in owner_ids:
+        chosen = set()
+        while len(chosen) < per_item:
+            chosen.add(factory.random.choices(tag_ids, weights)[0])
+        links.extend({owner: owner_id, "tag_id": tag_id} for tag_id in chosen)
+    return links
+
+
+async def seed_content(
+    volumes: Dict[str, int],
+    seed: int = 42,
+    related: bool = True,
+    batch_size: int = BATCH_SIZE
+) -> Dict[str, Any]:
+    """Generate and insert content into an empty database; returns counts and timings"""
+    volumes = {**DEFAULT_VOLUMES, **volumes}
+    await init_db()
+
+    async with AsyncSessionLocal() as db:
+        existing = await db.execute(
+            select(func.count(Blog.id)).union_all(select(func.count(Project.id)), select(func.count(Category.id)))
+        )
+        if any(existing.scalars().all()):
+            raise RuntimeError("Target database already has content; seed an empty one")
+
+    factory = ContentFactory(seed)
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
+
+    category_names = [topic.capitalize() for topic in TOPICS][:volumes["categories"]]
+    category_names += [f"Category {n}" for n in range(len(category_names), volumes["categories"])]
+    category_ids = await _insert_batches(Category.__table__, [
+        {"name": name, "slug": name.lower().replace(" ", "-"), "description": factory.sentence()}
+        for name in category_names
+    ], batch_size)
+    category_weights = zipf_weights(len(category_ids))
+
+    tag_names: List[str] = list(TOPICS)
+    while len(tag_names) < volumes["tags"]:
+        tag_names.append(f"{factory.random.choice(TOPICS)}-{factory.random.choice(TOPICS)}-{len(tag_names)}")
+    tag_ids = await _insert_batches(Tag.__table__, [
+        {"name": name, "slug": name} for name in tag_names[:volumes["tags"]]
+    ], batch_size)
+    tag_weights = zipf_weights(len(tag_ids))
+
+    def category() -> Any:
+        return factory.random.choices(category_ids, category_weights)[0] if category_ids else None
+
+    # Blogs are generated and inserted one batch at a time so 50 KB bodies do not pile up in memory
+    blog_ids: List[int] = []
+    for start in range(0, volumes["blogs"], batch_size):
+        rows = []
+        for number in range(start, min(start + batch_size, volumes["blogs"])):
+            title = factory.title(number)
+            content = factory.body(volumes["body_kb"], title)
+            published = factory.random.random() < 0.9
+            rows.append({
+                "title": title,
+                "slug": f"blog-{number}",
+                "excerpt": factory.sentence(24),
+                "content": content,
+                "author": "Vicky Kumar",
+                "read_time": max(1, len(content.split()) // 200),
+                "views": factory.views(),
+                "likes": factory.random.randint(0, 50),
+                "meta_title": title[:200],
+                "meta_description": factory.sentence(20)[:300],
+                "published": published,
+                "featured": published and factory.random.random() < 0.03,
+                "published_at": factory.published_at() if published else None,
+                "category_id": category(),
+                "featured_image": f"https://cdn.example.com/blogs/{number}.jpg",
+                "thumbnail_image": f"https://cdn.example.com/blogs/thumbnails/{number}.jpg",
+            })
+        blog_ids += await _insert_batches(Blog.__table__, rows, batch_size)
+    await _insert_links(blog_tags, _tag_links(
+        factory, "blog_id", blog_ids, tag_ids, volumes["tags_per_item"], tag_weights
+    ), batch_size * 5)
+    timings["blogs_seconds"] = round(time.perf_counter() - started, 2)
+
+    project_rows = []
+    for number in range(volumes["projects"]):
+        title = factory.title(number)
+        published = factory.random.random() < 0.9
+        project_rows.append({
+            "title": title,
+            "slug": f"project-{number}",
+            "description": factory.sentence(30),
+            "long_description": factory.body(max(1, volumes["body_kb"] // 4), title),
+            "tech_stack": json.dumps(factory.random.sample(TOPICS, 4)),
+            "github_url": f"https://github.com/example/project-{number}",
+            "stars": factory.views(),
+            "forks": factory.random.randint(0, 200),
+            "views": factory.views(),
+            "published": published,
+            "featured": published and factory.random.random() < 0.1,
+            "status": factory.random.choice(PROJECT_STATUSES),
+            "published_at": factory.published_at() if published else None,
+            "category_id": category(),
+        })
+    project_ids = await _insert_batches(Project.__table__, project_rows, batch_size)
+    await _insert_links(project_tags, _tag_links(
+        factory, "project_id", project_ids, tag_ids, volumes["tags_per_item"], tag_weights
+    ), batch_size * 5)
+
+    await _insert_batches(Service.__table__, [
+        {
+            "title": f"{factory.random.choice(TOPICS).capitalize()} consulting {number}",
+            "slug": f"service-{number}",
+            "description": factory.sentence(25),
+            "long_description": factory.paragraph(),
+            "price": float(factory.random.choice((500, 1500, 5000))),
+            "pricing_model": factory.random.choice(("fixed", "hourly", "monthly")),
+            "features": json.dumps([factory.sentence(5) for _ in range(4)]),
+            "active": factory.random.random() < 0.9,
+            "featured": factory.random.random() < 0.3,
+            "order": number,
+        }
+        for number in range(volumes["services"])
+    ], batch_size)
+
+    await _insert_batches(Tool.__table__, [
+        {
+            "name": f"{factory.random.choice(TOPICS).capitalize()} kit {number}",
+            "slug": f"tool-{number}",
+            "description": factory.sentence(25),
+            "category": factory.random.choices(TOOL_CATEGORIES, zipf_weights(len(TOOL_CATEGORIES)))[0],
+            "website_url": f"https://tools.example.com/{number}",
+            "pricing": factory.random.choice(("free", "freemium", "paid")),
+            "views": factory.views(),
+            "clicks": factory.views() // 4,
+            "rating": round(factory.random.uniform(3, 5), 1),
+            "active": factory.random.random() < 0.95,
+            "featured": factory.random.random() < 0.1,
+            "order": factory.random.randint(0, 10),
+        }
+        for number in range(volumes["tools"])
+    ], batch_size)
+    timings["content_seconds"] = round(time.perf_counter() - started, 2)
+
+    async with AsyncSessionLocal() as db:
+        await ensure_content_versions(db)
+        await reconcile_site_stats(db)
+        if related:
+            await ensure_related_index(db)
+    timings["total_seconds"] = round(time.perf_counter() - started, 2)
+
+    return {"volumes": volumes, "seed": seed, "related": related, **timings}
+
+
+async def _main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    for name, default in DEFAULT_VOLUMES.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=default)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--related", action=argparse.BooleanOptionalAction, default=True,
+                        help="build the related-content lists (slow for very large volumes)")
+    args = parser.parse_args()
+
+    volumes = {name: getattr(args, name) for name in DEFAULT_VOLUMES}
+    report = await seed_content(volumes, seed=args.seed, related=args.related)
+    await engine.dispose()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
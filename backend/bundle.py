@@ -0,0 +1,112 @@
+"""
+Composite homepage payload behind /api/bundle/home
+Each section is one query on the request's session, so the homepage needs a
+single round trip instead of one request (and one session) per widget
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from models import Blog, Project, Service, Tool
+from pagination import keyset_order
+from projections import blog_projection, project_projection
+from schemas import ServiceResponse, ToolResponse
+from serializers import serializer_for
+from site_stats import read_site_stats
+
+SectionLoader = Callable[[AsyncSession, int], Awaitable[Any]]
+
+
+async def _featured_blogs(db: AsyncSession, limit: int) -> List[Dict[str, Any]]:
+    load_columns, serialize = blog_projection.resolve("summary", None)
+    result = await db.execute(
+        select(Blog)
+        .options(load_columns)
+        .where(Blog.published == True, Blog.featured == True)
+        .order_by(*keyset_order(Blog))
+        .limit(limit)
+    )
+    return [serialize(blog) for blog in result.scalars().all()]
+
+
+async def _featured_projects(db: AsyncSession, limit: int) -> List[Dict[str, Any]]:
+    load_columns, serialize = project_projection.resolve("summary", None)
+    result = await db.execute(
+        select(Project)
+        .options(load_columns)
+        .where(Project.published == True, Project.featured == True)
+        .order_by(*keyset_order(Project))
+        .limit(limit)
+    )
+    return [serialize(project) for project in result.scalars().all()]
+
+
+async def _services(db: AsyncSession, limit: int) -> List[Dict[str, Any]]:
+    serializer = serializer_for(ServiceResponse)
+    result = await db.execute(
+        select(*serializer.columns(Service))
+        .where(Service.active == True)
+        .order_by(Service.order.asc(), Service.created_at.desc())
+    )
+    return serializer.many(result.all())
+
+
+async def _tools(db: AsyncSession, limit: int) -> List[Dict[str, Any]]:
+    serializer = serializer_for(ToolResponse)
+    result = await db.execute(
+        select(*serializer.columns(Tool))
+        .where(Tool.active == True)
+        .order_by(Tool.order.asc(), Tool.created_at.desc())
+    )
+    return serializer.many(result.all())
+
+
+async def _stats(db: AsyncSession, limit: int) -> Dict[str, int]:
+    return await read_site_stats(db)
+
+
+# section name -> (entity types its content depends on, loader)
+HOME_SECTIONS: Dict[str, Tuple[Tuple[str, ...], SectionLoader]] = {
+    "featured_blogs": (("blogs", "categories", "tags"), _featured_blogs),
+    "featured_projects": (("projects", "categories", "tags"), _featured_projects),
+    "services": (("services",), _services),
+    "tools": (("tools",), _tools),
+    "stats": (("blogs", "projects", "services", "tools"), _stats),
+}
+
+
+def parse_sections(sections: Optional[str]) -> List[str]:
+    """Validate a comma-separated sections= value (HOME_BUNDLE_SECTIONS when omitted)"""
+    requested = [
+        name.strip()
+        for name in (sections or settings.HOME_BUNDLE_SECTIONS).split(",")
+        if name.strip()
+    ]
+    unknown = sorted(set(requested) - set(HOME_SECTIONS))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown sections: {', '.join(unknown)}")
+    if not requested:
+        raise HTTPException(status_code=400, detail="No sections requested")
+
+    # Canonical order so equivalent requests share a cache entry and ETag
+    return [name for name in HOME_SECTIONS if name in requested]
+
+
+def section_entities(sections: List[str]) -> List[str]:
+    """Union of the entity types the given sections are built from"""
+    entities: Dict[str, None] = {}
+    for name in sections:
+        entities.update(dict.fromkeys(HOME_SECTIONS[name][0]))
+    return list(entities)
+
+
+async def build_bundle(db: AsyncSession, sections: List[str], limit: int) -> Dict[str, Any]:
+    """Run every requested section on one session and return {section: payload}"""
+    bundle = {}
+    for name in sections:
+        _, loader = HOME_SECTIONS[name]
+        bundle[name] = await loader(db, limit)
+    return bundle
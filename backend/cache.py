@@ -0,0 +1,265 @@
+"""
+In-process response cache and conditional GET support for the public read API
+Stores pre-serialized JSON bytes keyed on route + normalized query params.
+Entries and ETags are tied to the content versions of the entity types they
+were built from, so an admin write makes them stale in every worker at once.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlencode
+
+from fastapi import Request
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from content_versions import get_content_state
+from serializers import dumps
+
+Versions = Tuple[Tuple[str, int], ...]
+
+
+class CachedBody:
+    """Pre-serialized JSON body plus the extra headers it must be served with"""
+    __slots__ = ("body", "headers")
+
+    def __init__(self, body: bytes, headers: Optional[Dict[str, str]] = None):
+        self.body = body
+        self.headers = headers or {}
+
+
+class _Entry:
+    """A cached body plus the entity versions it was built from"""
+    __slots__ = ("cached", "expires_at", "versions")
+
+    def __init__(self, cached: CachedBody, expires_at: float, versions: Versions):
+        self.cached = cached
+        self.expires_at = expires_at
+        self.versions = versions
+
+
+class ResponseCache:
+    """LRU + TTL cache of serialized JSON bodies with a memory cap"""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl_seconds: float = 60,
+        enabled: bool = True
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale = 0
+
+    @staticmethod
+    def make_key(route: str, **params: Any) -> str:
+        """Build a cache key from a route name and its query params (None values dropped)"""
+        normalized = sorted(
+            (name, str(value).lower() if isinstance(value, bool) else str(value))
+            for name, value in params.items()
+            if value is not None
+        )
+        return f"{route}?{urlencode(normalized)}"
+
+    def get(self, key: str, versions: Versions) -> Optional[CachedBody]:
+        """Return the cached body for key, or None on miss, expiry or version mismatch"""
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at < time.monotonic() or entry.versions != versions:
+            self._remove(key)
+            self.misses += 1
+            self.stale += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.cached
+
+    def set(
+        self,
+        key: str,
+        versions: Versions,
+        payload: Any,
+        headers: Optional[Dict[str, str]] = None
+    ) -> CachedBody:
+        """Serialize payload once, cache it under key and return the cached body"""
+        cached = CachedBody(serialize_json(payload), headers)
+        body = cached.body
+        if not self.enabled or len(body) > self.max_bytes:
+            return cached
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = _Entry(cached, time.monotonic() + self.ttl_seconds, versions)
+        self._size += len(body)
+
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+        return cached
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        self._entries.clear()
+        self._size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current memory usage"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "stale": self.stale,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= len(entry.cached.body)
+
+
+class CachedView:
+    """Conditional GET (ETag / Last-Modified) and response caching for one public read
+
+    The ETag is derived from the route key and the content versions only, so a
+    304 can be answered before the main query runs. View/like counters are not
+    part of the content version and may lag in cached or revalidated copies.
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        key: str,
+        versions: Versions,
+        last_modified: Optional[datetime]
+    ):
+        self.request = request
+        self.key = key
+        self.versions = versions
+        self.last_modified = last_modified
+
+        digest = hashlib.sha1(f"{key}|{versions}".encode()).hexdigest()
+        self.etag = f'"{digest}"'
+        self.headers = {
+            "ETag": self.etag,
+            "Cache-Control": f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, must-revalidate",
+        }
+        if last_modified is not None:
+            self.headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+
+    def is_not_modified(self) -> bool:
+        """Evaluate If-None-Match (preferred) or If-Modified-Since against this view"""
+        if_none_match = self.request.headers.get("if-none-match")
+        if if_none_match is not None:
+            candidates = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in candidates or any(
+                tag.removeprefix("W/") == self.etag for tag in candidates
+            )
+
+        if_modified_since = self.request.headers.get("if-modified-since")
+        if if_modified_since and self.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            return _as_utc(self.last_modified).replace(microsecond=0) <= _as_utc(since)
+
+        return False
+
+    def not_modified(self) -> Optional[Response]:
+        """A 304 response when the client copy is current, else None"""
+        if self.is_not_modified():
+            return Response(status_code=304, headers=self.headers)
+        return None
+
+    def lookup(self) -> Optional[Response]:
+        """A 304 or a cached 200 response, or None when the main query has to run"""
+        not_modified = self.not_modified()
+        if not_modified is not None:
+            return not_modified
+
+        cached = response_cache.get(self.key, self.versions)
+        if cached is not None:
+            return json_response(cached, hit=True, headers=self.headers)
+        return None
+
+    def respond(self, payload: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+        """Serialize payload, cache it for this view and return it"""
+        cached = response_cache.set(self.key, self.versions, payload, headers)
+        return json_response(cached, hit=False, headers=self.headers)
+
+
+async def open_view(
+    request: Request,
+    db: AsyncSession,
+    entities: Iterable[str],
+    route: str,
+    **params: Any
+) -> CachedView:
+    """Read the content versions of entities and build the view for route + params"""
+    state = await get_content_state(db, entities)
+    return CachedView(
+        request, response_cache.make_key(route, **params), state.versions, state.last_modified
+    )
+
+
+def serialize_json(payload: Any) -> bytes:
+    """Encode payload as compact JSON, with datetimes formatted like the response schemas"""
+    return dumps(payload)
+
+
+def json_response(
+    cached: CachedBody,
+    hit: bool,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Wrap a pre-serialized body in a response tagged with the cache outcome"""
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers={**(headers or {}), **cached.headers, "X-Cache": "HIT" if hit else "MISS"}
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes that were stored as UTC
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+# Global instance
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    enabled=settings.RESPONSE_CACHE_ENABLED
+)
@@ -0,0 +1,155 @@
+"""
+Answer cache for the chatbot
+Most chat traffic is the same few questions with no history, so finished
+answers (with their suggestions and actions) are kept in an LRU + TTL cache
+keyed on the normalized message and a fingerprint of the history sent to the
+model. Entries carry the system prompt fingerprint and the CMS content
+versions they were generated under; a prompt change or an admin write makes
+them stale in every worker.
+"""
+import hashlib
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import settings
+from content_versions import ENTITY_TYPES, get_content_state
+from database import ReadSessionLocal
+
+Versions = Tuple[Tuple[str, Any], ...]
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_message(text: str) -> str:
+    """Case-, punctuation- and whitespace-insensitive form of a message"""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", text)).strip()
+
+
+def history_fingerprint(history: List[Dict[str, Any]]) -> str:
+    """Stable digest of the (already trimmed) history sent to the model; "" when empty"""
+    if not history:
+        return ""
+    digest = hashlib.sha1()
+    for turn in history:
+        digest.update(turn["role"].encode())
+        for part in turn["parts"]:
+            digest.update(b"\x1f" + normalize_message(str(part)).encode())
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=8)
+def prompt_fingerprint(system_prompt: str) -> str:
+    return hashlib.sha1(system_prompt.encode()).hexdigest()[:16]
+
+
+class _Entry:
+    """A cached answer plus the versions it was generated under"""
+    __slots__ = ("answer", "expires_at", "versions", "upstream_seconds")
+
+    def __init__(self, answer: Any, expires_at: float, versions: Versions, upstream_seconds: float):
+        self.answer = answer
+        self.expires_at = expires_at
+        self.versions = versions
+        self.upstream_seconds = upstream_seconds
+
+
+class AnswerCache:
+    """LRU + TTL cache of chat answers"""
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 3600, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale = 0
+        self.upstream_seconds_saved = 0.0
+
+    @staticmethod
+    def make_key(message: str, history: List[Dict[str, Any]]) -> str:
+        return f"{normalize_message(message)}|{history_fingerprint(history)}"
+
+    async def versions(self, system_prompt: str) -> Optional[Versions]:
+        """System prompt fingerprint plus the current CMS content versions (None: cannot cache now)"""
+        if not self.enabled:
+            return None
+        try:
+            async with ReadSessionLocal() as db:
+                state = await get_content_state(db, ENTITY_TYPES)
+        except Exception as e:
+            # Chat keeps working without the database, just uncached
+            print(f"⚠️  Chat cache bypassed, content versions unavailable: {e}")
+            return None
+        return (("prompt", prompt_fingerprint(system_prompt)),) + state.versions
+
+    def get(self, key: str, versions: Optional[Versions]) -> Optional[Any]:
+        """The cached answer for key, or None on miss, expiry or version mismatch"""
+        if not self.enabled or versions is None:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at < time.monotonic() or entry.versions != versions:
+            del self._entries[key]
+            self.misses += 1
+            self.stale += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        self.upstream_seconds_saved += entry.upstream_seconds
+        return entry.answer
+
+    def set(self, key: str, versions: Optional[Versions], answer: Any, upstream_seconds: float) -> None:
+        """Cache answer (generated in upstream_seconds) under key"""
+        if not self.enabled or versions is None:
+            return
+
+        self._entries.pop(key, None)
+        self._entries[key] = _Entry(answer, time.monotonic() + self.ttl_seconds, versions, upstream_seconds)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached answer"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the model calls (and time) hits have saved"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "upstream_calls_saved": self.hits,
+            "upstream_seconds_saved": round(self.upstream_seconds_saved, 3),
+            "evictions": self.evictions,
+            "stale": self.stale,
+        }
+
+
+# Global instance
+answer_cache = AnswerCache(
+    max_entries=settings.CHAT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.CHAT_CACHE_TTL_SECONDS,
+    enabled=settings.CHAT_CACHE_ENABLED
+)
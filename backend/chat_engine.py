@@ -0,0 +1,137 @@
+"""
+Admission control for the chat endpoints
+At most CHAT_MAX_CONCURRENT model calls run per worker and each client may
+hold CHAT_MAX_PER_CLIENT of them. Other requests wait in a queue of at most
+CHAT_MAX_QUEUED for up to CHAT_QUEUE_TIMEOUT_SECONDS. Requests that cannot
+get a slot are refused with Retry-After: 429 when the client is over its own
+limit, 503 when the worker is saturated.
+"""
+import asyncio
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import HTTPException
+
+from config import settings
+from metrics import CHAT_QUEUE_SECONDS, CHAT_SHED
+
+BUSY_DETAIL = "The assistant is busy right now. Please try again shortly."
+
+
+class ChatSlot:
+    """A held chat slot; release() is idempotent"""
+    __slots__ = ("engine", "client", "released")
+
+    def __init__(self, engine: "ChatEngine", client: str):
+        self.engine = engine
+        self.client = client
+        self.released = False
+
+    def release(self) -> None:
+        if not self.released:
+            self.released = True
+            self.engine._release(self.client)
+
+
+class ChatEngine:
+    """Bounds in-flight chats globally and per client, with a timed queue"""
+
+    def __init__(self, max_concurrent: int, max_per_client: int, max_queued: int,
+                 queue_timeout: float, retry_after: int):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_per_client = max(1, max_per_client)
+        self.max_queued = max(0, max_queued)
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+        self._per_client: Dict[str, int] = defaultdict(int)  # running + queued
+        self.running = 0
+        self.queued = 0
+        self.completed = 0
+        self.shed: Dict[str, int] = defaultdict(int)
+
+    def _refuse(self, reason: str, status_code: int, detail: str) -> HTTPException:
+        self.shed[reason] += 1
+        CHAT_SHED.labels(reason).inc()
+        return HTTPException(
+            status_code=status_code, detail=detail,
+            headers={"Retry-After": str(self.retry_after)}
+        )
+
+    async def acquire(self, client: str) -> ChatSlot:
+        """Wait for a slot (HTTPException 429/503 if none can be had)"""
+        if self._per_client.get(client, 0) >= self.max_per_client:
+            raise self._refuse(
+                "client_limit", 429, "Too many chats in progress. Please wait for the current reply."
+            )
+        if not self._slots.locked():
+            # A free slot is taken without suspending, so checks and acquisition cannot interleave
+            await self._slots.acquire()
+            CHAT_QUEUE_SECONDS.observe(0)
+        else:
+            if self.queued >= self.max_queued:
+                raise self._refuse("queue_full", 503, BUSY_DETAIL)
+            await self._wait_for_slot(client)
+
+        self._per_client[client] += 1
+        self.running += 1
+        return ChatSlot(self, client)
+
+    async def _wait_for_slot(self, client: str) -> None:
+        # Queued chats count against the client's limit too
+        self._per_client[client] += 1
+        self.queued += 1
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise self._refuse("queue_timeout", 503, BUSY_DETAIL)
+        finally:
+            self.queued -= 1
+            self._drop_client(client)
+            CHAT_QUEUE_SECONDS.observe(time.perf_counter() - start)
+
+    def _drop_client(self, client: str) -> None:
+        self._per_client[client] -= 1
+        if self._per_client[client] <= 0:
+            del self._per_client[client]
+
+    def _release(self, client: str) -> None:
+        self._drop_client(client)
+        self.running -= 1
+        self.completed += 1
+        self._slots.release()
+
+    @asynccontextmanager
+    async def slot(self, client: str) -> AsyncIterator[ChatSlot]:
+        """Hold a slot for the enclosed block"""
+        slot = await self.acquire(client)
+        try:
+            yield slot
+        finally:
+            slot.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_per_client": self.max_per_client,
+            "max_queued": self.max_queued,
+            "queue_timeout_seconds": self.queue_timeout,
+            "running": self.running,
+            "queued": self.queued,
+            "clients": len(self._per_client),
+            "completed": self.completed,
+            "shed": dict(self.shed),
+        }
+
+
+# Global instance
+chat_engine = ChatEngine(
+    settings.CHAT_MAX_CONCURRENT,
+    settings.CHAT_MAX_PER_CLIENT,
+    settings.CHAT_MAX_QUEUED,
+    settings.CHAT_QUEUE_TIMEOUT_SECONDS,
+    settings.CHAT_RETRY_AFTER_SECONDS,
+)
@@ -0,0 +1,95 @@
+"""
+Chat model backends for /api/chat and /api/chat/stream
+GeminiChatModel talks to Gemini through one shared GenerativeModel and the
+SDK's async API, so a reply never blocks the event loop. FakeChatModel
+(CHAT_MODEL_BACKEND=fake) answers locally with a canned reply, one word every
+CHAT_FAKE_TOKEN_DELAY_MS, so load tests and benchmarks run without an API key.
+Both expose reply() for a whole answer and stream() for text deltas; closing
+a stream early (client disconnect) stops the upstream generation.
+"""
+import asyncio
+from typing import Any, AsyncIterator, Dict, List
+
+import google.generativeai as genai
+
+from config import settings
+
+GEMINI_MODEL_NAME = "models/gemini-2.0-flash"
+
+History = List[Dict[str, Any]]
+
+
+class GeminiChatModel:
+    """Gemini chat over the async SDK"""
+
+    def __init__(self, system_prompt: str, model_name: str = GEMINI_MODEL_NAME):
+        self.system_prompt = system_prompt
+        self.model_name = model_name
+        self.model = genai.GenerativeModel(model_name=model_name, system_instruction=system_prompt)
+
+    def _session(self, history: History) -> Any:
+        # Sessions are cheap: they only hold the history around the shared model
+        return self.model.start_chat(history=history)
+
+    async def reply(self, history: History, message: str) -> str:
+        response = await self._session(history).send_message_async(message)
+        return response.text
+
+    async def stream(self, history: History, message: str) -> AsyncIterator[str]:
+        chunks: "asyncio.Queue[Any]" = asyncio.Queue()
+
+        async def pump() -> None:
+            try:
+                response = await self._session(history).send_message_async(message, stream=True)
+                async for chunk in response:
+                    if chunk.text:
+                        chunks.put_nowait(chunk.text)
+                chunks.put_nowait(None)
+            except Exception as e:
+                chunks.put_nowait(e)
+
+        # The SDK stream is read in its own task: cancelling that task cancels the gRPC
+        # call it is waiting on (grpc.aio cancels an RPC whose read is cancelled), so an
+        # abandoned answer stops generating now rather than at garbage collection
+        reader = asyncio.create_task(pump())
+        try:
+            while (item := await chunks.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            reader.cancel()
+            await asyncio.wait((reader,))
+
+
+class FakeChatModel:
+    """Local stand-in that streams a canned answer with an artificial per-token delay"""
+
+    def __init__(self, token_delay_ms: float, tokens: int = 60):
+        self.token_delay = token_delay_ms / 1000
+        self.tokens = tokens
+
+    def _words(self, message: str) -> List[str]:
+        intro = f"Boss, here's the tech intel on \"{message[:80]}\" ⚡".split()
+        filler = "Devil Labs builds AI tools, security scanners and dashboards with clean engineering".split()
+        words = intro + [filler[i % len(filler)] for i in range(max(0, self.tokens - len(intro)))]
+        return words
+
+    async def reply(self, history: History, message: str) -> str:
+        words = self._words(message)
+        await asyncio.sleep(self.token_delay * len(words))
+        return " ".join(words)
+
+    async def stream(self, history: History, message: str) -> AsyncIterator[str]:
+        for i, word in enumerate(self._words(message)):
+            await asyncio.sleep(self.token_delay)
+            yield word if i == 0 else " " + word
+
+
+def create_chat_model(system_prompt: str) -> Any:
+    """The chat backend selected by CHAT_MODEL_BACKEND"""
+    if settings.CHAT_MODEL_BACKEND == "fake":
+        return FakeChatModel(settings.CHAT_FAKE_TOKEN_DELAY_MS)
+    if settings.CHAT_MODEL_BACKEND != "gemini":
+        raise ValueError(f"Unknown CHAT_MODEL_BACKEND: {settings.CHAT_MODEL_BACKEND}")
+    return GeminiChatModel(system_prompt)
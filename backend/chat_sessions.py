@@ -0,0 +1,239 @@
+"""
+Server-side chatbot conversations
+Clients send only the new message plus the session_id returned with the
+previous answer; the conversation lives in the chat_sessions table so every
+worker sees it. Session ids are always issued by the server (an unknown or
+expired id gets a fresh one), and conversations keyed by user_id are only
+kept for authenticated callers. Recent turns are kept within
+CHAT_HISTORY_TOKEN_BUDGET; older exchanges are folded into a running summary
+capped at CHAT_SUMMARY_TOKEN_BUDGET, so the prompt stays bounded however long
+the chat runs. Sessions expire CHAT_SESSION_TTL_SECONDS after their last turn
+and at most CHAT_SESSION_MAX_SESSIONS are kept; an anonymous session that has
+not continued past its first exchange expires after the much shorter
+CHAT_SESSION_FIRST_TURN_TTL_SECONDS, so one-shot traffic does not pile up.
+"""
+import hashlib
+import hmac
+import json
+import re
+import secrets
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select
+
+from config import settings
+from database import AsyncSessionLocal
+from models import ChatSession
+
+History = List[Dict[str, Any]]
+Turn = Tuple[str, str]  # (role, text) with Gemini roles: "user" / "model"
+
+# Prefix of user-derived keys; ":" is outside the session_id pattern, so these rows
+# can never be opened by passing their key as a session_id
+USER_KEY_PREFIX = "u:"
+
+SUMMARY_HEADER = "Summary of our earlier conversation:"
+SUMMARY_ACK = "Got it, I'll keep that in mind."
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) without a tokenizer round trip"""
+    return max(1, (len(text) + 3) // 4)
+
+
+def _clip(text: str, limit: int) -> str:
+    """First sentence of text, at most limit characters"""
+    text = _SENTENCE_END.split(" ".join(text.split()), 1)[0]
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + "…"
+
+
+def trim_history(turns: List[Turn], budget: int) -> Tuple[List[Turn], List[Turn]]:
+    """Split turns into (folded, kept): the newest whole exchanges that fit budget are kept
+
+    The latest exchange is always kept, and the kept part starts with a user turn.
+    """
+    kept = len(turns)
+    used = 0
+    for index in range(len(turns) - 1, -1, -1):
+        used += estimate_tokens(turns[index][1])
+        if used > budget and len(turns) - index > 2:
+            break
+        if turns[index][0] == "user":
+            kept = index
+    return turns[:kept], turns[kept:]
+
+
+class Conversation:
+    """One session's summary and recent turns, as loaded for a request"""
+    __slots__ = ("id", "summary", "turns", "persisted")
+
+    def __init__(self, key: str, summary: str = "", turns: Optional[List[Turn]] = None,
+                 persisted: bool = False):
+        self.id = key
+        self.summary = summary
+        self.turns = turns or []
+        self.persisted = persisted
+
+    @property
+    def session_id(self) -> Optional[str]:
+        """The id to hand back to the client (None for user-keyed conversations)"""
+        return None if self.id.startswith(USER_KEY_PREFIX) else self.id
+
+    def history(self) -> History:
+        """Model history: the summary as an opening exchange, then the recent turns"""
+        history: History = []
+        if self.summary:
+            history.append({"role": "user", "parts": [f"{SUMMARY_HEADER}\n{self.summary}"]})
+            history.append({"role": "model", "parts": [SUMMARY_ACK]})
+        history.extend({"role": role, "parts": [text]} for role, text in self.turns)
+        return history
+
+
+class SessionStore:
+    """Chat sessions in the database, compacted to a token budget"""
+
+    def __init__(self, ttl_seconds: float, max_sessions: int, history_tokens: int,
+                 summary_tokens: int, purge_interval: float = 300, enabled: bool = True,
+                 first_turn_ttl_seconds: Optional[float] = None):
+        self.ttl_seconds = ttl_seconds
+        self.first_turn_ttl_seconds = ttl_seconds if first_turn_ttl_seconds is None else first_turn_ttl_seconds
+        self.max_sessions = max_sessions
+        self.history_tokens = history_tokens
+        self.summary_tokens = summary_tokens
+        self.purge_interval = purge_interval
+        self.enabled = enabled
+        self._last_purge = 0.0
+
+        self.loaded = 0
+        self.created = 0
+        self.folded_turns = 0
+        self.purged = 0
+        self.errors = 0
+
+    @staticmethod
+    def user_key(principal: str, user_id: Optional[str]) -> str:
+        """Row id of an authenticated caller's conversation (keyed, so ids cannot be derived offline)"""
+        message = f"{principal}\x1f{user_id or ''}".encode()
+        return USER_KEY_PREFIX + hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()[:40]
+
+    def _new(self) -> Conversation:
+        self.created += 1
+        return Conversation(secrets.token_urlsafe(18))
+
+    async def load(self, session_id: Optional[str], user_key: Optional[str] = None) -> Conversation:
+        """The conversation for a request
+
+        A session_id only resumes a live server-issued session; anything else starts
+        a new session with a fresh random id. user_key (see user_key()) is for
+        authenticated callers only.
+        """
+        key = session_id or user_key
+        if key is None:
+            return self._new()
+        try:
+            async with AsyncSessionLocal() as db:
+                row = await db.get(ChatSession, key)
+        except Exception as e:
+            # Chat keeps working without the database, just without memory of earlier turns
+            self.errors += 1
+            print(f"⚠️  Chat session unavailable: {e}")
+            return self._new() if session_id else Conversation(key)
+        if row is None or row.expires_at.replace(tzinfo=timezone.utc) < datetime.now(timezone.utc):
+            if session_id:
+                return self._new()
+            self.created += 1
+            return Conversation(key, persisted=row is not None)
+        self.loaded += 1
+        return Conversation(key, row.summary, [tuple(turn) for turn in json.loads(row.turns)], persisted=True)
+
+    def _fold(self, summary: str, folded: List[Turn]) -> str:
+        """Add one line per folded exchange, dropping the oldest lines past the summary budget"""
+        lines = summary.splitlines() if summary else []
+        question = ""
+        for role, text in folded:
+            if role == "user":
+                question = _clip(text, 160)
+            else:
+                lines.append(f"- Asked: {question} | Answered: {_clip(text, 200)}")
+        while len(lines) > 1 and estimate_tokens("\n".join(lines)) > self.summary_tokens:
+            lines.pop(0)
+        return "\n".join(lines)
+
+    async def record(self, conversation: Conversation, user_message: str, answer: str) -> None:
+        """Append an exchange, compact to the token budget and save (logged, never raised)"""
+        if not self.enabled:
+            return
+        turns = conversation.turns + [("user", user_message), ("model", answer)]
+        folded, conversation.turns = trim_history(turns, self.history_tokens)
+        if folded:
+            conversation.summary = self._fold(conversation.summary, folded)
+            self.folded_turns += len(folded)
+
+        # A session only earns the full TTL once the client comes back with its id
+        first_turn = not conversation.persisted and conversation.session_id is not None
+        ttl = self.first_turn_ttl_seconds if first_turn else self.ttl_seconds
+        now = datetime.now(timezone.utc)
+        try:
+            async with AsyncSessionLocal() as db:
+                row = await db.get(ChatSession, conversation.id) if conversation.persisted else None
+                if row is None:
+                    row = ChatSession(id=conversation.id)
+                    db.add(row)
+                row.summary = conversation.summary
+                row.turns = json.dumps(conversation.turns, ensure_ascii=False)
+                row.tokens = sum(estimate_tokens(text) for _, text in conversation.turns)
+                row.updated_at = now
+                row.expires_at = now + timedelta(seconds=ttl)
+                await db.commit()
+                conversation.persisted = True
+
+                if time.monotonic() - self._last_purge >= self.purge_interval:
+                    self._last_purge = time.monotonic()
+                    await self.purge(db)
+        except Exception as e:
+            self.errors += 1
+            print(f"❌ Saving chat session {conversation.id} failed: {e}")
+
+    async def purge(self, db: Any) -> int:
+        """Delete expired sessions and the least recently used ones past max_sessions"""
+        result = await db.execute(delete(ChatSession).where(ChatSession.expires_at < datetime.now(timezone.utc)))
+        removed = result.rowcount or 0
+        excess = (await db.scalar(select(func.count()).select_from(ChatSession))) - self.max_sessions
+        if excess > 0:
+            oldest = select(ChatSession.id).order_by(ChatSession.expires_at).limit(excess)
+            result = await db.execute(delete(ChatSession).where(ChatSession.id.in_(oldest)))
+            removed += result.rowcount or 0
+        await db.commit()
+        self.purged += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl_seconds,
+            "first_turn_ttl_seconds": self.first_turn_ttl_seconds,
+            "max_sessions": self.max_sessions,
+            "history_token_budget": self.history_tokens,
+            "summary_token_budget": self.summary_tokens,
+            "loaded": self.loaded,
+            "created": self.created,
+            "folded_turns": self.folded_turns,
+            "purged": self.purged,
+            "errors": self.errors,
+        }
+
+
+# Global instance
+session_store = SessionStore(
+    ttl_seconds=settings.CHAT_SESSION_TTL_SECONDS,
+    max_sessions=settings.CHAT_SESSION_MAX_SESSIONS,
+    history_tokens=settings.CHAT_HISTORY_TOKEN_BUDGET,
+    summary_tokens=settings.CHAT_SUMMARY_TOKEN_BUDGET,
+    purge_interval=settings.CHAT_SESSION_PURGE_INTERVAL_SECONDS,
+    enabled=settings.CHAT_SESSIONS_ENABLED,
+    first_turn_ttl_seconds=settings.CHAT_SESSION_FIRST_TURN_TTL_SECONDS,
+)
@@ -0,0 +1,63 @@
+"""
+Per-entity-type content versions
+Admin writes bump the version of every entity type they touch inside the same
+transaction; public reads use the versions for ETags and response cache keys,
+so every gunicorn worker sees a change as soon as it is committed
+"""
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import ContentVersion
+
+ENTITY_TYPES = ("blogs", "projects", "services", "tools", "categories", "tags")
+
+
+class ContentState:
+    """Versions of a set of entity types plus the time of the latest change among them"""
+    __slots__ = ("versions", "last_modified")
+
+    def __init__(self, versions: Tuple[Tuple[str, int], ...], last_modified: Optional[datetime]):
+        self.versions = versions
+        self.last_modified = last_modified
+
+
+async def get_content_state(db: AsyncSession, entities: Iterable[str]) -> ContentState:
+    """Read the current versions of entities in a single primary-key lookup"""
+    entities = tuple(entities)
+    result = await db.execute(
+        select(ContentVersion.entity, ContentVersion.version, ContentVersion.updated_at)
+        .where(ContentVersion.entity.in_(entities))
+    )
+    rows: Dict[str, Tuple[int, Optional[datetime]]] = {
+        entity: (version, updated_at) for entity, version, updated_at in result.all()
+    }
+
+    versions = tuple((entity, rows.get(entity, (0, None))[0]) for entity in entities)
+    timestamps = [updated_at for _, updated_at in rows.values() if updated_at is not None]
+    return ContentState(versions, max(timestamps) if timestamps else None)
+
+
+async def bump_content_versions(db: AsyncSession, *entities: str) -> None:
+    """Bump entity versions as part of the caller's transaction (commit is left to the caller)"""
+    now = datetime.now(timezone.utc)
+    for entity in entities:
+        result = await db.execute(
+            update(ContentVersion)
+            .where(ContentVersion.entity == entity)
+            .values(version=ContentVersion.version + 1, updated_at=now)
+        )
+        if result.rowcount == 0:
+            db.add(ContentVersion(entity=entity, version=1, updated_at=now))
+
+
+async def ensure_content_versions(db: AsyncSession) -> None:
+    """Create missing version rows so concurrent bumps only ever UPDATE"""
+    result = await db.execute(select(ContentVersion.entity))
+    existing = set(result.scalars().all())
+    for entity in ENTITY_TYPES:
+        if entity not in existing:
+            db.add(ContentVersion(entity=entity, version=0))
+    await db.commit()
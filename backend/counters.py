@@ -0,0 +1,192 @@
+"""
+Write-behind counter buffer for views, likes, clicks and resume downloads
+Increments are coalesced in memory per (entity, key, field) and flushed as
+batched atomic `SET col = col + :delta` UPDATEs on a short interval and at
+shutdown, so read requests never take the SQLite write lock
+"""
+import asyncio
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import bindparam, select
+
+from config import settings
+from database import engine
+from models import Blog, Project, Tool, ResumeDownload
+from site_stats import add_view_deltas
+
+# entity -> (model, key column, timestamp column touched on every increment)
+COUNTED_ENTITIES: Dict[str, Tuple[Any, str, Optional[str]]] = {
+    "blogs": (Blog, "id", None),
+    "projects": (Project, "id", None),
+    "tools": (Tool, "id", None),
+    "resume_downloads": (ResumeDownload, "slug", "last_download_at"),
+}
+
+CounterKey = Tuple[str, Any, str]
+
+
+class CounterBuffer:
+    """In-memory increments waiting to be written to the database"""
+
+    def __init__(self, flush_interval: float = 5.0):
+        self.flush_interval = flush_interval
+        self._pending: Dict[CounterKey, int] = defaultdict(int)
+        self._touched_at: Dict[CounterKey, datetime] = {}
+        self._insert_values: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+        self.flushes = 0
+        self.flushed_increments = 0
+
+    def increment(
+        self,
+        entity: str,
+        key: Any,
+        field: str,
+        amount: int = 1,
+        insert_values: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Buffer an increment and return the total not yet flushed for that counter
+
+        insert_values creates the row on flush if no row matches key yet.
+        """
+        if entity not in COUNTED_ENTITIES:
+            raise ValueError(f"Unknown counted entity: {entity}")
+
+        counter = (entity, key, field)
+        self._pending[counter] += amount
+        if COUNTED_ENTITIES[entity][2]:
+            self._touched_at[counter] = datetime.now(timezone.utc)
+        if insert_values is not None:
+            self._insert_values[(entity, key)] = insert_values
+        return self._pending[counter]
+
+    def pending(self, entity: str, key: Any, field: str) -> int:
+        """Buffered (not yet flushed) amount for a counter"""
+        return self._pending.get((entity, key, field), 0)
+
+    async def flush(self) -> int:
+        """Write all buffered increments in one transaction; returns the number of counters written"""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            pending, self._pending = self._pending, defaultdict(int)
+            touched_at, self._touched_at = self._touched_at, {}
+            insert_values, self._insert_values = self._insert_values, {}
+
+            try:
+                async with engine.begin() as conn:
+                    for (entity, field), rows in _group(pending).items():
+                        await self._write(conn, entity, field, rows, touched_at, insert_values)
+                    await add_view_deltas(
+                        conn,
+                        blog_views=_total(pending, "blogs", "views"),
+                        project_views=_total(pending, "projects", "views")
+                    )
+            except Exception:
+                # Put the increments back so the next flush retries them
+                for counter, amount in pending.items():
+                    self._pending[counter] += amount
+                for counter, ts in touched_at.items():
+                    self._touched_at.setdefault(counter, ts)
+                for row, values in insert_values.items():
+                    self._insert_values.setdefault(row, values)
+                raise
+
+            self.flushes += 1
+            self.flushed_increments += sum(pending.values())
+            return len(pending)
+
+    async def _write(
+        self,
+        conn: Any,
+        entity: str,
+        field: str,
+        rows: Dict[Any, int],
+        touched_at: Dict[CounterKey, datetime],
+        insert_values: Dict[Tuple[str, Any], Dict[str, Any]]
+    ) -> None:
+        model, key_column, timestamp_column = COUNTED_ENTITIES[entity]
+        table = model.__table__
+
+        # Rows that must exist before they can be incremented (e.g. first resume download)
+        to_create = [key for key in rows if (entity, key) in insert_values]
+        if to_create:
+            result = await conn.execute(
+                select(table.c[key_column]).where(table.c[key_column].in_(to_create))
+            )
+            existing = set(result.scalars().all())
+            for key in to_create:
+                if key not in existing:
+                    await conn.execute(
+                        table.insert().values(
+                            {key_column: key, field: 0, **insert_values[(entity, key)]}
+                        )
+                    )
+
+        values: Dict[str, Any] = {field: table.c[field] + bindparam("b_delta")}
+        if timestamp_column:
+            values[timestamp_column] = bindparam("b_touched_at")
+
+        statement = table.update().where(table.c[key_column] == bindparam("b_key")).values(values)
+        params = []
+        for key, delta in rows.items():
+            param = {"b_key": key, "b_delta": delta}
+            if timestamp_column:
+                param["b_touched_at"] = touched_at[(entity, key, field)]
+            params.append(param)
+
+        await conn.execute(statement, params)
+
+    def start(self) -> None:
+        """Start the periodic flush loop (call from the app lifespan)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write whatever is still buffered"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"Error flushing counters: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Buffer size and flush counters"""
+        return {
+            "pending_counters": len(self._pending),
+            "pending_increments": sum(self._pending.values()),
+            "flush_interval_seconds": self.flush_interval,
+            "flushes": self.flushes,
+            "flushed_increments": self.flushed_increments,
+        }
+
+
+def _total(pending: Dict[CounterKey, int], entity: str, field: str) -> int:
+    return sum(amount for (e, _, f), amount in pending.items() if e == entity and f == field)
+
+
+def _group(pending: Dict[CounterKey, int]) -> Dict[Tuple[str, str], Dict[Any, int]]:
+    grouped: Dict[Tuple[str, str], Dict[Any, int]] = defaultdict(dict)
+    for (entity, key, field), amount in pending.items():
+        grouped[(entity, field)][key] = amount
+    return grouped
+
+
+# Global instance
+counter_buffer = CounterBuffer(flush_interval=settings.COUNTER_FLUSH_INTERVAL_SECONDS)
@@ -1,16 +1,96 @@
 """
 Database configuration and session management
+The engine profile (echo, pool sizing, SQLite pragmas, asyncpg statement
+caching and an optional read-only engine for public reads) comes from
+config.Settings. Supported backends: sqlite+aiosqlite and postgresql+asyncpg.
 """
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+import os
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from config import settings
 
+
+def _engine_options(url: str) -> Dict[str, Any]:
+    """create_async_engine keyword arguments for url under the configured profile"""
+    options: Dict[str, Any] = {
+        "echo": settings.DATABASE_ECHO,
+        "future": True,
+        "query_cache_size": settings.DATABASE_QUERY_CACHE_SIZE,
+    }
+    parsed = make_url(url)
+
+    if parsed.get_driver_name() == "asyncpg":
+        # Prepared statements cached per connection; 0 disables them for PgBouncer transaction pooling
+        connect_args: Dict[str, Any] = {"prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE}
+        if settings.DATABASE_STATEMENT_CACHE_SIZE == 0:
+            connect_args["statement_cache_size"] = 0
+        if settings.DATABASE_APPLICATION_NAME:
+            connect_args["server_settings"] = {"application_name": settings.DATABASE_APPLICATION_NAME}
+        options["connect_args"] = connect_args
+
+    # In-memory SQLite uses a single static connection; pool sizing does not apply
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return options
+
+    # aiosqlite defaults to NullPool for files, which reopens the file (and reruns the
+    # pragmas, dropping the page cache) on every checkout; keep a real pool instead
+    if parsed.get_backend_name() == "sqlite":
+        options["poolclass"] = AsyncAdaptedQueuePool
+
+    options.update(
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=parsed.get_backend_name() != "sqlite",
+    )
+    return options
+
+
+def _apply_sqlite_pragmas(engine: AsyncEngine, read_only: bool = False) -> None:
+    """Set the configured pragmas on every new SQLite connection of engine"""
+    if engine.dialect.name != "sqlite":
+        return
+
+    pragmas = []
+    if settings.SQLITE_JOURNAL_MODE:
+        pragmas.append(f"journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    if settings.SQLITE_SYNCHRONOUS:
+        pragmas.append(f"synchronous={settings.SQLITE_SYNCHRONOUS}")
+    if settings.SQLITE_BUSY_TIMEOUT_MS:
+        pragmas.append(f"busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    if settings.SQLITE_CACHE_SIZE_KB:
+        pragmas.append(f"cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")  # negative = KiB
+    if settings.SQLITE_MMAP_SIZE_BYTES:
+        pragmas.append(f"mmap_size={int(settings.SQLITE_MMAP_SIZE_BYTES)}")
+    if read_only:
+        pragmas.append("query_only=ON")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+
 # Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=True,  # Set to False in production
-    future=True
-)
+engine = create_async_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL))
+_apply_sqlite_pragmas(engine)
+
+# Public reads can use their own engine (a replica, or a query_only pool on the same SQLite file)
+if settings.DATABASE_READ_ONLY_ENGINE:
+    _read_url = settings.DATABASE_READ_URL or settings.DATABASE_URL
+    read_engine = create_async_engine(_read_url, **_engine_options(_read_url))
+    _apply_sqlite_pragmas(read_engine, read_only=True)
+else:
+    read_engine = engine
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -21,6 +101,15 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False
 )
 
+# Session factory for read-only public queries
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False
+)
+
 # Base class for models
 Base = declarative_base()
 
@@ -34,7 +123,49 @@ async def get_db():
             await session.close()
 
 
+async def get_read_db():
+    """Dependency for a session on the read engine (public GETs that never write)"""
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini")
+
+# pg_advisory_xact_lock key serializing migrations across workers
+MIGRATION_LOCK_ID = 7_146_201_501
+
+
+def upgrade_schema(connection: Connection) -> None:
+    """Run alembic upgrade head on connection (one worker at a time)"""
+    from alembic import command
+    from alembic.config import Config
+
+    # Take a lock up front so concurrently starting workers migrate one at a time
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+    elif connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(f"SELECT pg_advisory_xact_lock({MIGRATION_LOCK_ID})")
+
+    config = Config(ALEMBIC_INI)
+    config.attributes["connection"] = connection
+    command.upgrade(config, "head")
+
+
 async def init_db():
-    """Initialize database tables"""
+    """Bring the schema up to date (alembic upgrade head)
+
+    Databases created by the old create_all startup are adopted by the baseline
+    migration, which only creates what is missing.
+    """
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(upgrade_schema)
+
+
+async def dispose_engines() -> None:
+    """Close every pooled connection (call at shutdown)"""
+    await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
@@ -0,0 +1,230 @@
+"""
+Stale-while-revalidate cache for the public detail-by-slug endpoints
+Fresh entries are served from memory; stale ones are served immediately while
+a single background task per slug reloads them. Unknown slugs are cached as
+misses for a short time so floods of bad slugs cannot hammer the database.
+Admin writes evict the written slugs in this worker; other workers pick the
+change up within DETAIL_CACHE_TTL_SECONDS. Conditional requests for slugs not
+in memory are checked against the content versions before anything is loaded.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from fastapi import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cache import CachedView, response_cache
+from config import settings
+from content_versions import get_content_state
+from database import ReadSessionLocal
+
+DetailKey = Tuple[str, str]
+DetailLoader = Callable[[AsyncSession, str], Awaitable[Optional[Any]]]
+
+
+class DetailEntry:
+    """A loaded detail payload (None for an unknown slug) and the content versions it was read at"""
+    __slots__ = ("value", "versions", "last_modified", "fetched_at")
+
+    def __init__(self, value: Optional[Any], versions: Any, last_modified: Optional[datetime]):
+        self.value = value
+        self.versions = versions
+        self.last_modified = last_modified
+        self.fetched_at = time.monotonic()
+
+    @property
+    def found(self) -> bool:
+        return self.value is not None
+
+    def view(self, request: Any, route: str, slug: str) -> CachedView:
+        """ETag / Last-Modified handling for this entry, without touching the database"""
+        return CachedView(
+            request, response_cache.make_key(route, slug=slug), self.versions, self.last_modified
+        )
+
+
+class DetailCache:
+    """Per-slug SWR cache with single-flight loading and negative caching"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30,
+        stale_seconds: float = 300,
+        negative_ttl_seconds: float = 60,
+        max_entries: int = 4096,
+        max_negative_entries: int = 10000,
+        enabled: bool = True
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.max_negative_entries = max_negative_entries
+        self.enabled = enabled
+
+        self._entries: "OrderedDict[DetailKey, DetailEntry]" = OrderedDict()
+        self._missing: "OrderedDict[DetailKey, DetailEntry]" = OrderedDict()
+        self._inflight: Dict[DetailKey, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+        # Bumped by every eviction so loads that started before a write are not stored
+        self._epoch = 0
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    async def get(self, entity: str, slug: str, loader: DetailLoader) -> DetailEntry:
+        """Return the entry for a slug, loading it (once, however many callers wait) when needed"""
+        if not self.enabled:
+            return await self._fetch((entity, slug), loader, store=False)
+
+        key = (entity, slug)
+        now = time.monotonic()
+
+        missing = self._missing.get(key)
+        if missing is not None:
+            if now - missing.fetched_at < self.negative_ttl_seconds:
+                self.negative_hits += 1
+                return missing
+            del self._missing[key]
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = now - entry.fetched_at
+            if age < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                self._refresh_in_background(key, loader)
+                return entry
+
+        self.misses += 1
+        return await asyncio.shield(self._start_load(key, loader))
+
+    def _in_memory(self, key: DetailKey) -> bool:
+        """Whether get() would answer key without loading (fresh, stale or cached miss)"""
+        now = time.monotonic()
+        missing = self._missing.get(key)
+        if missing is not None and now - missing.fetched_at < self.negative_ttl_seconds:
+            return True
+        entry = self._entries.get(key)
+        return entry is not None and now - entry.fetched_at < self.ttl_seconds + self.stale_seconds
+
+    async def not_modified(self, request: Any, entity: str, slug: str, route: str) -> Optional[Response]:
+        """A 304 decided from the content versions alone when get() would have to load the slug
+
+        Keeps revalidating a cold or expired slug to the single content_versions read.
+        """
+        headers = request.headers
+        if "if-none-match" not in headers and "if-modified-since" not in headers:
+            return None
+        if self.enabled and self._in_memory((entity, slug)):
+            return None
+        async with ReadSessionLocal() as db:
+            state = await get_content_state(db, (entity,))
+        view = CachedView(request, response_cache.make_key(route, slug=slug), state.versions, state.last_modified)
+        return view.not_modified()
+
+    def evict(self, entity: str, *slugs: str) -> None:
+        """Drop cached entries (and 404s) for slugs, or for every slug of entity when none are given"""
+        self._epoch += 1
+        for entries in (self._entries, self._missing):
+            if slugs:
+                for slug in slugs:
+                    entries.pop((entity, slug), None)
+            else:
+                for key in [key for key in entries if key[0] == entity]:
+                    del entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        self._epoch += 1
+        self._entries.clear()
+        self._missing.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.stale_hits + self.negative_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "negative_entries": len(self._missing),
+            "ttl_seconds": self.ttl_seconds,
+            "stale_seconds": self.stale_seconds,
+            "negative_ttl_seconds": self.negative_ttl_seconds,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_ratio": round((lookups - self.misses) / lookups, 4) if lookups else 0.0,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "inflight": len(self._inflight),
+        }
+
+    def _start_load(self, key: DetailKey, loader: DetailLoader) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(key, loader, store=True))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    def _refresh_in_background(self, key: DetailKey, loader: DetailLoader) -> None:
+        if key in self._inflight:
+            return
+        self.refreshes += 1
+        task = self._start_load(key, loader)
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+
+    def _background_done(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.refresh_errors += 1
+            print(f"Error refreshing detail cache entry: {task.exception()}")
+
+    async def _fetch(self, key: DetailKey, loader: DetailLoader, store: bool) -> DetailEntry:
+        entity, slug = key
+        epoch = self._epoch
+
+        # Own session: background refreshes outlive the request that triggered them
+        async with ReadSessionLocal() as db:
+            state = await get_content_state(db, (entity,))
+            value = await loader(db, slug)
+
+        entry = DetailEntry(value, state.versions, state.last_modified)
+        if store and epoch == self._epoch:
+            self._store(key, entry)
+        return entry
+
+    def _store(self, key: DetailKey, entry: DetailEntry) -> None:
+        entries, limit = (
+            (self._entries, self.max_entries) if entry.found
+            else (self._missing, self.max_negative_entries)
+        )
+        (self._missing if entry.found else self._entries).pop(key, None)
+        entries[key] = entry
+        entries.move_to_end(key)
+        while len(entries) > limit:
+            entries.popitem(last=False)
+
+
+# Global instance
+detail_cache = DetailCache(
+    ttl_seconds=settings.DETAIL_CACHE_TTL_SECONDS,
+    stale_seconds=settings.DETAIL_CACHE_STALE_SECONDS,
+    negative_ttl_seconds=settings.DETAIL_CACHE_NEGATIVE_TTL_SECONDS,
+    max_entries=settings.DETAIL_CACHE_MAX_ENTRIES,
+    max_negative_entries=settings.DETAIL_CACHE_MAX_NEGATIVE_ENTRIES,
+    enabled=settings.DETAIL_CACHE_ENABLED
+)
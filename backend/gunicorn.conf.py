@@ -0,0 +1,23 @@
+"""
+Gunicorn settings, loaded automatically when startup.sh runs from backend/
+Workers share one Prometheus metrics directory so /metrics on any of them
+reports the totals of all workers. It is emptied when the master starts,
+and a worker's live gauges are dropped when it exits.
+"""
+import os
+import shutil
+import tempfile
+
+metrics_dir = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "devil-labs-metrics")
+)
+
+
+def on_starting(server):
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
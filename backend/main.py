@@ -7,21 +7,40 @@ Comprehensive backend with:
 - Admin API with authentication
 """
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Tuple, cast
 import google.generativeai as genai
 from datetime import datetime, timedelta
 from collections import defaultdict
  
 import os
+import asyncio
+import hmac
+import time
 from contextlib import asynccontextmanager
 
 from config import settings
 from fastapi.staticfiles import StaticFiles
-from database import init_db
-from fastapi.responses import FileResponse
+from database import init_db, AsyncSessionLocal, dispose_engines
+from content_versions import ensure_content_versions
+from counters import counter_buffer
+from site_stats import reconcile_site_stats
+from related import related_index_missing, related_rebuilder
+from snapshot import serve_api_snapshot
+from sql_metrics import sql_metrics
+from metrics import metrics_middleware, observe_duration, render as render_metrics
+from static_site import static_site
+from chat_models import create_chat_model
+from chat_engine import chat_engine
+from chat_cache import answer_cache
+from retrieval import retrieval_index
+from chat_sessions import Conversation, session_store, trim_history
+from auth import verify_token
+from serializers import dumps
 
 # Import routers
 from routes_admin import router as admin_router
@@ -36,17 +55,41 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting Devil Labs CMS API...")
     
-    # Initialize database
+    # Initialize database (schema migrations, then derived tables and indexes)
     try:
-        await init_db()
+        if settings.DATABASE_AUTO_MIGRATE:
+            await init_db()
+        async with AsyncSessionLocal() as db:
+            await ensure_content_versions(db)
+            report = await reconcile_site_stats(db)
+            if report["drift"]:
+                print(f"⚠️  site_stats drift repaired: {report['drift']}")
+            if await related_index_missing(db):
+                related_rebuilder.schedule()  # Serves requests meanwhile; lists appear when done
+        retrieval_index.start()  # Embeds the corpus in the background
         print("✅ Database initialized")
     except Exception as e:
         print(f"❌ Database initialization failed: {e}")
     
+    # Index the frontend build into memory
+    if static_site.available:
+        report = await asyncio.to_thread(static_site.load)
+        print(f"✅ Frontend indexed: {report['files']} files, {report['compressed']} pre-compressed")
+    
+    # Flush buffered view/like/click counters periodically
+    counter_buffer.start()
+    
     yield
     
     # Shutdown
     print("👋 Shutting down...")
+    try:
+        await counter_buffer.stop()
+    except Exception as e:
+        print(f"❌ Flushing counters failed: {e}")
+    await related_rebuilder.stop()
+    await retrieval_index.stop()
+    await dispose_engines()
 
 
 # Initialize FastAPI app
@@ -57,6 +100,13 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Serve public content GETs from the static JSON snapshot (registered before CORS so CORS wraps it)
+if settings.API_SNAPSHOT_SERVE:
+    app.middleware("http")(serve_api_snapshot)
+
+# Count and time the SQL each request runs (Server-Timing header, per-route totals)
+app.middleware("http")(sql_metrics.middleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -64,8 +114,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Server-Timing"],
 )
 
+# Request count, status and latency per route template (outermost, so it times everything)
+if settings.METRICS_ENABLED:
+    app.middleware("http")(metrics_middleware)
+
 # Include routers
 app.include_router(admin_router)
 app.include_router(public_router)
@@ -94,14 +149,16 @@ class Message(BaseModel):
 
 class ChatRequest(BaseModel):
     message: str = Field(..., min_length=1, max_length=2000)
-    history: List[Message] = Field(default_factory=list)
-    user_id: Optional[str] = None
+    history: List[Message] = Field(default_factory=list)  # Only read when no session is used
+    user_id: Optional[str] = Field(None, max_length=200)  # Keys a stored conversation for authenticated callers
+    session_id: Optional[str] = Field(None, max_length=64, pattern=r"^[A-Za-z0-9_-]+$")
 
 
 class ChatResponse(BaseModel):
     response: str
     suggestions: Optional[List[str]] = None
     actions: Optional[List[Dict[str, Any]]] = None
+    session_id: Optional[str] = None  # Send back with the next message instead of the history
 
 
 class ToolSearchRequest(BaseModel):
@@ -148,6 +205,9 @@ SYSTEM_PROMPT = """You are **Techno Boyz**, the official AI assistant for Devil
 
 Remember: You represent premium AI craftsmanship with a tech-devil aesthetic. Be professional but memorable."""
 
+# Backend for /api/chat and /api/chat/stream (Gemini, or the local fake when CHAT_MODEL_BACKEND=fake)
+chat_model = create_chat_model(SYSTEM_PROMPT)
+
 
 # Rate limiting is implemented in utils/security.py (use check_rate_limit from there)
 
@@ -164,16 +224,11 @@ def sanitize_input(text: str) -> str:
     return sanitized.strip()
 
 
-def format_history_for_gemini(history: List[Message]) -> List[Dict[str, str]]:
-    """Convert message history to Gemini format."""
-    gemini_history = []
-    for msg in history[-settings.MAX_HISTORY_LENGTH:]:
-        role = "user" if msg.role == "user" else "model"
-        gemini_history.append({
-            "role": role,
-            "parts": [msg.content]
-        })
-    return gemini_history
+def format_history_for_gemini(history: List[Message]) -> List[Dict[str, Any]]:
+    """Convert message history to Gemini format, keeping the newest turns within the token budget."""
+    turns = [("user" if msg.role == "user" else "model", msg.content) for msg in history[-settings.MAX_HISTORY_LENGTH:]]
+    _, kept = trim_history(turns, settings.CHAT_HISTORY_TOKEN_BUDGET)
+    return [{"role": role, "parts": [text]} for role, text in kept]
 
 
 def generate_suggestions(user_message: str, response: str) -> List[str]:
@@ -206,20 +261,123 @@ def generate_suggestions(user_message: str, response: str) -> List[str]:
     return suggestions[:3]  # Limit to 3 suggestions
 
 
+def generate_actions(user_message: str) -> List[Dict[str, Any]]:
+    """Generate quick actions based on intent."""
+    actions: List[Dict[str, Any]] = []
+    user_lower = user_message.lower()
+    
+    if "resume" in user_lower or "cv" in user_lower:
+        actions.append({
+            "type": "download",
+            "label": "Download Resume",
+            "url": "/resume/vicky-kumar-resume.pdf"
+        })
+    
+    if "contact" in user_lower or "hire" in user_lower or "quote" in user_lower:
+        actions.append({
+            "type": "navigate",
+            "label": "Contact Us",
+            "url": "/contact"
+        })
+    
+    if "tool" in user_lower or "product" in user_lower:
+        actions.append({
+            "type": "navigate",
+            "label": "Explore Tools",
+            "url": "/devillabs"
+        })
+    
+    return actions
+
+
+def build_chat_response(user_message: str, ai_response: str) -> ChatResponse:
+    """Wrap an answer with its contextual suggestions and quick actions."""
+    suggestions = generate_suggestions(user_message, ai_response)
+    actions = generate_actions(user_message)
+    return ChatResponse(
+        response=ai_response,
+        suggestions=suggestions if suggestions else None,
+        actions=actions if actions else None
+    )
+
+
+def client_address(req: Request) -> str:
+    """Client IP used for rate limiting and chat slots."""
+    return getattr(req.client, 'host', 'unknown')
+
+
+def accept_chat_message(request: ChatRequest, req: Request) -> str:
+    """Rate-limit the client and return the sanitized message (HTTPException if refused)."""
+    if not check_rate_limit(client_address(req), settings.RATE_LIMIT_PER_MINUTE):
+        raise HTTPException(
+            status_code=429,
+            detail="Rate limit exceeded. Please wait a moment before sending more messages."
+        )
+    
+    user_message = sanitize_input(request.message)
+    
+    if not user_message:
+        raise HTTPException(status_code=400, detail="Message cannot be empty")
+    return user_message
+
+
+def authenticated_user(req: Request) -> Optional[str]:
+    """Subject of a valid bearer token on the request, if any."""
+    scheme, _, token = req.headers.get("authorization", "").partition(" ")
+    return verify_token(token) if scheme.lower() == "bearer" and token else None
+
+
+async def load_conversation(request: ChatRequest, req: Request) -> Tuple[Optional[Conversation], List[Dict[str, Any]]]:
+    """The server-side conversation for a request and the history to send the model.
+
+    user_id only selects a stored conversation for authenticated callers (anyone could
+    claim an id otherwise). Clients that send a history without a session keep the
+    stateless behaviour.
+    """
+    principal = authenticated_user(req) if request.user_id else None
+    user_key = session_store.user_key(principal, request.user_id) if principal else None
+    if session_store.enabled and (request.session_id or user_key or not request.history):
+        conversation = await session_store.load(request.session_id, user_key)
+        return conversation, conversation.history()
+    return None, format_history_for_gemini(request.history)
+
+
+async def finish_turn(conversation: Optional[Conversation], user_message: str, response: ChatResponse,
+                      cached: bool = False) -> ChatResponse:
+    """Save the exchange to the conversation and return the response carrying its session id.
+
+    A cached answer that would open a new anonymous session is not saved: repeated
+    one-shot questions would otherwise each leave a chat_sessions row behind.
+    """
+    if conversation is None:
+        return response
+    if cached and not conversation.persisted and conversation.session_id is not None:
+        return response
+    await session_store.record(conversation, user_message, response.response)
+    return response.model_copy(update={"session_id": conversation.session_id})
+
+
+# Event streams must reach the client unbuffered (X-Accel-Buffering: nginx)
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def sse_event(event: str, data: Any) -> bytes:
+    """One Server-Sent Events frame with a JSON payload."""
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+
 # === API ROUTES ===
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Serve the frontend root or health check."""
-    # Check if frontend build exists in static_dist
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    frontend_dist = os.path.join(current_dir, 'static_dist')
-    index_path = os.path.join(frontend_dist, "index.html")
-    
-    if os.path.exists(index_path):
-        return FileResponse(index_path)
+    # index.html is held in memory once static_dist has been indexed
+    if static_site.index is not None:
+        return static_site.response(request, static_site.index)
         
     # Debugging info if frontend is missing
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    index_path = os.path.join(static_site.root, "index.html")
     return {
         "service": "Techno Boyz API",
         "status": "online",
@@ -236,81 +394,104 @@ async def chat(request: ChatRequest, req: Request):
     """
     Main chat endpoint - processes user messages and returns AI responses.
     """
-    # Rate limiting
-    client_ip = getattr(req.client, 'host', 'unknown')
-    if not check_rate_limit(client_ip):
-        raise HTTPException(
-            status_code=429,
-            detail="Rate limit exceeded. Please wait a moment before sending more messages."
-        )
+    # Rate limiting and input sanitization
+    user_message = accept_chat_message(request, req)
     
-    # Sanitize input
-    user_message = sanitize_input(request.message)
+    # Conversation so far: the server-side session (summary + recent turns) or the client's history
+    conversation, history = await load_conversation(request, req)
     
-    if not user_message:
-        raise HTTPException(status_code=400, detail="Message cannot be empty")
+    # Repeated questions are answered from the cache without taking a model slot
+    cache_key = answer_cache.make_key(user_message, history)
+    versions = await answer_cache.versions(SYSTEM_PROMPT)
+    cached = answer_cache.get(cache_key, versions)
+    if cached is not None:
+        return await finish_turn(conversation, user_message, cached, cached=True)
     
-    try:
-        # Initialize Gemini model
-        model = genai.GenerativeModel(
-            model_name="models/gemini-2.0-flash",
-            system_instruction=SYSTEM_PROMPT
-        )
-        
-        # Format conversation history
-        history = format_history_for_gemini(request.history)
-        if len(history) > settings.MAX_HISTORY_LENGTH:
-            history = history[-settings.MAX_HISTORY_LENGTH:]
-        
-        # Start chat session with history
-        # start_chat expects a different strict content type - cast to Any to satisfy the type checker
-        from typing import cast, Any
-        chat_session = model.start_chat(history=cast(Any, history))
-        
-        # Get response
-        response = chat_session.send_message(user_message)
-        ai_response = response.text
-        
-        # Generate contextual suggestions
-        suggestions = generate_suggestions(user_message, ai_response)
-        
-        # Generate quick actions based on intent
-        actions: List[Dict[str, Any]] = []
-        user_lower = user_message.lower()
-        
-        if "resume" in user_lower or "cv" in user_lower:
-            actions.append({
-                "type": "download",
-                "label": "Download Resume",
-                "url": "/resume/vicky-kumar-resume.pdf"
-            })
-        
-        if "contact" in user_lower or "hire" in user_lower or "quote" in user_lower:
-            actions.append({
-                "type": "navigate",
-                "label": "Contact Us",
-                "url": "/contact"
-            })
-        
-        if "tool" in user_lower or "product" in user_lower:
-            actions.append({
-                "type": "navigate",
-                "label": "Explore Tools",
-                "url": "/devillabs"
-            })
-        
-        return ChatResponse(
-            response=ai_response,
-            suggestions=suggestions if suggestions else None,
-            actions=actions if actions else None
-        )
-        
-    except Exception as e:
-        print(f"Error in chat endpoint: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail="Sorry, I encountered an error. Please try again."
-        )
+    # Relevant CMS content, fetched before taking a model slot
+    start = time.perf_counter()
+    prompt = await retrieval_index.ground(user_message)
+    
+    # Wait for a model slot (429/503 with Retry-After when saturated)
+    async with chat_engine.slot(client_address(req)):
+        try:
+            # Get response (start_chat expects a stricter content type - cast to Any for the type checker)
+            with observe_duration("gemini_chat"):
+                ai_response = await chat_model.reply(cast(Any, history), prompt)
+            
+            # Contextual suggestions and quick actions
+            response = build_chat_response(user_message, ai_response)
+            answer_cache.set(cache_key, versions, response, time.perf_counter() - start)
+            
+        except Exception as e:
+            print(f"Error in chat endpoint: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail="Sorry, I encountered an error. Please try again."
+            )
+    
+    return await finish_turn(conversation, user_message, response)
+
+
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest, req: Request):
+    """
+    Streaming chat endpoint - forwards the answer as Server-Sent Events while it is generated.
+    Events: "token" ({"text": ...}) per chunk, then "done" with the ChatResponse
+    (full response, suggestions, actions), or "error" ({"detail": ...}).
+    A client that disconnects cancels the upstream generation (and the turn is not saved).
+    """
+    user_message = accept_chat_message(request, req)
+    conversation, history = await load_conversation(request, req)
+    
+    cache_key = answer_cache.make_key(user_message, history)
+    versions = await answer_cache.versions(SYSTEM_PROMPT)
+    cached = answer_cache.get(cache_key, versions)
+    if cached is not None:
+        # Same protocol as a generated answer, in a single token event
+        async def replay() -> AsyncIterator[bytes]:
+            yield sse_event("token", {"text": cached.response})
+            response = await finish_turn(conversation, user_message, cached, cached=True)
+            yield sse_event("done", response.model_dump())
+        return StreamingResponse(replay(), media_type="text/event-stream", headers=SSE_HEADERS)
+    
+    # Retrieval runs before taking a model slot, so slots are only held while generating
+    start = time.perf_counter()
+    prompt = await retrieval_index.ground(user_message)
+    
+    # The slot is taken before the response starts so saturation can still answer 429/503
+    slot = await chat_engine.acquire(client_address(req))
+    
+    async def events() -> AsyncIterator[bytes]:
+        try:
+            parts: List[str] = []
+            tokens = chat_model.stream(cast(Any, history), prompt)
+            try:
+                with observe_duration("gemini_chat_stream"):
+                    async for text in tokens:
+                        parts.append(text)
+                        yield sse_event("token", {"text": text})
+            except Exception as e:
+                print(f"Error in chat stream: {str(e)}")
+                yield sse_event("error", {"detail": "Sorry, I encountered an error. Please try again."})
+                return
+            finally:
+                # Runs on disconnect too: stop the model instead of generating for nobody
+                await tokens.aclose()
+                slot.release()
+            
+            response = build_chat_response(user_message, "".join(parts))
+            answer_cache.set(cache_key, versions, response, time.perf_counter() - start)
+            response = await finish_turn(conversation, user_message, response)
+            yield sse_event("done", response.model_dump())
+        finally:
+            slot.release()
+    
+    # The body's finally only runs once iteration has started; a response cancelled before
+    # that (client gone during http.response.start) releases the slot in the background task
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers=SSE_HEADERS,
+        background=BackgroundTask(slot.release)
+    )
 
 
 @app.get("/api/health")
@@ -323,32 +504,40 @@ async def health_check() -> Dict[str, Any]:
     }
 
 
-# Serve React Frontend (Production)
-# This assumes the build output has been moved to 'static_dist' in the same directory
-frontend_dist = os.path.join(os.path.dirname(__file__), 'static_dist')
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics(request: Request) -> Response:
+        """Prometheus scrape endpoint (totals of every gunicorn worker)"""
+        if settings.METRICS_BEARER_TOKEN:
+            expected = f"Bearer {settings.METRICS_BEARER_TOKEN}"
+            if not hmac.compare_digest(request.headers.get("authorization", ""), expected):
+                raise HTTPException(status_code=401, detail="Invalid metrics token")
+        body, content_type = render_metrics()
+        return Response(content=body, media_type=content_type)
 
-if os.path.exists(frontend_dist):
-    # Mount assets folder
-    assets_dir = os.path.join(frontend_dist, 'assets')
-    if os.path.exists(assets_dir):
-        app.mount("/assets", StaticFiles(directory=assets_dir), name="assets")
 
-    # Serve other static files (favicon, etc.) if they exist, otherwise serve index.html
+# Serve React Frontend (Production)
+# This assumes the build output has been moved to 'static_dist' in the same directory;
+# it is indexed into memory (with br/gzip variants) at startup
+if static_site.available:
     @app.get("/{full_path:path}")
-    async def serve_frontend(full_path: str):
+    async def serve_frontend(full_path: str, request: Request):
         # Skip API and uploads routes (they are handled by other routers/mounts)
         if full_path.startswith("api") or full_path.startswith("uploads"):
             raise HTTPException(status_code=404, detail="Not found")
 
-        # Check if specific file exists in dist (e.g. favicon.ico, robots.txt)
-        file_path = os.path.join(frontend_dist, full_path)
-        if os.path.exists(file_path) and os.path.isfile(file_path):
-            return FileResponse(file_path)
+        # Files in dist (hashed assets, favicon.ico, robots.txt, ...)
+        entry = static_site.lookup(full_path)
+        if entry is not None:
+            return static_site.response(request, entry)
+
+        # Missing bundles must not turn into index.html
+        if full_path.startswith("assets/"):
+            raise HTTPException(status_code=404, detail="Not found")
 
         # Fallback to index.html for SPA routing
-        index_path = os.path.join(frontend_dist, "index.html")
-        if os.path.exists(index_path):
-            return FileResponse(index_path)
+        if static_site.index is not None:
+            return static_site.response(request, static_site.index)
         
         return {"message": "Frontend build found but index.html missing"}
 
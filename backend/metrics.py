@@ -0,0 +1,143 @@
+"""
+Prometheus metrics for the API (GET /metrics)
+Request count, status codes, latency histograms and in-flight gauges per route
+template, cache lookups by result, and the duration of slow external work
+(Gemini replies, image resizing, email sends), and chat admission (queue wait,
+requests shed).
+Under gunicorn every worker writes to PROMETHEUS_MULTIPROC_DIR (set up by
+gunicorn.conf.py), so a scrape of any worker returns the totals of all of them.
+"""
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Tuple
+
+from fastapi import Request
+from starlette.routing import Match
+
+from config import settings
+
+# prometheus_client picks its storage when imported, so the directory must be in the environment first
+if settings.PROMETHEUS_MULTIPROC_DIR:
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", settings.PROMETHEUS_MULTIPROC_DIR)
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+)
+
+from cache import response_cache  # noqa: E402
+from detail_cache import detail_cache  # noqa: E402
+from chat_cache import answer_cache  # noqa: E402
+
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+OPERATION_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+
+# Requests that match no route share one label value, so scanners cannot add series
+UNMATCHED_ROUTE = "unmatched"
+
+REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route template and status code",
+    ["method", "route", "status"]
+)
+REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template",
+    ["method", "route"], buckets=REQUEST_BUCKETS
+)
+IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "HTTP requests being handled",
+    ["method", "route"], multiprocess_mode="livesum"
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total", "Cache lookups by cache and result (hit ratio = hit / all)",
+    ["cache", "result"]
+)
+OPERATION_SECONDS = Histogram(
+    "operation_duration_seconds", "Duration of slow external work (gemini_chat, gemini_chat_stream, image_resize, email_send)",
+    ["operation", "outcome"], buckets=OPERATION_BUCKETS
+)
+CHAT_QUEUE_SECONDS = Histogram(
+    "chat_queue_wait_seconds", "Time chat requests waited for a model slot",
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+CHAT_SHED = Counter(
+    "chat_requests_shed_total", "Chat requests refused without a model slot (client_limit, queue_full, queue_timeout)",
+    ["reason"]
+)
+
+# (cache label, result label) -> attribute holding that count on the cache object
+CACHE_COUNTERS: Dict[Tuple[str, str], Tuple[Any, str]] = {
+    ("response", "hit"): (response_cache, "hits"),
+    ("response", "miss"): (response_cache, "misses"),
+    ("detail", "hit"): (detail_cache, "hits"),
+    ("detail", "stale"): (detail_cache, "stale_hits"),
+    ("detail", "negative"): (detail_cache, "negative_hits"),
+    ("detail", "miss"): (detail_cache, "misses"),
+    # Every chat hit is a model call saved
+    ("chat", "hit"): (answer_cache, "hits"),
+    ("chat", "miss"): (answer_cache, "misses"),
+}
+_cache_seen: Dict[Tuple[str, str], int] = {labels: 0 for labels in CACHE_COUNTERS}
+
+
+@contextmanager
+def observe_duration(operation: str) -> Iterator[None]:
+    """Time the enclosed block into operation_duration_seconds (outcome ok or error)"""
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        OPERATION_SECONDS.labels(operation, outcome).observe(time.perf_counter() - start)
+
+
+def sync_cache_counters() -> None:
+    """Add the caches' lookups since the last call to cache_lookups_total"""
+    for labels, (cache, attribute) in CACHE_COUNTERS.items():
+        count = getattr(cache, attribute)
+        # The caches' own counters never reset, but a lower value is treated as a restart
+        delta = count - _cache_seen[labels] if count >= _cache_seen[labels] else count
+        if delta:
+            CACHE_LOOKUPS.labels(*labels).inc(delta)
+        _cache_seen[labels] = count
+
+
+def route_template(request: Request) -> str:
+    """Path template of the route that will handle request (e.g. /api/blogs/{slug})"""
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ROUTE) or "/"
+    return UNMATCHED_ROUTE
+
+
+def render() -> Tuple[bytes, str]:
+    """Metrics body in the Prometheus text format, plus its content type"""
+    sync_cache_counters()
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+async def metrics_middleware(request: Request, call_next: Any) -> Any:
+    """HTTP middleware: count, time and track in-flight requests per route template"""
+    method = request.method
+    route = route_template(request)
+    in_progress = IN_PROGRESS.labels(method, route)
+    status = 500
+
+    in_progress.inc()
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        REQUEST_SECONDS.labels(method, route).observe(time.perf_counter() - start)
+        REQUESTS.labels(method, route, str(status)).inc()
+        in_progress.dec()
+        sync_cache_counters()
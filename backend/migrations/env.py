@@ -0,0 +1,80 @@
+"""
+Alembic environment for the CMS database
+Runs against config.settings.DATABASE_URL with the async engine, or against
+the connection database.init_db passes in through config.attributes.
+SQLite migrations use batch mode (table copy) for ALTERs SQLite lacks.
+"""
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from config import settings
+from database import Base
+import models  # noqa: F401  (registers every table on Base.metadata)
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("connection") is None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# Full-text search objects created by migration 0003 that are not part of models.py
+IGNORED_TABLES = {"blogs_fts", "blogs_fts_data", "blogs_fts_idx", "blogs_fts_docsize", "blogs_fts_config"}
+IGNORED_INDEXES = {"ix_blogs_search"}
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    if type_ == "table":
+        return name not in IGNORED_TABLES
+    if type_ == "index":
+        return name not in IGNORED_INDEXES
+    return True
+
+
+def _configure(**kwargs) -> None:
+    context.configure(
+        target_metadata=target_metadata,
+        include_object=include_object,
+        render_as_batch=True,
+        compare_type=True,
+        **kwargs
+    )
+
+
+def run_migrations_offline() -> None:
+    """Emit SQL to stdout instead of running it (alembic upgrade head --sql)"""
+    _configure(url=settings.DATABASE_URL, literal_binds=True, dialect_opts={"paramstyle": "named"})
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    _configure(connection=connection)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+        await connection.commit()
+    await engine.dispose()
+
+
+def run_migrations_online() -> None:
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+    else:
+        asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,318 @@
+"""Baseline schema
+
+The schema Base.metadata.create_all produced before migrations were introduced.
+Only missing tables and indexes are created, so databases that create_all built
+from any earlier models.py (which never added indexes to existing tables) are
+brought up to the same baseline instead of failing on "table already exists".
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _existing_tables() -> set:
+    if context.is_offline_mode():
+        return set()
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _create_index(name: str, table: str, columns: list, unique: bool = False) -> None:
+    if not context.is_offline_mode():
+        if name in {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}:
+            return
+    op.create_index(name, table, columns, unique=unique)
+
+
+def upgrade() -> None:
+    tables = _existing_tables()
+
+    if 'assets' not in tables:
+        op.create_table(
+            'assets',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('filename', sa.String(length=200), nullable=False),
+            sa.Column('original_filename', sa.String(length=200), nullable=False),
+            sa.Column('file_type', sa.String(length=50), nullable=False),
+            sa.Column('file_size', sa.Integer(), nullable=False),
+            sa.Column('storage_url', sa.String(length=500), nullable=False),
+            sa.Column('blob_name', sa.String(length=500), nullable=False),
+            sa.Column('container_name', sa.String(length=100), nullable=False),
+            sa.Column('thumbnail_url', sa.String(length=500), nullable=True),
+            sa.Column('medium_url', sa.String(length=500), nullable=True),
+            sa.Column('large_url', sa.String(length=500), nullable=True),
+            sa.Column('width', sa.Integer(), nullable=True),
+            sa.Column('height', sa.Integer(), nullable=True),
+            sa.Column('alt_text', sa.String(length=200), nullable=True),
+            sa.Column('tags', sa.Text(), nullable=True),
+            sa.Column('used_in', sa.String(length=50), nullable=True),
+            sa.Column('used_in_id', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('storage_url')
+        )
+    _create_index('ix_assets_id', 'assets', ['id'])
+
+    if 'categories' not in tables:
+        op.create_table(
+            'categories',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=False),
+            sa.Column('slug', sa.String(length=100), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+    _create_index('ix_categories_id', 'categories', ['id'])
+    _create_index('ix_categories_name', 'categories', ['name'], unique=True)
+    _create_index('ix_categories_slug', 'categories', ['slug'], unique=True)
+
+    if 'content_versions' not in tables:
+        op.create_table(
+            'content_versions',
+            sa.Column('entity', sa.String(length=50), nullable=False),
+            sa.Column('version', sa.Integer(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint('entity')
+        )
+    if 'related_items' not in tables:
+        op.create_table(
+            'related_items',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('source_type', sa.String(length=20), nullable=False),
+            sa.Column('source_id', sa.Integer(), nullable=False),
+            sa.Column('source_slug', sa.String(length=200), nullable=False),
+            sa.Column('rank', sa.Integer(), nullable=False),
+            sa.Column('target_type', sa.String(length=20), nullable=False),
+            sa.Column('target_id', sa.Integer(), nullable=False),
+            sa.Column('target_slug', sa.String(length=200), nullable=False),
+            sa.Column('target_title', sa.String(length=200), nullable=False),
+            sa.Column('target_summary', sa.Text(), nullable=True),
+            sa.Column('target_thumbnail', sa.String(length=500), nullable=True),
+            sa.Column('score', sa.Float(), nullable=False),
+            sa.PrimaryKeyConstraint('id')
+        )
+    _create_index('ix_related_items_source_id', 'related_items', ['source_type', 'source_id'])
+    _create_index('ix_related_items_source_slug_rank', 'related_items', ['source_type', 'source_slug', 'rank'])
+    _create_index('ix_related_items_target', 'related_items', ['target_type', 'target_id'])
+
+    if 'resume_downloads' not in tables:
+        op.create_table(
+            'resume_downloads',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('slug', sa.String(length=100), nullable=False),
+            sa.Column('filename', sa.String(length=200), nullable=False),
+            sa.Column('count', sa.Integer(), nullable=True),
+            sa.Column('last_download_at', sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+    _create_index('ix_resume_downloads_id', 'resume_downloads', ['id'])
+    _create_index('ix_resume_downloads_slug', 'resume_downloads', ['slug'], unique=True)
+
+    if 'services' not in tables:
+        op.create_table(
+            'services',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(length=200), nullable=False),
+            sa.Column('slug', sa.String(length=200), nullable=False),
+            sa.Column('description', sa.Text(), nullable=False),
+            sa.Column('long_description', sa.Text(), nullable=True),
+            sa.Column('price', sa.Float(), nullable=True),
+            sa.Column('price_range', sa.String(length=50), nullable=True),
+            sa.Column('currency', sa.String(length=10), nullable=True),
+            sa.Column('pricing_model', sa.String(length=50), nullable=True),
+            sa.Column('icon', sa.String(length=500), nullable=True),
+            sa.Column('featured_image', sa.String(length=500), nullable=True),
+            sa.Column('features', sa.Text(), nullable=True),
+            sa.Column('deliverables', sa.Text(), nullable=True),
+            sa.Column('duration', sa.String(length=50), nullable=True),
+            sa.Column('meta_title', sa.String(length=200), nullable=True),
+            sa.Column('meta_description', sa.String(length=300), nullable=True),
+            sa.Column('active', sa.Boolean(), nullable=True),
+            sa.Column('featured', sa.Boolean(), nullable=True),
+            sa.Column('order', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+    _create_index('ix_services_active', 'services', ['active'])
+    _create_index('ix_services_featured', 'services', ['featured'])
+    _create_index('ix_services_id', 'services', ['id'])
+    _create_index('ix_services_slug', 'services', ['slug'], unique=True)
+    _create_index('ix_services_title', 'services', ['title'])
+
+    if 'site_stats' not in tables:
+        op.create_table(
+            'site_stats',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('blogs', sa.Integer(), nullable=False),
+            sa.Column('projects', sa.Integer(), nullable=False),
+            sa.Column('services', sa.Integer(), nullable=False),
+            sa.Column('tools', sa.Integer(), nullable=False),
+            sa.Column('blog_views', sa.Integer(), nullable=False),
+            sa.Column('project_views', sa.Integer(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+    if 'tags' not in tables:
+        op.create_table(
+            'tags',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=50), nullable=False),
+            sa.Column('slug', sa.String(length=50), nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+    _create_index('ix_tags_id', 'tags', ['id'])
+    _create_index('ix_tags_name', 'tags', ['name'], unique=True)
+    _create_index('ix_tags_slug', 'tags', ['slug'], unique=True)
+
+    if 'tools' not in tables:
+        op.create_table(
+            'tools',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=False),
+            sa.Column('slug', sa.String(length=100), nullable=False),
+            sa.Column('description', sa.Text(), nullable=False),
+            sa.Column('logo', sa.String(length=500), nullable=True),
+            sa.Column('icon', sa.String(length=500), nullable=True),
+            sa.Column('screenshot', sa.String(length=500), nullable=True),
+            sa.Column('website_url', sa.String(length=500), nullable=True),
+            sa.Column('demo_url', sa.String(length=500), nullable=True),
+            sa.Column('github_url', sa.String(length=500), nullable=True),
+            sa.Column('category', sa.String(length=100), nullable=True),
+            sa.Column('tech_stack', sa.Text(), nullable=True),
+            sa.Column('features', sa.Text(), nullable=True),
+            sa.Column('pricing', sa.String(length=50), nullable=True),
+            sa.Column('price', sa.Float(), nullable=True),
+            sa.Column('views', sa.Integer(), nullable=True),
+            sa.Column('clicks', sa.Integer(), nullable=True),
+            sa.Column('rating', sa.Float(), nullable=True),
+            sa.Column('active', sa.Boolean(), nullable=True),
+            sa.Column('featured', sa.Boolean(), nullable=True),
+            sa.Column('order', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+    _create_index('ix_tools_active', 'tools', ['active'])
+    _create_index('ix_tools_featured', 'tools', ['featured'])
+    _create_index('ix_tools_id', 'tools', ['id'])
+    _create_index('ix_tools_name', 'tools', ['name'])
+    _create_index('ix_tools_slug', 'tools', ['slug'], unique=True)
+
+    if 'blogs' not in tables:
+        op.create_table(
+            'blogs',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(length=200), nullable=False),
+            sa.Column('slug', sa.String(length=200), nullable=False),
+            sa.Column('excerpt', sa.Text(), nullable=False),
+            sa.Column('content', sa.Text(), nullable=False),
+            sa.Column('author', sa.String(length=100), nullable=False),
+            sa.Column('featured_image', sa.String(length=500), nullable=True),
+            sa.Column('thumbnail_image', sa.String(length=500), nullable=True),
+            sa.Column('read_time', sa.Integer(), nullable=True),
+            sa.Column('views', sa.Integer(), nullable=True),
+            sa.Column('likes', sa.Integer(), nullable=True),
+            sa.Column('meta_title', sa.String(length=200), nullable=True),
+            sa.Column('meta_description', sa.String(length=300), nullable=True),
+            sa.Column('meta_keywords', sa.String(length=200), nullable=True),
+            sa.Column('published', sa.Boolean(), nullable=True),
+            sa.Column('featured', sa.Boolean(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('category_id', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='SET NULL'),
+            sa.PrimaryKeyConstraint('id')
+        )
+    _create_index('ix_blogs_featured', 'blogs', ['featured'])
+    _create_index('ix_blogs_id', 'blogs', ['id'])
+    _create_index('ix_blogs_published', 'blogs', ['published'])
+    _create_index('ix_blogs_published_published_at_id', 'blogs', ['published', 'published_at', 'id'])
+    _create_index('ix_blogs_slug', 'blogs', ['slug'], unique=True)
+    _create_index('ix_blogs_title', 'blogs', ['title'])
+
+    if 'projects' not in tables:
+        op.create_table(
+            'projects',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(length=200), nullable=False),
+            sa.Column('slug', sa.String(length=200), nullable=False),
+            sa.Column('description', sa.Text(), nullable=False),
+            sa.Column('long_description', sa.Text(), nullable=True),
+            sa.Column('featured_image', sa.String(length=500), nullable=True),
+            sa.Column('thumbnail_image', sa.String(length=500), nullable=True),
+            sa.Column('demo_video_url', sa.String(length=500), nullable=True),
+            sa.Column('gallery_images', sa.Text(), nullable=True),
+            sa.Column('demo_url', sa.String(length=500), nullable=True),
+            sa.Column('github_url', sa.String(length=500), nullable=True),
+            sa.Column('live_url', sa.String(length=500), nullable=True),
+            sa.Column('tech_stack', sa.Text(), nullable=True),
+            sa.Column('client', sa.String(length=100), nullable=True),
+            sa.Column('duration', sa.String(length=50), nullable=True),
+            sa.Column('team_size', sa.Integer(), nullable=True),
+            sa.Column('stars', sa.Integer(), nullable=True),
+            sa.Column('forks', sa.Integer(), nullable=True),
+            sa.Column('views', sa.Integer(), nullable=True),
+            sa.Column('published', sa.Boolean(), nullable=True),
+            sa.Column('featured', sa.Boolean(), nullable=True),
+            sa.Column('status', sa.String(length=50), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('category_id', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='SET NULL'),
+            sa.PrimaryKeyConstraint('id')
+        )
+    _create_index('ix_projects_featured', 'projects', ['featured'])
+    _create_index('ix_projects_id', 'projects', ['id'])
+    _create_index('ix_projects_published', 'projects', ['published'])
+    _create_index('ix_projects_published_published_at_id', 'projects', ['published', 'published_at', 'id'])
+    _create_index('ix_projects_slug', 'projects', ['slug'], unique=True)
+    _create_index('ix_projects_title', 'projects', ['title'])
+
+    if 'blog_tags' not in tables:
+        op.create_table(
+            'blog_tags',
+            sa.Column('blog_id', sa.Integer(), nullable=True),
+            sa.Column('tag_id', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['blog_id'], ['blogs.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE')
+        )
+    if 'project_tags' not in tables:
+        op.create_table(
+            'project_tags',
+            sa.Column('project_id', sa.Integer(), nullable=True),
+            sa.Column('tag_id', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE')
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('project_tags')
+    op.drop_table('blog_tags')
+    op.drop_table('projects')
+    op.drop_table('blogs')
+    op.drop_table('tools')
+    op.drop_table('tags')
+    op.drop_table('site_stats')
+    op.drop_table('services')
+    op.drop_table('resume_downloads')
+    op.drop_table('related_items')
+    op.drop_table('content_versions')
+    op.drop_table('categories')
+    op.drop_table('assets')
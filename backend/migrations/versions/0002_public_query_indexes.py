@@ -0,0 +1,119 @@
+"""Composite indexes for the public query shapes; association table primary keys
+
+- blogs/projects: (published, featured, published_at, id) and
+  (category_id, published, published_at, id) next to the existing
+  (published, published_at, id) keyset index, so featured and category
+  listings are read in order instead of sorted after filtering.
+- services/tools: (active[, featured | category], order, created_at DESC)
+  for the "order ASC, created_at DESC" listings.
+- The single-column published/featured/active indexes are prefixes of the
+  composites (or too unselective to be used) and are dropped.
+- blog_tags/project_tags get a (owner_id, tag_id) primary key, after
+  dropping duplicate and NULL rows, plus a (tag_id, owner_id) index.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> single-column indexes replaced by the composites
+FLAG_INDEXES = {
+    'blogs': ('published', 'featured'),
+    'projects': ('published', 'featured'),
+    'services': ('active', 'featured'),
+    'tools': ('active', 'featured'),
+}
+
+# index name -> (table, columns)
+COMPOSITE_INDEXES = {
+    'ix_blogs_published_featured_published_at_id': ('blogs', ['published', 'featured', 'published_at', 'id']),
+    'ix_blogs_category_id_published_published_at_id': ('blogs', ['category_id', 'published', 'published_at', 'id']),
+    'ix_projects_published_featured_published_at_id': ('projects', ['published', 'featured', 'published_at', 'id']),
+    'ix_projects_category_id_published_published_at_id': ('projects', ['category_id', 'published', 'published_at', 'id']),
+    'ix_services_active_order_created_at': ('services', ['active', 'order', sa.text('created_at DESC')]),
+    'ix_services_active_featured_order_created_at': ('services', ['active', 'featured', 'order', sa.text('created_at DESC')]),
+    'ix_tools_active_order_created_at': ('tools', ['active', 'order', sa.text('created_at DESC')]),
+    'ix_tools_active_category_order_created_at': ('tools', ['active', 'category', 'order', sa.text('created_at DESC')]),
+}
+
+# association table -> (owner column, owner table)
+ASSOCIATION_TABLES = {
+    'blog_tags': ('blog_id', 'blogs'),
+    'project_tags': ('project_id', 'projects'),
+}
+
+
+def _baseline_association(table: str, owner: str, owner_table: str) -> sa.Table:
+    """The 0001 definition, so batch mode can rebuild the table without reflecting it (works with --sql)"""
+    return sa.Table(
+        table,
+        sa.MetaData(),
+        sa.Column(owner, sa.Integer(), sa.ForeignKey(f'{owner_table}.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('tag_id', sa.Integer(), sa.ForeignKey('tags.id', ondelete='CASCADE'), nullable=True),
+    )
+
+
+def _dedupe(table: str, owner: str) -> None:
+    """Remove rows that would violate the new (owner, tag_id) primary key"""
+    op.execute(f"DELETE FROM {table} WHERE {owner} IS NULL OR tag_id IS NULL")
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute(
+            f"DELETE FROM {table} WHERE rowid NOT IN "
+            f"(SELECT MIN(rowid) FROM {table} GROUP BY {owner}, tag_id)"
+        )
+    else:
+        op.execute(
+            f"DELETE FROM {table} a USING {table} b "
+            f"WHERE a.ctid > b.ctid AND a.{owner} = b.{owner} AND a.tag_id = b.tag_id"
+        )
+
+
+def upgrade() -> None:
+    for name, (table, columns) in COMPOSITE_INDEXES.items():
+        op.create_index(name, table, columns, unique=False)
+
+    for table, flags in FLAG_INDEXES.items():
+        for flag in flags:
+            op.drop_index(f'ix_{table}_{flag}', table_name=table)
+
+    for table, (owner, owner_table) in ASSOCIATION_TABLES.items():
+        _dedupe(table, owner)
+        # SQLite cannot add a primary key in place; batch mode rebuilds the table
+        with op.batch_alter_table(
+            table, recreate='auto', copy_from=_baseline_association(table, owner, owner_table)
+        ) as batch_op:
+            batch_op.alter_column(owner, existing_type=sa.Integer(), nullable=False)
+            batch_op.alter_column('tag_id', existing_type=sa.Integer(), nullable=False)
+            batch_op.create_primary_key(f'pk_{table}', [owner, 'tag_id'])
+        op.create_index(f'ix_{table}_tag_id', table, ['tag_id', owner], unique=False)
+
+
+def downgrade() -> None:
+    for table, (owner, owner_table) in ASSOCIATION_TABLES.items():
+        op.drop_index(f'ix_{table}_tag_id', table_name=table)
+        if op.get_bind().dialect.name == 'sqlite':
+            # Rebuild as the 0001 table (no primary key)
+            with op.batch_alter_table(
+                table, recreate='always', copy_from=_baseline_association(table, owner, owner_table)
+            ):
+                pass
+        else:
+            op.drop_constraint(f'pk_{table}', table, type_='primary')
+            op.alter_column(table, owner, existing_type=sa.Integer(), nullable=True)
+            op.alter_column(table, 'tag_id', existing_type=sa.Integer(), nullable=True)
+
+    for table, flags in FLAG_INDEXES.items():
+        for flag in flags:
+            op.create_index(f'ix_{table}_{flag}', table, [flag], unique=False)
+
+    for name, (table, _) in COMPOSITE_INDEXES.items():
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,83 @@
+"""Full-text search index on blogs (moved from startup DDL in search.py)
+
+- SQLite: FTS5 external-content table blogs_fts plus sync triggers,
+  backfilled when the table is created.
+- PostgreSQL: GIN index on the weighted tsvector expression search.py
+  queries (title A, excerpt B, content C). The expression must stay
+  identical to search.PG_DOCUMENT for the planner to use the index.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS blogs_fts USING fts5(
+        title, excerpt, content,
+        content='blogs', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    # Only re-index when searchable columns change, not on every views/likes bump
+    """
+    CREATE TRIGGER IF NOT EXISTS blogs_fts_insert AFTER INSERT ON blogs BEGIN
+        INSERT INTO blogs_fts(rowid, title, excerpt, content)
+        VALUES (new.id, new.title, new.excerpt, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS blogs_fts_delete AFTER DELETE ON blogs BEGIN
+        INSERT INTO blogs_fts(blogs_fts, rowid, title, excerpt, content)
+        VALUES ('delete', old.id, old.title, old.excerpt, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS blogs_fts_update AFTER UPDATE OF title, excerpt, content ON blogs BEGIN
+        INSERT INTO blogs_fts(blogs_fts, rowid, title, excerpt, content)
+        VALUES ('delete', old.id, old.title, old.excerpt, old.content);
+        INSERT INTO blogs_fts(rowid, title, excerpt, content)
+        VALUES (new.id, new.title, new.excerpt, new.content);
+    END
+    """,
+]
+
+PG_DOCUMENT = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(excerpt, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    dialect = op.get_context().dialect.name
+
+    if dialect == 'sqlite':
+        # Databases from the create_all era already have the index (created at startup)
+        created = context.is_offline_mode() or 'blogs_fts' not in sa.inspect(op.get_bind()).get_table_names()
+        for statement in FTS_DDL:
+            op.execute(statement)
+        if created:
+            op.execute("INSERT INTO blogs_fts(blogs_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_blogs_search ON blogs USING GIN (({PG_DOCUMENT}))")
+
+
+def downgrade() -> None:
+    dialect = op.get_context().dialect.name
+
+    if dialect == 'sqlite':
+        for trigger in ('blogs_fts_insert', 'blogs_fts_delete', 'blogs_fts_update'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS blogs_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_blogs_search")
@@ -0,0 +1,38 @@
+"""Server-side chat sessions (chat_sessions.py)
+
+One row per conversation: the recent turns as JSON, a running summary of
+older ones and an expiry, indexed for the periodic purge.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'chat_sessions',
+        sa.Column('id', sa.String(length=64), nullable=False),
+        sa.Column('summary', sa.Text(), nullable=False),
+        sa.Column('turns', sa.Text(), nullable=False),
+        sa.Column('tokens', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_chat_sessions_expires_at', 'chat_sessions', ['expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chat_sessions_expires_at', table_name='chat_sessions')
+    op.drop_table('chat_sessions')
@@ -0,0 +1,37 @@
+"""Stored related-content features (related.py)
+
+One row per (feature, item): the tags, category and title/summary terms of
+every published blog and project with their scoring weights, so an admin
+write rescores one item with indexed lookups instead of reloading the corpus.
+Filled by the first related-content rebuild after the upgrade.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'related_features',
+        sa.Column('feature', sa.String(length=100), nullable=False),
+        sa.Column('source_type', sa.String(length=20), nullable=False),
+        sa.Column('source_id', sa.Integer(), nullable=False),
+        sa.Column('weight', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('feature', 'source_type', 'source_id')
+    )
+    op.create_index('ix_related_features_source', 'related_features', ['source_type', 'source_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_related_features_source', table_name='related_features')
+    op.drop_table('related_features')
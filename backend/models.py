@@ -1,24 +1,27 @@
 """
 Database models for CMS
 """
-from sqlalchemy import Column, Integer, String, Text, Float, Boolean, DateTime, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, Text, Float, Boolean, DateTime, ForeignKey, Table, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
 
 # Many-to-many association tables
+# (blog_id, tag_id) is the primary key; the tag_id index serves "posts with this tag"
 blog_tags = Table(
     'blog_tags',
     Base.metadata,
-    Column('blog_id', Integer, ForeignKey('blogs.id', ondelete='CASCADE')),
-    Column('tag_id', Integer, ForeignKey('tags.id', ondelete='CASCADE'))
+    Column('blog_id', Integer, ForeignKey('blogs.id', ondelete='CASCADE'), primary_key=True),
+    Column('tag_id', Integer, ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True),
+    Index('ix_blog_tags_tag_id', 'tag_id', 'blog_id')
 )
 
 project_tags = Table(
     'project_tags',
     Base.metadata,
-    Column('project_id', Integer, ForeignKey('projects.id', ondelete='CASCADE')),
-    Column('tag_id', Integer, ForeignKey('tags.id', ondelete='CASCADE'))
+    Column('project_id', Integer, ForeignKey('projects.id', ondelete='CASCADE'), primary_key=True),
+    Column('tag_id', Integer, ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True),
+    Index('ix_project_tags_tag_id', 'tag_id', 'project_id')
 )
 
 
@@ -74,8 +77,8 @@ class Blog(Base):
     meta_keywords = Column(String(200), nullable=True)
     
     # Status
-    published = Column(Boolean, default=False, index=True)
-    featured = Column(Boolean, default=False, index=True)
+    published = Column(Boolean, default=False)
+    featured = Column(Boolean, default=False)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -88,6 +91,14 @@ class Blog(Base):
     # Relationships
     category = relationship('Category', back_populates='blogs')
     tags = relationship('Tag', secondary=blog_tags, back_populates='blogs')
+    
+    # Public list shapes: equality filters first, then the (published_at, id) keyset
+    # ordering, so listing never sorts after filtering (see query_plans.py)
+    __table_args__ = (
+        Index('ix_blogs_published_published_at_id', 'published', 'published_at', 'id'),
+        Index('ix_blogs_published_featured_published_at_id', 'published', 'featured', 'published_at', 'id'),
+        Index('ix_blogs_category_id_published_published_at_id', 'category_id', 'published', 'published_at', 'id'),
+    )
 
 
 class Project(Base):
@@ -122,8 +133,8 @@ class Project(Base):
     views = Column(Integer, default=0)
     
     # Status
-    published = Column(Boolean, default=False, index=True)
-    featured = Column(Boolean, default=False, index=True)
+    published = Column(Boolean, default=False)
+    featured = Column(Boolean, default=False)
     status = Column(String(50), default='completed')  # completed, in-progress, planned
     
     # Timestamps
@@ -138,6 +149,13 @@ class Project(Base):
     # Relationships
     category = relationship('Category', back_populates='projects')
     tags = relationship('Tag', secondary=project_tags, back_populates='projects')
+    
+    # Public list shapes: equality filters first, then the (published_at, id) keyset ordering
+    __table_args__ = (
+        Index('ix_projects_published_published_at_id', 'published', 'published_at', 'id'),
+        Index('ix_projects_published_featured_published_at_id', 'published', 'featured', 'published_at', 'id'),
+        Index('ix_projects_category_id_published_published_at_id', 'category_id', 'published', 'published_at', 'id'),
+    )
 
 
 class Service(Base):
@@ -169,8 +187,8 @@ class Service(Base):
     meta_description = Column(String(300), nullable=True)
     
     # Status
-    active = Column(Boolean, default=True, index=True)
-    featured = Column(Boolean, default=False, index=True)
+    active = Column(Boolean, default=True)
+    featured = Column(Boolean, default=False)
     order = Column(Integer, default=0)  # For custom sorting
     
     # Timestamps
@@ -178,6 +196,11 @@ class Service(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
 
+# Public list shape: active filter, then (order ASC, created_at DESC)
+Index('ix_services_active_order_created_at', Service.active, Service.order, Service.created_at.desc())
+Index('ix_services_active_featured_order_created_at', Service.active, Service.featured, Service.order, Service.created_at.desc())
+
+
 class Tool(Base):
     __tablename__ = 'tools'
     
@@ -211,8 +234,8 @@ class Tool(Base):
     rating = Column(Float, nullable=True)
     
     # Status
-    active = Column(Boolean, default=True, index=True)
-    featured = Column(Boolean, default=False, index=True)
+    active = Column(Boolean, default=True)
+    featured = Column(Boolean, default=False)
     order = Column(Integer, default=0)
     
     # Timestamps
@@ -220,6 +243,11 @@ class Tool(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
 
+# Public list shapes: active (+ category) filter, then (order ASC, created_at DESC)
+Index('ix_tools_active_order_created_at', Tool.active, Tool.order, Tool.created_at.desc())
+Index('ix_tools_active_category_order_created_at', Tool.active, Tool.category, Tool.order, Tool.created_at.desc())
+
+
 class Asset(Base):
     """Track uploaded images and files"""
     __tablename__ = 'assets'
@@ -263,3 +291,80 @@ class ResumeDownload(Base):
     filename = Column(String(200), nullable=False)
     count = Column(Integer, default=0)
     last_download_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class ContentVersion(Base):
+    """Per-entity-type content version, bumped by every admin write (drives ETags and cache keys)"""
+    __tablename__ = 'content_versions'
+
+    entity = Column(String(50), primary_key=True)  # blogs, projects, services, tools, categories, tags
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class SiteStats(Base):
+    """Single-row summary behind /api/stats, kept current by admin writes and counter flushes"""
+    __tablename__ = 'site_stats'
+
+    id = Column(Integer, primary_key=True)  # always 1
+    blogs = Column(Integer, nullable=False, default=0)
+    projects = Column(Integer, nullable=False, default=0)
+    services = Column(Integer, nullable=False, default=0)
+    tools = Column(Integer, nullable=False, default=0)
+    blog_views = Column(Integer, nullable=False, default=0)
+    project_views = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class RelatedItem(Base):
+    """Precomputed top-K related blogs/projects for one published blog or project"""
+    __tablename__ = 'related_items'
+    __table_args__ = (
+        Index('ix_related_items_source_slug_rank', 'source_type', 'source_slug', 'rank'),
+        Index('ix_related_items_source_id', 'source_type', 'source_id'),
+        Index('ix_related_items_target', 'target_type', 'target_id'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    source_type = Column(String(20), nullable=False)  # blogs, projects
+    source_id = Column(Integer, nullable=False)
+    source_slug = Column(String(200), nullable=False)
+    rank = Column(Integer, nullable=False)  # 1 = most related
+
+    # Target card fields are denormalized so serving is a single indexed read
+    target_type = Column(String(20), nullable=False)
+    target_id = Column(Integer, nullable=False)
+    target_slug = Column(String(200), nullable=False)
+    target_title = Column(String(200), nullable=False)
+    target_summary = Column(Text, nullable=True)  # blog excerpt / project description
+    target_thumbnail = Column(String(500), nullable=True)
+    score = Column(Float, nullable=False)
+
+
+class RelatedFeature(Base):
+    """One scoring feature (tag, category or title/summary term) of a published blog or project
+
+    The score of two items is the sum of weight products over their shared features.
+    """
+    __tablename__ = 'related_features'
+    __table_args__ = (
+        Index('ix_related_features_source', 'source_type', 'source_id'),
+    )
+
+    feature = Column(String(100), primary_key=True)  # "t:<tag id>", "c:<category id>", "w:<term>"
+    source_type = Column(String(20), primary_key=True)  # blogs, projects
+    source_id = Column(Integer, primary_key=True)
+    weight = Column(Float, nullable=False)  # 0 for terms too common to score (still counted for IDF)
+
+
+class ChatSession(Base):
+    """Server-side chatbot conversation: recent turns plus a running summary of older ones"""
+    __tablename__ = 'chat_sessions'
+
+    id = Column(String(64), primary_key=True)  # issued session id, or derived from the client's user_id
+    summary = Column(Text, nullable=False, default="")
+    turns = Column(Text, nullable=False, default="[]")  # JSON [[role, text], ...], oldest first
+    tokens = Column(Integer, nullable=False, default=0)  # estimated tokens in turns
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
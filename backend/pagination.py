@@ -0,0 +1,102 @@
+"""
+Keyset (cursor) pagination helpers for the public list endpoints
+Cursors are opaque base64url tokens encoding (published_at, id) of the last row served
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, tuple_
+
+
+def encode_cursor(published_at: Optional[datetime], row_id: int) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor"""
+    raw = json.dumps([published_at.isoformat() if published_at else None, row_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """Decode a cursor produced by encode_cursor, raising 400 if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        published_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(row_id, int):
+            raise ValueError("cursor id must be an integer")
+        return (datetime.fromisoformat(published_at) if published_at else None), row_id
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_order(model: Any) -> Tuple[Any, Any]:
+    """Ordering shared by offset and cursor mode: newest first, NULL dates last, id tiebreak"""
+    return model.published_at.desc().nulls_last(), model.id.desc()
+
+
+def after_dated(model: Any, published_at: datetime, row_id: int) -> Any:
+    """Dated rows that sort after the cursor (index-friendly row-value range)"""
+    return and_(
+        model.published_at.is_not(None),
+        tuple_(model.published_at, model.id) < tuple_(published_at, row_id)
+    )
+
+
+def after_undated(model: Any, row_id: Optional[int]) -> Any:
+    """Rows without a published_at that sort after the cursor (they come last, by id desc)"""
+    if row_id is None:
+        return model.published_at.is_(None)
+    return and_(model.published_at.is_(None), model.id < row_id)
+
+
+def next_cursor(rows: list, limit: int) -> Optional[str]:
+    """Cursor for the page after rows, or None when rows (fetched with limit + 1) is the last page"""
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return encode_cursor(last.published_at, last.id)
+
+
+async def fetch_page(
+    db: Any,
+    query: Any,
+    model: Any,
+    skip: int,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[list, Optional[str]]:
+    """Run query in offset or cursor mode and return (rows, next_cursor)
+
+    Cursor mode never scans skipped rows: dated rows are read with a row-value
+    range on (published_at, id), then undated rows follow ordered by id.
+    """
+    if not cursor:
+        result = await db.execute(
+            query.order_by(*keyset_order(model)).offset(skip).limit(limit + 1)
+        )
+        rows = list(result.scalars().all())
+        return rows[:limit], next_cursor(rows, limit)
+
+    if skip:
+        raise HTTPException(status_code=400, detail="cursor cannot be combined with skip")
+
+    cursor_at, cursor_id = decode_cursor(cursor)
+    rows = []
+
+    if cursor_at is not None:
+        result = await db.execute(
+            query.where(after_dated(model, cursor_at, cursor_id))
+            .order_by(*keyset_order(model))
+            .limit(limit + 1)
+        )
+        rows = list(result.scalars().all())
+
+    if len(rows) <= limit:
+        result = await db.execute(
+            query.where(after_undated(model, cursor_id if cursor_at is None else None))
+            .order_by(model.id.desc())
+            .limit(limit + 1 - len(rows))
+        )
+        rows.extend(result.scalars().all())
+
+    return rows[:limit], next_cursor(rows, limit)
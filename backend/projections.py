@@ -0,0 +1,69 @@
+"""
+Projections (summary / full / sparse fieldsets) for the public list endpoints
+Only the columns a projection returns are read from the database (load_only),
+so heavy text columns like Blog.content never leave disk for card grids.
+Rows are dumped with the compiled serializers, not validated per row.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy.orm import load_only
+
+from models import Blog, Project
+from serializers import serializer_for
+from schemas import BlogResponse, BlogSummaryResponse, ProjectResponse, ProjectSummaryResponse
+
+PROJECTIONS = ("summary", "full")
+
+Serializer = Callable[[Any], Dict[str, Any]]
+
+
+class Projection:
+    """Maps a projection name or a fields= list to loader options and a row serializer"""
+
+    # Always loaded: identity plus the keyset pagination sort key
+    required_columns = ("id", "published_at")
+
+    def __init__(self, model: Any, full_schema: Type[BaseModel], summary_schema: Type[BaseModel]):
+        self.model = model
+        self.full_schema = full_schema
+        self.schemas = {"full": full_schema, "summary": summary_schema}
+        self.allowed_fields = tuple(full_schema.model_fields)
+
+    def resolve(self, projection: str, fields: Optional[str]) -> Tuple[Any, Serializer]:
+        """Return (load_only option, serializer) for a request
+
+        fields= takes precedence over the named projection; id and slug are
+        always included so clients can link to the detail page.
+        """
+        if fields:
+            names = self._parse_fields(fields)
+            return self._load_only(names), serializer_for(self.full_schema, tuple(names)).to_dict
+
+        schema = self.schemas[projection]
+        return self._load_only(list(schema.model_fields)), serializer_for(schema).to_dict
+
+    @staticmethod
+    def normalize_fields(fields: Optional[str]) -> Optional[str]:
+        """Canonical form of a fields= value for cache keys"""
+        if not fields:
+            return None
+        return ",".join(sorted({name.strip() for name in fields.split(",") if name.strip()}))
+
+    def _parse_fields(self, fields: str) -> List[str]:
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = sorted(set(requested) - set(self.allowed_fields))
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+        names = ["id", "slug"] + [name for name in requested if name not in ("id", "slug")]
+        return list(dict.fromkeys(names))
+
+    def _load_only(self, names: List[str]) -> Any:
+        columns = dict.fromkeys(list(self.required_columns) + names)
+        return load_only(*(getattr(self.model, name) for name in columns))
+
+
+blog_projection = Projection(Blog, BlogResponse, BlogSummaryResponse)
+project_projection = Projection(Project, ProjectResponse, ProjectSummaryResponse)
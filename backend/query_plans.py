@@ -0,0 +1,141 @@
+"""
+EXPLAIN-plan regression check for the public query shapes
+Each entry mirrors a query built by routes_public / bundle / related and names
+the index (or acceptable alternatives) its plan must use; ordered lists must
+also be answered in index order, with no "USE TEMP B-TREE FOR ORDER BY" step.
+SQLite only for now.
+
+Check the configured database:  python query_plans.py
+(exits non-zero when a plan regresses, so it can gate a deploy or CI job)
+"""
+import asyncio
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from models import Blog, Project, Service, Tool, Category, Tag, RelatedItem, blog_tags
+from pagination import after_dated, keyset_order
+
+# name -> (statement builder, indexes the plan may use (one must appear), whether ORDER BY must come from the index)
+QueryShape = Tuple[Callable[[], Any], Tuple[str, ...], bool]
+
+PUBLIC_QUERIES: Dict[str, QueryShape] = {
+    "blogs list": (
+        lambda: select(Blog).where(Blog.published == True).order_by(*keyset_order(Blog)).limit(11),
+        ("ix_blogs_published_published_at_id",), True,
+    ),
+    "blogs list (cursor)": (
+        lambda: select(Blog).where(Blog.published == True)
+        .where(after_dated(Blog, datetime(2024, 1, 1), 100)).order_by(*keyset_order(Blog)).limit(11),
+        ("ix_blogs_published_published_at_id",), True,
+    ),
+    "blogs featured": (
+        lambda: select(Blog).where(Blog.published == True, Blog.featured == True)
+        .order_by(*keyset_order(Blog)).limit(6),
+        ("ix_blogs_published_featured_published_at_id",), True,
+    ),
+    "blogs by category": (
+        lambda: select(Blog).join(Category).where(Blog.published == True, Category.slug == "ai")
+        .order_by(*keyset_order(Blog)).limit(11),
+        ("ix_blogs_category_id_published_published_at_id",), True,
+    ),
+    "blogs by tag": (
+        lambda: select(Blog).join(Blog.tags).where(Blog.published == True, Tag.slug == "python")
+        .order_by(*keyset_order(Blog)).limit(11),
+        # Either walk published blogs in order probing (blog_id, tag_id), or start from the tag
+        ("sqlite_autoindex_blog_tags_1", "ix_blog_tags_tag_id"), False,
+    ),
+    "blog tags": (
+        lambda: select(blog_tags.c.tag_id).where(blog_tags.c.blog_id == 1),
+        ("sqlite_autoindex_blog_tags_1",), False,
+    ),
+    "blog detail": (
+        lambda: select(Blog).where(Blog.slug == "post", Blog.published == True),
+        ("ix_blogs_slug",), False,
+    ),
+    "projects list": (
+        lambda: select(Project).where(Project.published == True).order_by(*keyset_order(Project)).limit(11),
+        ("ix_projects_published_published_at_id",), True,
+    ),
+    "projects featured": (
+        lambda: select(Project).where(Project.published == True, Project.featured == True)
+        .order_by(*keyset_order(Project)).limit(6),
+        ("ix_projects_published_featured_published_at_id",), True,
+    ),
+    "projects by category": (
+        lambda: select(Project).join(Category).where(Project.published == True, Category.slug == "ai")
+        .order_by(*keyset_order(Project)).limit(11),
+        ("ix_projects_category_id_published_published_at_id",), True,
+    ),
+    "services list": (
+        lambda: select(Service).where(Service.active == True)
+        .order_by(Service.order.asc(), Service.created_at.desc()),
+        ("ix_services_active_order_created_at",), True,
+    ),
+    "services featured": (
+        lambda: select(Service).where(Service.active == True, Service.featured == True)
+        .order_by(Service.order.asc(), Service.created_at.desc()),
+        ("ix_services_active_featured_order_created_at",), True,
+    ),
+    "tools list": (
+        lambda: select(Tool).where(Tool.active == True).order_by(Tool.order.asc(), Tool.created_at.desc()),
+        ("ix_tools_active_order_created_at",), True,
+    ),
+    "tools by category": (
+        lambda: select(Tool).where(Tool.active == True, Tool.category == "AI")
+        .order_by(Tool.order.asc(), Tool.created_at.desc()),
+        ("ix_tools_active_category_order_created_at",), True,
+    ),
+    "related": (
+        lambda: select(RelatedItem)
+        .where(RelatedItem.source_type == "blogs", RelatedItem.source_slug == "post")
+        .order_by(RelatedItem.rank),
+        ("ix_related_items_source_slug_rank",), True,
+    ),
+}
+
+
+async def explain(conn: AsyncConnection, statement: Any) -> List[str]:
+    """EXPLAIN QUERY PLAN detail lines for a statement"""
+    sql = str(statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    result = await conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+    return [row[-1] for row in result.all()]
+
+
+async def check_query_plans(conn: AsyncConnection) -> Dict[str, Optional[str]]:
+    """{query name: problem or None} for every public query shape"""
+    report: Dict[str, Optional[str]] = {}
+    for name, (build, indexes, ordered) in PUBLIC_QUERIES.items():
+        plan = await explain(conn, build())
+        if not any(index in line for index in indexes for line in plan):
+            report[name] = f"does not use {' or '.join(indexes)}: {plan}"
+        elif ordered and any("TEMP B-TREE FOR ORDER BY" in line for line in plan):
+            report[name] = f"sorts after filtering: {plan}"
+        else:
+            report[name] = None
+    return report
+
+
+async def _main() -> None:
+    import sys
+    from database import engine
+
+    if engine.dialect.name != "sqlite":
+        print(f"ℹ️  Query plan check supports SQLite only (got {engine.dialect.name})")
+        await engine.dispose()
+        return
+
+    async with engine.connect() as conn:
+        report = await check_query_plans(conn)
+    await engine.dispose()
+
+    for name, problem in report.items():
+        print(f"{'❌' if problem else '✅'} {name}" + (f": {problem}" if problem else ""))
+    if any(report.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,598 @@
+"""
+Related-content recommendations for blog and project detail pages
+Every published blog and project keeps its top-K neighbors (of either type)
+in related_items, scored on shared tags, same category and, optionally,
+TF-IDF similarity of title + excerpt/description. Each item's features and
+their weights are stored in related_features, so an admin write rescores only
+the written item with indexed lookups: its own list is recomputed, neighbors
+whose K-th score it now beats take it in place of their last row, and lists
+that pointed at it are recomputed. Items sharing only the category are scored
+RELATED_CATEGORY_CANDIDATES at a time (newest first). IDF weights of
+untouched items drift slightly until the next full rebuild, which runs in a
+background task when categories or tags are deleted and on first start.
+
+Rebuild every list from scratch:  python related.py rebuild
+"""
+import asyncio
+import heapq
+import itertools
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from config import settings
+from content_versions import bump_content_versions
+from database import AsyncSessionLocal
+from models import Blog, Project, RelatedFeature, RelatedItem, blog_tags, project_tags
+
+# Score = weighted sum of tag overlap (cosine over tag sets), same category and text similarity
+TAG_WEIGHT = 3.0
+CATEGORY_WEIGHT = 1.0
+TEXT_WEIGHT = 2.0
+
+# Terms found in more than this share of items say nothing about relatedness
+MAX_TERM_DOCUMENT_RATIO = 0.5
+
+# related_features.feature prefixes
+TAG_FEATURE = "t:"
+CATEGORY_FEATURE = "c:"
+TERM_FEATURE = "w:"
+
+# Longer "words" are URLs, hashes and the like (and would not fit related_features.feature)
+MAX_TERM_LENGTH = 64
+
+# Scores are stored and compared at this precision, so float noise cannot reorder ties
+SCORE_DECIMALS = 6
+
+# Ids per IN (...) list, well under SQLite's host-parameter limit
+ID_BATCH_SIZE = 500
+
+STOPWORDS = frozenset(
+    "the and for with that this from are was were you your our how what why when "
+    "into about using use can will not but all any its has have had".split()
+)
+
+ItemKey = Tuple[str, int]
+Card = Tuple[str, str, Optional[str], Optional[str]]  # slug, title, summary, thumbnail
+
+SOURCES = {
+    "blogs": (Blog, Blog.excerpt, blog_tags.c.blog_id, blog_tags),
+    "projects": (Project, Project.description, project_tags.c.project_id, project_tags),
+}
+
+
+class _Item:
+    """Features of one published blog or project"""
+    __slots__ = ("key", "slug", "title", "summary", "thumbnail", "category_id", "tags", "features")
+
+    def __init__(self, key: ItemKey, slug: str, title: str, summary: Optional[str],
+                 thumbnail: Optional[str], category_id: Optional[int]):
+        self.key = key
+        self.slug = slug
+        self.title = title
+        self.summary = summary
+        self.thumbnail = thumbnail
+        self.category_id = category_id
+        self.tags: Set[int] = set()
+        self.features: Dict[str, float] = {}
+
+    @property
+    def card(self) -> Card:
+        return self.slug, self.title, self.summary, self.thumbnail
+
+    def terms(self) -> Counter:
+        # Title words are counted twice: they describe the item better than the summary
+        return Counter(_tokenize(self.title, self.title, self.summary))
+
+
+def _features(item: _Item, terms: Mapping[str, int], document_frequency: Mapping[str, int],
+              total: int) -> Dict[str, float]:
+    """Feature weights of item; the product of two items' weights for a shared feature is its score
+
+    Each kind's weight carries the square root of its score weight, and tag weights
+    1/sqrt(len(tags)), so the summed products are the weighted tag cosine, category
+    match and TF-IDF cosine. document_frequency counts item itself.
+    """
+    features = {f"{TAG_FEATURE}{tag_id}": math.sqrt(TAG_WEIGHT / len(item.tags)) for tag_id in item.tags}
+    if item.category_id is not None:
+        features[f"{CATEGORY_FEATURE}{item.category_id}"] = math.sqrt(CATEGORY_WEIGHT)
+
+    max_documents = max(2, int(total * MAX_TERM_DOCUMENT_RATIO))
+    weights = {
+        term: count * (math.log((1 + total) / (1 + document_frequency[term])) + 1)
+        if document_frequency[term] <= max_documents else 0.0
+        for term, count in terms.items()
+    }
+    norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+    for term, weight in weights.items():
+        features[f"{TERM_FEATURE}{term}"] = math.sqrt(TEXT_WEIGHT) * weight / norm if norm else 0.0
+    return features
+
+
+def _top_k(scores: Dict[ItemKey, float], k: int) -> List[Tuple[ItemKey, float]]:
+    """The k best-scoring neighbors (ties broken by newest id)"""
+    return heapq.nlargest(k, scores.items(), key=lambda pair: (pair[1], pair[0][1]))
+
+
+def _list_rows(source: ItemKey, ranked: Sequence[Tuple[ItemKey, float]],
+               cards: Mapping[ItemKey, Card]) -> List[Dict[str, Any]]:
+    """related_items rows for source's list (targets without a card are skipped)"""
+    rows = []
+    for other, score in ranked:
+        if other not in cards:
+            continue
+        slug, title, summary, thumbnail = cards[other]
+        rows.append({
+            "source_type": source[0],
+            "source_id": source[1],
+            "source_slug": cards[source][0],
+            "rank": len(rows) + 1,
+            "target_type": other[0],
+            "target_id": other[1],
+            "target_slug": slug,
+            "target_title": title,
+            "target_summary": summary,
+            "target_thumbnail": thumbnail,
+            "score": score,
+        })
+    return rows
+
+
+class RelatedIndex:
+    """In-memory scoring index over all published blogs and projects (full rebuilds)
+
+    Posting lists (feature -> item positions and weights) are numpy arrays, so
+    scoring one item against the corpus is a few vectorized adds. Scores match
+    the SQL scoring of refresh_related() on the same features.
+    """
+
+    def __init__(self, items: Iterable[_Item], use_tfidf: bool = True, category_candidates: int = 50):
+        self.items: Dict[ItemKey, _Item] = {item.key: item for item in items}
+        self.category_candidates = category_candidates
+        self.keys: List[ItemKey] = list(self.items)
+        self._positions = {key: position for position, key in enumerate(self.keys)}
+        self._ids = np.fromiter((key[1] for key in self.keys), dtype=np.int64, count=len(self.keys))
+        type_ranks = {entity: rank for rank, entity in enumerate(sorted({key[0] for key in self.keys}))}
+        types = np.fromiter((type_ranks[key[0]] for key in self.keys), dtype=np.int64, count=len(self.keys))
+
+        terms = {key: item.terms() if use_tfidf else Counter() for key, item in self.items.items()}
+        document_frequency: Counter = Counter()
+        for counts in terms.values():
+            document_frequency.update(counts.keys())
+
+        postings: Dict[str, Tuple[List[int], List[float]]] = defaultdict(lambda: ([], []))
+        for position, (key, item) in enumerate(self.items.items()):
+            item.features = _features(item, terms[key], document_frequency, len(self.items))
+            for feature, weight in item.features.items():
+                if weight:
+                    postings[feature][0].append(position)
+                    postings[feature][1].append(weight)
+
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for feature, (positions, weights) in postings.items():
+            position_array = np.array(positions, dtype=np.int64)
+            weight_array = np.array(weights, dtype=np.float64)
+            if feature.startswith(CATEGORY_FEATURE):
+                # Newest first, like the ORDER BY source_id DESC, source_type DESC of _stored_scores()
+                order = np.lexsort((-types[position_array], -self._ids[position_array]))
+                position_array, weight_array = position_array[order], weight_array[order]
+            self._postings[feature] = (position_array, weight_array)
+
+    def scores(self, key: ItemKey) -> np.ndarray:
+        """Scores of key against every item, by position (0 for non-candidates and key itself)"""
+        position = self._positions[key]
+        scores = np.zeros(len(self.keys))
+        category = None
+        for feature, weight in self.items[key].features.items():
+            if not weight:
+                continue
+            if feature.startswith(CATEGORY_FEATURE):
+                category = (feature, weight)
+                continue
+            positions, weights = self._postings[feature]
+            scores[positions] += weight * weights
+        scores[position] = 0.0
+
+        if category is not None:
+            # Members already scored on tags or terms, plus the newest others
+            feature, weight = category
+            positions, weights = self._postings[feature]
+            scored = scores[positions] > 0
+            scored[np.flatnonzero(positions != position)[:self.category_candidates]] = True
+            scores[positions[scored]] += weight * weights[scored]
+        return np.round(scores, SCORE_DECIMALS)
+
+    def top_k(self, key: ItemKey, k: int) -> List[Tuple[ItemKey, float]]:
+        """The k best-scoring neighbors of key (ties broken by newest id)"""
+        scores = self.scores(key)
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            kth = np.partition(scores[candidates], -k)[-k]
+            candidates = candidates[scores[candidates] >= kth]
+        order = np.lexsort((-self._ids[candidates], -scores[candidates]))[:k]
+        return [(self.keys[position], float(scores[position])) for position in candidates[order]]
+
+    def feature_rows(self) -> List[Dict[str, Any]]:
+        """related_features rows of every item"""
+        return [
+            {"feature": feature, "source_type": key[0], "source_id": key[1], "weight": weight}
+            for key, item in self.items.items()
+            for feature, weight in item.features.items()
+        ]
+
+    def list_rows(self, k: int) -> List[Dict[str, Any]]:
+        """related_items rows of every item's top-k list"""
+        cards = {key: item.card for key, item in self.items.items()}
+        return [row for key in self.keys for row in _list_rows(key, self.top_k(key, k), cards)]
+
+
+def _tokenize(*texts: Optional[str]) -> List[str]:
+    words = re.findall(r"[a-z0-9]+", " ".join(text or "" for text in texts).lower())
+    return [
+        word for word in words
+        if 2 < len(word) <= MAX_TERM_LENGTH and word not in STOPWORDS
+    ]
+
+
+def _batches(values: Sequence[Any], size: int = ID_BATCH_SIZE) -> Iterable[Sequence[Any]]:
+    for offset in range(0, len(values), size):
+        yield values[offset:offset + size]
+
+
+def _by_entity(keys: Iterable[ItemKey]) -> Dict[str, List[int]]:
+    ids: Dict[str, List[int]] = defaultdict(list)
+    for entity, item_id in keys:
+        ids[entity].append(item_id)
+    return ids
+
+
+async def _load_items(db: AsyncSession, entity: str, item_id: Optional[int] = None) -> List[_Item]:
+    """Published items of entity (all, or just item_id) with their tags"""
+    model, summary, tag_owner, association = SOURCES[entity]
+    query = (
+        select(model.id, model.slug, model.title, summary, model.thumbnail_image, model.category_id)
+        .where(model.published == True)
+    )
+    tags_query = select(tag_owner, association.c.tag_id)
+    if item_id is not None:
+        query = query.where(model.id == item_id)
+        tags_query = tags_query.where(tag_owner == item_id)
+
+    result = await db.execute(query)
+    items = {
+        row_id: _Item((entity, row_id), slug, title, text, thumbnail, category_id)
+        for row_id, slug, title, text, thumbnail, category_id in result.all()
+    }
+    if items:
+        result = await db.execute(tags_query)
+        for owner_id, tag_id in result.all():
+            if owner_id in items and tag_id is not None:
+                items[owner_id].tags.add(tag_id)
+    return list(items.values())
+
+
+async def load_related_index(db: AsyncSession) -> RelatedIndex:
+    """Read the features of every published blog and project (4 queries) and score them in a thread"""
+    items = [item for entity in SOURCES for item in await _load_items(db, entity)]
+    return await asyncio.to_thread(
+        RelatedIndex, items, settings.RELATED_TFIDF_ENABLED, settings.RELATED_CATEGORY_CANDIDATES
+    )
+
+
+async def rebuild_related(db: AsyncSession) -> int:
+    """Recompute every feature and list (within the caller's transaction); returns the number of list rows"""
+    await db.flush()
+    index = await load_related_index(db)
+    features = await asyncio.to_thread(index.feature_rows)
+    rows = await asyncio.to_thread(index.list_rows, settings.RELATED_TOP_K)
+
+    await db.execute(delete(RelatedFeature))
+    await db.execute(delete(RelatedItem))
+    if features:
+        await db.execute(insert(RelatedFeature), features)
+    if rows:
+        await db.execute(insert(RelatedItem), rows)
+    return len(rows)
+
+
+async def _published_total(db: AsyncSession) -> int:
+    result = await db.execute(
+        select(func.count(Blog.id)).where(Blog.published == True)
+        .union_all(select(func.count(Project.id)).where(Project.published == True))
+    )
+    return sum(result.scalars().all())
+
+
+async def _stored_features(db: AsyncSession, item: _Item) -> Dict[str, float]:
+    """Features of item weighted against the stored document frequencies"""
+    terms = item.terms() if settings.RELATED_TFIDF_ENABLED else Counter()
+    document_frequency: Counter = Counter({term: 1 for term in terms})
+    for batch in _batches([f"{TERM_FEATURE}{term}" for term in terms]):
+        result = await db.execute(
+            select(RelatedFeature.feature, func.count())
+            .where(RelatedFeature.feature.in_(batch))
+            .group_by(RelatedFeature.feature)
+        )
+        for feature, documents in result.all():
+            document_frequency[feature[len(TERM_FEATURE):]] += documents
+    return _features(item, terms, document_frequency, await _published_total(db))
+
+
+async def _stored_scores(db: AsyncSession, key: ItemKey) -> Dict[ItemKey, float]:
+    """Score of every candidate of key from related_features (same rules as RelatedIndex.scores)"""
+    mine = aliased(RelatedFeature)
+    other = aliased(RelatedFeature)
+    is_category = mine.feature.like(f"{CATEGORY_FEATURE}%")
+    result = await db.execute(
+        select(other.source_type, other.source_id, func.sum(mine.weight * other.weight))
+        .join(other, other.feature == mine.feature)
+        .where(mine.source_type == key[0], mine.source_id == key[1], mine.weight > 0, other.weight > 0)
+        .group_by(other.source_type, other.source_id)
+        # Items sharing only the category are added below, newest first
+        .having(func.sum(case((is_category, 0), else_=1)) > 0)
+    )
+    scores = {(source_type, source_id): score for source_type, source_id, score in result.all()}
+    scores.pop(key, None)
+
+    result = await db.execute(
+        select(mine.feature, mine.weight)
+        .where(mine.source_type == key[0], mine.source_id == key[1], is_category, mine.weight > 0)
+    )
+    for feature, weight in result.all():
+        result = await db.execute(
+            select(RelatedFeature.source_type, RelatedFeature.source_id, RelatedFeature.weight)
+            .where(RelatedFeature.feature == feature, RelatedFeature.weight > 0)
+            .order_by(RelatedFeature.source_id.desc(), RelatedFeature.source_type.desc())
+            .limit(settings.RELATED_CATEGORY_CANDIDATES + 1)
+        )
+        newest = (
+            ((source_type, source_id), other_weight)
+            for source_type, source_id, other_weight in result.all()
+            if (source_type, source_id) != key
+        )
+        for other_key, other_weight in itertools.islice(newest, settings.RELATED_CATEGORY_CANDIDATES):
+            if other_key not in scores:
+                scores[other_key] = weight * other_weight
+    return {other: round(score, SCORE_DECIMALS) for other, score in scores.items()}
+
+
+async def _load_cards(db: AsyncSession, keys: Iterable[ItemKey]) -> Dict[ItemKey, Card]:
+    """Card fields of the published items among keys"""
+    cards: Dict[ItemKey, Card] = {}
+    for entity, ids in _by_entity(keys).items():
+        model, summary, _, _ = SOURCES[entity]
+        for batch in _batches(ids):
+            result = await db.execute(
+                select(model.id, model.slug, model.title, summary, model.thumbnail_image)
+                .where(model.id.in_(batch), model.published == True)
+            )
+            for row_id, slug, title, text, thumbnail in result.all():
+                cards[(entity, row_id)] = (slug, title, text, thumbnail)
+    return cards
+
+
+async def _load_lists(db: AsyncSession, sources: Iterable[ItemKey]) -> Dict[ItemKey, List[RelatedItem]]:
+    """Stored rows of each source's list, best first"""
+    lists: Dict[ItemKey, List[RelatedItem]] = defaultdict(list)
+    for entity, ids in _by_entity(sources).items():
+        for batch in _batches(ids):
+            result = await db.execute(
+                select(RelatedItem)
+                .where(RelatedItem.source_type == entity, RelatedItem.source_id.in_(batch))
+                .order_by(RelatedItem.source_id, RelatedItem.rank)
+            )
+            for row in result.scalars().all():
+                lists[(row.source_type, row.source_id)].append(row)
+    return lists
+
+
+async def _last_entries(db: AsyncSession, sources: Iterable[ItemKey], k: int) -> Dict[ItemKey, Tuple[float, int]]:
+    """(score, target id) of the k-th row of each full list; shorter lists are absent"""
+    last: Dict[ItemKey, Tuple[float, int]] = {}
+    for entity, ids in _by_entity(sources).items():
+        for batch in _batches(ids):
+            result = await db.execute(
+                select(RelatedItem.source_id, RelatedItem.score, RelatedItem.target_id)
+                .where(RelatedItem.source_type == entity, RelatedItem.source_id.in_(batch), RelatedItem.rank == k)
+            )
+            for source_id, score, target_id in result.all():
+                last[(entity, source_id)] = (score, target_id)
+    return last
+
+
+async def _delete_lists(db: AsyncSession, sources: Iterable[ItemKey]) -> None:
+    for entity, ids in _by_entity(sources).items():
+        for batch in _batches(ids):
+            await db.execute(
+                delete(RelatedItem).where(RelatedItem.source_type == entity, RelatedItem.source_id.in_(batch))
+            )
+
+
+async def refresh_related(db: AsyncSession, entity: str, item_id: int) -> None:
+    """Update the lists one created/updated/deleted blog or project can affect
+
+    Its features are rewritten and its own list recomputed. Lists that pointed
+    at it are re-ranked with its new card and score, or recomputed if the score
+    dropped (another item may now rank higher); every other item it now scores
+    against takes it in only if it beats that list's last entry.
+    """
+    await db.flush()
+    key = (entity, item_id)
+    k = settings.RELATED_TOP_K
+
+    result = await db.execute(
+        select(RelatedItem.source_type, RelatedItem.source_id, RelatedItem.score)
+        .where(RelatedItem.target_type == entity, RelatedItem.target_id == item_id)
+    )
+    pointing = {(source_type, source_id): score for source_type, source_id, score in result.all()}
+    await db.execute(
+        delete(RelatedFeature).where(RelatedFeature.source_type == entity, RelatedFeature.source_id == item_id)
+    )
+
+    scores: Dict[ItemKey, float] = {}
+    ranked: Dict[ItemKey, List[Tuple[ItemKey, float]]] = {}
+    items = await _load_items(db, entity, item_id)
+    if items:
+        item = items[0]
+        features = await _stored_features(db, item)
+        if features:
+            await db.execute(insert(RelatedFeature), [
+                {"feature": feature, "source_type": entity, "source_id": item_id, "weight": weight}
+                for feature, weight in features.items()
+            ])
+        scores = await _stored_scores(db, key)
+        ranked[key] = _top_k(scores, k)
+
+        neighbors = [other for other in scores if other not in pointing]
+        last = await _last_entries(db, neighbors, k)
+        entering = [other for other in neighbors if other not in last or (scores[other], item_id) > last[other]]
+        stored = await _load_lists(db, entering)
+        for other in entering:
+            current = [((row.target_type, row.target_id), row.score) for row in stored.get(other, [])]
+            ranked[other] = _top_k({**dict(current), key: scores[other]}, k)
+
+    # A list keeps its other entries while the item scores at least as well as before
+    kept = [source for source, score in pointing.items() if source != key and scores.get(source, -1.0) >= score]
+    stored = await _load_lists(db, kept)
+    for source in kept:
+        current = [((row.target_type, row.target_id), row.score) for row in stored.get(source, [])]
+        ranked[source] = _top_k({**dict(current), key: scores[source]}, k)
+    for source in pointing.keys() - set(kept) - {key}:
+        ranked[source] = _top_k(await _stored_scores(db, source), k)
+
+    ranked_keys = {target for ranked_list in ranked.values() for target, _ in ranked_list}
+    cards = await _load_cards(db, set(ranked) | ranked_keys)
+    await _delete_lists(db, set(ranked) | set(pointing) | {key})
+    rows = [
+        row
+        for source, ranked_list in ranked.items()
+        if source in cards
+        for row in _list_rows(source, ranked_list, cards)
+    ]
+    if rows:
+        await db.execute(insert(RelatedItem), rows)
+
+    # A rebuild running now scored the corpus as it was before this write
+    if related_rebuilder.running:
+        related_rebuilder.schedule()
+
+
+async def forget_feature(db: AsyncSession, prefix: str, feature_id: int) -> None:
+    """Drop a deleted tag's or category's feature rows (lists catch up at the next rebuild)"""
+    await db.execute(delete(RelatedFeature).where(RelatedFeature.feature == f"{prefix}{feature_id}"))
+
+
+class RelatedRebuilder:
+    """Full rebuilds in a background task, one at a time
+
+    A schedule() while a rebuild runs queues exactly one more run, so the last
+    write before it is always covered.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._again = False
+
+        self.runs = 0
+        self.errors = 0
+        self.last_rows: Optional[int] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def schedule(self) -> None:
+        if self.running:
+            self._again = True
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            self._again = False
+            try:
+                async with AsyncSessionLocal() as db:
+                    rows = await rebuild_related(db)
+                    await bump_content_versions(db, "blogs", "projects")
+                    await db.commit()
+                self.runs += 1
+                self.last_rows = rows
+                print(f"✅ Rebuilt related content index ({rows} rows)")
+            except Exception as e:
+                self.errors += 1
+                print(f"❌ Rebuilding related content failed: {e}")
+            if not self._again:
+                return
+
+    async def wait(self) -> None:
+        """Wait for the current rebuild (and the one queued after it) to finish"""
+        while self.running:
+            await asyncio.shield(self._task)
+
+    async def stop(self) -> None:
+        """Cancel a running rebuild (its transaction is rolled back)"""
+        if self.running:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"running": self.running, "runs": self.runs, "errors": self.errors, "last_rows": self.last_rows}
+
+
+async def related_index_missing(db: AsyncSession) -> bool:
+    """Whether there is published content but no stored features yet (first start, or upgraded from 0004)"""
+    existing = await db.execute(select(RelatedFeature.feature).limit(1))
+    if existing.first() is not None:
+        return False
+    return await _published_total(db) > 0
+
+
+async def ensure_related_index(db: AsyncSession) -> None:
+    """Build the features and lists now if they are missing (scripts; the app uses related_rebuilder)"""
+    if await related_index_missing(db):
+        count = await rebuild_related(db)
+        await db.commit()
+        print(f"✅ Built related content index ({count} rows)")
+
+
+async def get_related(db: AsyncSession, entity: str, slug: str) -> List[RelatedItem]:
+    """Stored top-K list for a published blog or project, best first"""
+    result = await db.execute(
+        select(RelatedItem)
+        .where(RelatedItem.source_type == entity, RelatedItem.source_slug == slug)
+        .order_by(RelatedItem.rank)
+    )
+    return list(result.scalars().all())
+
+
+# Global instance
+related_rebuilder = RelatedRebuilder()
+
+
+async def _main() -> None:
+    import sys
+    from database import engine
+
+    if sys.argv[1:] != ["rebuild"]:
+        print("Usage: python related.py rebuild")
+        return
+
+    async with AsyncSessionLocal() as db:
+        count = await rebuild_related(db)
+        await db.commit()
+    print(f"✅ Rebuilt related_items ({count} rows)")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,404 @@
+"""
+Retrieval over CMS content to ground chat answers
+Published blogs and projects and active services and tools are split into
+overlapping word windows, embedded locally (no network) and kept in a NumPy
+matrix of unit vectors; a question's top-k chunks by cosine similarity go into
+the prompt. The embedder is pluggable (RETRIEVAL_EMBEDDER: "hashing" or a
+"module:Class" path); the default hashes word unigrams and bigrams into
+RETRIEVAL_DIM signed buckets.
+
+The first build runs in a background task started with the app (questions
+asked before it finishes go ungrounded). An admin write re-embeds only the
+written item; other workers see the entity's content version change and
+re-embed just the items whose text changed on their next question. All
+chunking and embedding runs in a worker thread, off the event loop.
+
+Search from the command line:  python retrieval.py "what security tools do you have"
+"""
+import asyncio
+import hashlib
+import importlib
+import re
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from content_versions import get_content_state
+from database import ReadSessionLocal
+from models import Blog, Project, Service, Tool
+from related import STOPWORDS
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#.-]*[a-z0-9+#]|[a-z0-9]")
+
+ItemKey = Tuple[str, int]
+
+# entity -> (model, is_public, title column, text columns, page on the site)
+RETRIEVAL_ENTITIES: Dict[str, Tuple[Any, Any, Any, Tuple[Any, ...], Optional[str]]] = {
+    "blogs": (Blog, Blog.published == True, Blog.title, (Blog.excerpt, Blog.content), "/blog/{slug}"),
+    "projects": (Project, Project.published == True, Project.title,
+                 (Project.description, Project.long_description), None),
+    "services": (Service, Service.active == True, Service.title,
+                 (Service.description, Service.long_description, Service.features), "/services"),
+    "tools": (Tool, Tool.active == True, Tool.name, (Tool.description, Tool.category, Tool.features), "/devillabs"),
+}
+ENTITY_LABELS = {"blogs": "Blog", "projects": "Project", "services": "Service", "tools": "Tool"}
+
+
+def tokenize(text: str) -> List[str]:
+    return [word for word in _WORD.findall(text.lower()) if word not in STOPWORDS]
+
+
+@lru_cache(maxsize=200_000)
+def _bucket(feature: str, dim: int) -> Tuple[int, float]:
+    code = zlib.crc32(feature.encode())
+    return code % dim, (1.0 if code & 0x80000000 else -1.0)
+
+
+class HashingEmbedder:
+    """Signed feature hashing of word unigrams and bigrams, sublinear term weights"""
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            words = tokenize(text)
+            features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+            if not features:
+                continue
+            buckets = [_bucket(feature, self.dim) for feature in features]
+            indexes = np.fromiter((index for index, _ in buckets), dtype=np.int64, count=len(buckets))
+            signs = np.fromiter((sign for _, sign in buckets), dtype=np.float32, count=len(buckets))
+            counts = np.bincount(indexes, weights=signs, minlength=self.dim)
+            vectors[row] = np.sign(counts) * np.log1p(np.abs(counts))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+
+EMBEDDERS = {"hashing": HashingEmbedder}
+
+
+def load_embedder(name: str, dim: int) -> Any:
+    """A registered embedder, or a class given as "module:Class" taking dim"""
+    if name in EMBEDDERS:
+        return EMBEDDERS[name](dim)
+    module_name, _, class_name = name.partition(":")
+    if not class_name:
+        raise ValueError(f"Unknown RETRIEVAL_EMBEDDER: {name}")
+    return getattr(importlib.import_module(module_name), class_name)(dim)
+
+
+class Chunk:
+    """One window of an item's text"""
+    __slots__ = ("key", "title", "url", "text")
+
+    def __init__(self, key: ItemKey, title: str, url: Optional[str], text: str):
+        self.key = key
+        self.title = title
+        self.url = url
+        self.text = text
+
+
+def chunk_item(key: ItemKey, title: str, url: Optional[str], body: str,
+               words_per_chunk: int, overlap: int) -> List[Chunk]:
+    """Split an item's text into overlapping word windows"""
+    words = body.split()
+    step = max(1, words_per_chunk - overlap)
+    starts = range(0, max(len(words) - overlap, 1), step)
+    return [Chunk(key, title, url, " ".join(words[start:start + words_per_chunk])) for start in starts]
+
+
+class VectorIndex:
+    """Unit vectors in one growable matrix, top-k by dot product
+
+    Rows of an item are removed by moving the last rows into their place, so
+    the live rows stay contiguous and search is a single matrix-vector product.
+    """
+
+    def __init__(self, dim: int, capacity: int = 1024):
+        self.dim = dim
+        self.matrix = np.zeros((capacity, dim), dtype=np.float32)
+        self.chunks: List[Chunk] = []
+        self._rows: Dict[ItemKey, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def add(self, chunks: List[Chunk], vectors: np.ndarray) -> None:
+        needed = len(self.chunks) + len(chunks)
+        if needed > len(self.matrix):
+            grown = np.zeros((max(needed, 2 * len(self.matrix)), self.dim), dtype=np.float32)
+            grown[:len(self.chunks)] = self.matrix[:len(self.chunks)]
+            self.matrix = grown
+        start = len(self.chunks)
+        self.matrix[start:needed] = vectors
+        for offset, chunk in enumerate(chunks):
+            self._rows.setdefault(chunk.key, []).append(start + offset)
+        self.chunks.extend(chunks)
+
+    def remove(self, key: ItemKey) -> None:
+        for row in sorted(self._rows.pop(key, ()), reverse=True):
+            last = len(self.chunks) - 1
+            if row != last:
+                moved = self.chunks[last]
+                self.matrix[row] = self.matrix[last]
+                self.chunks[row] = moved
+                rows = self._rows[moved.key]
+                rows[rows.index(last)] = row
+            self.chunks.pop()
+
+    def search(self, vector: np.ndarray, k: int) -> List[Tuple[Chunk, float]]:
+        count = len(self.chunks)
+        if not count or k <= 0:
+            return []
+        scores = self.matrix[:count] @ vector
+        if k < count:
+            top = np.argpartition(scores, -k)[-k:]
+            top = top[np.argsort(scores[top])[::-1]]
+        else:
+            top = np.argsort(scores)[::-1]
+        return [(self.chunks[row], float(scores[row])) for row in top]
+
+
+class _Indexed:
+    __slots__ = ("stamp", "digest")
+
+    def __init__(self, stamp: Any, digest: str):
+        self.stamp = stamp
+        self.digest = digest
+
+
+class RetrievalIndex:
+    """CMS content chunks, kept in step with the content versions"""
+
+    def __init__(self, embedder: Any, top_k: int = 4, min_score: float = 0.1,
+                 chunk_words: int = 120, chunk_overlap: int = 20, max_context_chars: int = 3000,
+                 enabled: bool = True):
+        self.embedder = embedder
+        self.top_k = top_k
+        self.min_score = min_score
+        self.chunk_words = chunk_words
+        self.chunk_overlap = chunk_overlap
+        self.max_context_chars = max_context_chars
+        self.enabled = enabled
+
+        self.vectors = VectorIndex(embedder.dim)
+        self._items: Dict[ItemKey, _Indexed] = {}
+        self._versions: Dict[str, int] = {}
+        self._lock = asyncio.Lock()
+        self._warmup: Optional[asyncio.Task] = None
+
+        self.embedded_items = 0
+        self.searches = 0
+
+    @property
+    def warming(self) -> bool:
+        return self._warmup is not None and not self._warmup.done()
+
+    def start(self) -> None:
+        """Build the index in the background (startup does not wait for the embedding)"""
+        if self.enabled and self._warmup is None:
+            self._warmup = asyncio.create_task(self._warm())
+
+    async def _warm(self) -> None:
+        try:
+            async with ReadSessionLocal() as db:
+                await self.sync(db)
+            print(f"✅ Retrieval index built: {len(self.vectors)} chunks from {len(self._items)} items")
+        except Exception as e:
+            print(f"❌ Building the retrieval index failed: {e}")  # Questions retry the sync themselves
+
+    async def stop(self) -> None:
+        """Cancel a build still running at shutdown"""
+        if self._warmup is not None and not self._warmup.done():
+            self._warmup.cancel()
+            try:
+                await self._warmup
+            except asyncio.CancelledError:
+                pass
+
+    async def sync(self, db: AsyncSession) -> None:
+        """Apply content changes since the last sync"""
+        if not self.enabled:
+            return
+        async with self._lock:
+            state = await get_content_state(db, tuple(RETRIEVAL_ENTITIES))
+            for entity, version in state.versions:
+                if self._versions.get(entity) != version:
+                    await self._sync_entity(db, entity)
+                    self._versions[entity] = version
+
+    async def _sync_entity(self, db: AsyncSession, entity: str) -> None:
+        model, is_public, _, _, _ = RETRIEVAL_ENTITIES[entity]
+        # Counter flushes also move updated_at, so a changed stamp only means "compare the text"
+        result = await db.execute(
+            select(model.id, func.coalesce(model.updated_at, model.created_at)).where(is_public)
+        )
+        current = dict(result.all())
+
+        for key in [key for key in self._items if key[0] == entity and key[1] not in current]:
+            self.vectors.remove(key)
+            del self._items[key]
+
+        candidates = [
+            item_id for item_id, stamp in current.items()
+            if (entity, item_id) not in self._items
+            or self._items[(entity, item_id)].stamp != stamp
+        ]
+        for start in range(0, len(candidates), 500):
+            await self._index_items(db, entity, candidates[start:start + 500], current)
+
+    async def _index_items(self, db: AsyncSession, entity: str, ids: List[int], stamps: Dict[int, Any]) -> None:
+        model, _, title_column, text_columns, _ = RETRIEVAL_ENTITIES[entity]
+        result = await db.execute(
+            select(model.id, model.slug, title_column, *text_columns).where(model.id.in_(ids))
+        )
+        changed, chunks, vectors = await asyncio.to_thread(self._embed_rows, entity, result.all())
+        for item_id, digest in changed.items():
+            self.vectors.remove((entity, item_id))
+            self._items[(entity, item_id)] = _Indexed(stamps[item_id], digest)
+        for item_id in set(ids) - changed.keys():
+            indexed = self._items.get((entity, item_id))
+            if indexed is not None:
+                indexed.stamp = stamps[item_id]
+        self.embedded_items += len(changed)
+        if chunks:
+            self.vectors.add(chunks, vectors)
+
+    def _embed_rows(self, entity: str, rows: Sequence[Any]) -> Tuple[Dict[int, str], List[Chunk], Any]:
+        """(digest of each item whose text changed, their chunks, the chunk vectors); runs in a thread"""
+        page = RETRIEVAL_ENTITIES[entity][4]
+        changed: Dict[int, str] = {}
+        chunks: List[Chunk] = []
+        for item_id, slug, title, *texts in rows:
+            key = (entity, item_id)
+            body = "\n".join(text for text in texts if text)
+            digest = hashlib.sha1(f"{slug}\n{title}\n{body}".encode()).hexdigest()
+            indexed = self._items.get(key)
+            if indexed is not None and indexed.digest == digest:
+                continue
+            changed[item_id] = digest
+            url = page.format(slug=slug) if page else None
+            chunks.extend(chunk_item(key, title, url, body, self.chunk_words, self.chunk_overlap))
+        if not chunks:
+            return changed, chunks, None
+        # Every window is embedded with its item's title, which says the most about it
+        texts = [f"{ENTITY_LABELS[entity]}: {chunk.title}\n{chunk.text}" for chunk in chunks]
+        return changed, chunks, self.embedder.embed(texts)
+
+    async def refresh(self, db: AsyncSession, entity: str, item_id: int) -> None:
+        """Re-embed the one item an admin write changed (logged, never raised: the write is committed)"""
+        # During the first build the write is picked up by the sync after it (its version moved)
+        if not self.enabled or self.warming:
+            return
+        try:
+            async with self._lock:
+                await self._refresh_item(db, entity, item_id)
+        except Exception as e:
+            print(f"❌ Retrieval index refresh failed for {entity} {item_id}: {e}")
+
+    async def _refresh_item(self, db: AsyncSession, entity: str, item_id: int) -> None:
+        model, is_public, _, _, _ = RETRIEVAL_ENTITIES[entity]
+        state = await get_content_state(db, (entity,))
+        stamp = (await db.execute(
+            select(func.coalesce(model.updated_at, model.created_at)).where(model.id == item_id, is_public)
+        )).first()
+        if stamp is None:
+            self.vectors.remove((entity, item_id))
+            self._items.pop((entity, item_id), None)
+        else:
+            await self._index_items(db, entity, [item_id], {item_id: stamp[0]})
+        # The write bumped the version once: if that is the only change since the last sync,
+        # the index is current; otherwise the next question syncs the rest
+        version = state.versions[0][1]
+        if self._versions.get(entity) == version - 1:
+            self._versions[entity] = version
+
+    def search(self, query: str, k: Optional[int] = None) -> List[Tuple[Chunk, float]]:
+        """Best chunks for query scoring at least min_score"""
+        self.searches += 1
+        vector = self.embedder.embed([query])[0]
+        hits = self.vectors.search(vector, k or self.top_k)
+        return [(chunk, score) for chunk, score in hits if score >= self.min_score]
+
+    async def context_for(self, db: AsyncSession, question: str) -> str:
+        """Prompt section with the content most relevant to question ("" when nothing matches)"""
+        if not self.enabled or self.warming:
+            return ""
+        await self.sync(db)
+        # A large matrix product would stall the event loop; the lock keeps syncs from moving rows meanwhile
+        async with self._lock:
+            hits = await asyncio.to_thread(self.search, question)
+        lines: List[str] = []
+        size = 0
+        for chunk, _ in hits:
+            source = f" ({chunk.url})" if chunk.url else ""
+            entry = f"[{ENTITY_LABELS[chunk.key[0]]}: {chunk.title}{source}]\n{chunk.text}"
+            if size + len(entry) > self.max_context_chars:
+                break
+            lines.append(entry)
+            size += len(entry)
+        if not lines:
+            return ""
+        return "Relevant Devil Labs content (use it if it helps answer):\n\n" + "\n\n".join(lines)
+
+    async def ground(self, question: str) -> str:
+        """question with the relevant content prepended (unchanged if retrieval is off or fails)"""
+        if not self.enabled:
+            return question
+        try:
+            async with ReadSessionLocal() as db:
+                context = await self.context_for(db, question)
+        except Exception as e:
+            print(f"⚠️  Retrieval skipped: {e}")
+            return question
+        return f"{context}\n\nQuestion: {question}" if context else question
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "embedder": type(self.embedder).__name__,
+            "dim": self.embedder.dim,
+            "warming": self.warming,
+            "items": len(self._items),
+            "chunks": len(self.vectors),
+            "matrix_bytes": self.vectors.matrix.nbytes,
+            "versions": dict(self._versions),
+            "embedded_items": self.embedded_items,
+            "searches": self.searches,
+        }
+
+
+# Global instance
+retrieval_index = RetrievalIndex(
+    load_embedder(settings.RETRIEVAL_EMBEDDER, settings.RETRIEVAL_DIM),
+    top_k=settings.RETRIEVAL_TOP_K,
+    min_score=settings.RETRIEVAL_MIN_SCORE,
+    chunk_words=settings.RETRIEVAL_CHUNK_WORDS,
+    chunk_overlap=settings.RETRIEVAL_CHUNK_OVERLAP,
+    max_context_chars=settings.RETRIEVAL_MAX_CONTEXT_CHARS,
+    enabled=settings.RETRIEVAL_ENABLED,
+)
+
+
+async def _main() -> None:
+    import sys
+    from database import AsyncSessionLocal, engine
+
+    question = " ".join(sys.argv[1:]) or "what do you offer"
+    async with AsyncSessionLocal() as db:
+        await retrieval_index.sync(db)
+    await engine.dispose()
+    print(f"✅ {len(retrieval_index.vectors)} chunks from {len(retrieval_index._items)} items")
+    for chunk, score in retrieval_index.search(question):
+        print(f"{score:.3f}  {ENTITY_LABELS[chunk.key[0]]}: {chunk.title}  {chunk.url or ''}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -2,7 +2,7 @@
 Admin API routes for CMS management
 Authentication required for all endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List, Optional, Any, Dict
@@ -23,6 +23,22 @@ from schemas import (
 )
 from auth import get_current_user, authenticate_admin, create_access_token
 from storage import storage_service
+from cache import response_cache
+from content_versions import bump_content_versions
+from site_stats import refresh_site_stats, reconcile_site_stats
+from related import (
+    CATEGORY_FEATURE, TAG_FEATURE, forget_feature, rebuild_related, refresh_related, related_rebuilder
+)
+from snapshot import api_snapshot
+from detail_cache import detail_cache
+from counters import counter_buffer
+from sql_metrics import sql_metrics
+from serializers import serializer_for
+from export import EXPORT_ENTITIES, content_exporter
+from chat_engine import chat_engine
+from chat_cache import answer_cache
+from retrieval import retrieval_index
+from chat_sessions import session_store
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 
@@ -56,8 +72,7 @@ async def get_all_blogs(
     result = await db.execute(
         select(Blog).order_by(Blog.created_at.desc())
     )
-    blogs = result.scalars().all()
-    return blogs
+    return serializer_for(BlogResponse).response(result.scalars().all())
 
 
 @router.get("/blogs/{slug}", response_model=BlogResponse)
@@ -109,8 +124,14 @@ async def create_blog(
         blog.tags = tag_result.scalars().all()
     
     db.add(blog)
+    await bump_content_versions(db, "blogs")
+    await refresh_site_stats(db, "blogs")
+    await refresh_related(db, "blogs", blog.id)
     await db.commit()
     await db.refresh(blog)
+    detail_cache.evict("blogs", blog.slug)
+    await api_snapshot.refresh(db, "blogs", [blog.slug])
+    await retrieval_index.refresh(db, "blogs", blog.id)
     
     return blog
 
@@ -129,6 +150,8 @@ async def update_blog(
     if not blog:
         raise HTTPException(status_code=404, detail="Blog not found")
     
+    old_slug = blog.slug
+    
     # Update fields
     update_data = blog_data.model_dump(exclude_unset=True, exclude={'tag_ids'})
     
@@ -151,8 +174,14 @@ async def update_blog(
     if blog_data.published and current_published_at is None:
         setattr(blog, 'published_at', datetime.now(timezone.utc))
     
+    await bump_content_versions(db, "blogs")
+    await refresh_site_stats(db, "blogs")
+    await refresh_related(db, "blogs", blog.id)
     await db.commit()
     await db.refresh(blog)
+    detail_cache.evict("blogs", old_slug, blog.slug)
+    await api_snapshot.refresh(db, "blogs", [old_slug, blog.slug])
+    await retrieval_index.refresh(db, "blogs", blog_id)
     
     return blog
 
@@ -170,8 +199,15 @@ async def delete_blog(
     if not blog:
         raise HTTPException(status_code=404, detail="Blog not found")
     
+    slug = blog.slug
     await db.delete(blog)
+    await bump_content_versions(db, "blogs")
+    await refresh_site_stats(db, "blogs")
+    await refresh_related(db, "blogs", blog_id)
     await db.commit()
+    detail_cache.evict("blogs", slug)
+    await api_snapshot.refresh(db, "blogs", [slug])
+    await retrieval_index.refresh(db, "blogs", blog_id)
     
     return {"message": "Blog deleted successfully"}
 
@@ -187,8 +223,7 @@ async def get_all_projects(
     result = await db.execute(
         select(Project).order_by(Project.created_at.desc())
     )
-    projects = result.scalars().all()
-    return projects
+    return serializer_for(ProjectResponse).response(result.scalars().all())
 
 
 
@@ -237,8 +272,14 @@ async def create_project(
         project.tags = tag_result.scalars().all()
     
     db.add(project)
+    await bump_content_versions(db, "projects")
+    await refresh_site_stats(db, "projects")
+    await refresh_related(db, "projects", project.id)
     await db.commit()
     await db.refresh(project)
+    detail_cache.evict("projects", project.slug)
+    await api_snapshot.refresh(db, "projects", [project.slug])
+    await retrieval_index.refresh(db, "projects", project.id)
     
     return project
 
@@ -257,6 +298,8 @@ async def update_project(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
+    old_slug = project.slug
+    
     update_data = project_data.model_dump(exclude_unset=True, exclude={'tag_ids'})
     
     for field, value in update_data.items():
@@ -273,8 +316,14 @@ async def update_project(
     if project_data.published and current_published_at is None:
         setattr(project, 'published_at', datetime.now(timezone.utc))
     
+    await bump_content_versions(db, "projects")
+    await refresh_site_stats(db, "projects")
+    await refresh_related(db, "projects", project.id)
     await db.commit()
     await db.refresh(project)
+    detail_cache.evict("projects", old_slug, project.slug)
+    await api_snapshot.refresh(db, "projects", [old_slug, project.slug])
+    await retrieval_index.refresh(db, "projects", project_id)
     
     return project
 
@@ -292,8 +341,15 @@ async def delete_project(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
+    slug = project.slug
     await db.delete(project)
+    await bump_content_versions(db, "projects")
+    await refresh_site_stats(db, "projects")
+    await refresh_related(db, "projects", project_id)
     await db.commit()
+    detail_cache.evict("projects", slug)
+    await api_snapshot.refresh(db, "projects", [slug])
+    await retrieval_index.refresh(db, "projects", project_id)
     
     return {"message": "Project deleted successfully"}
 
@@ -309,8 +365,7 @@ async def get_all_services(
     result = await db.execute(
         select(Service).order_by(Service.order.asc(), Service.created_at.desc())
     )
-    services = result.scalars().all()
-    return services
+    return serializer_for(ServiceResponse).response(result.scalars().all())
 
 
 @router.get("/services/{slug}", response_model=ServiceResponse)
@@ -347,8 +402,13 @@ async def create_service(
     service = Service(**service_data.model_dump(), slug=slug)
     
     db.add(service)
+    await bump_content_versions(db, "services")
+    await refresh_site_stats(db, "services")
     await db.commit()
     await db.refresh(service)
+    detail_cache.evict("services", service.slug)
+    await api_snapshot.refresh(db, "services", [service.slug])
+    await retrieval_index.refresh(db, "services", service.id)
     
     return service
 
@@ -367,6 +427,8 @@ async def update_service(
     if not service:
         raise HTTPException(status_code=404, detail="Service not found")
     
+    old_slug = service.slug
+    
     update_data = service_data.model_dump(exclude_unset=True)
     
     for field, value in update_data.items():
@@ -375,8 +437,13 @@ async def update_service(
     if service_data.title:
         setattr(service, 'slug', slugify(service_data.title))
     
+    await bump_content_versions(db, "services")
+    await refresh_site_stats(db, "services")
     await db.commit()
     await db.refresh(service)
+    detail_cache.evict("services", old_slug, service.slug)
+    await api_snapshot.refresh(db, "services", [old_slug, service.slug])
+    await retrieval_index.refresh(db, "services", service_id)
     
     return service
 
@@ -394,8 +461,14 @@ async def delete_service(
     if not service:
         raise HTTPException(status_code=404, detail="Service not found")
     
+    slug = service.slug
     await db.delete(service)
+    await bump_content_versions(db, "services")
+    await refresh_site_stats(db, "services")
     await db.commit()
+    detail_cache.evict("services", slug)
+    await api_snapshot.refresh(db, "services", [slug])
+    await retrieval_index.refresh(db, "services", service_id)
     
     return {"message": "Service deleted successfully"}
 
@@ -418,8 +491,13 @@ async def create_tool(
     tool = Tool(**tool_data.model_dump(), slug=slug)
     
     db.add(tool)
+    await bump_content_versions(db, "tools")
+    await refresh_site_stats(db, "tools")
     await db.commit()
     await db.refresh(tool)
+    detail_cache.evict("tools", tool.slug)
+    await api_snapshot.refresh(db, "tools", [tool.slug])
+    await retrieval_index.refresh(db, "tools", tool.id)
     
     return tool
 
@@ -438,6 +516,8 @@ async def update_tool(
     if not tool:
         raise HTTPException(status_code=404, detail="Tool not found")
     
+    old_slug = tool.slug
+    
     update_data = tool_data.model_dump(exclude_unset=True)
     
     for field, value in update_data.items():
@@ -446,8 +526,13 @@ async def update_tool(
     if tool_data.name:
         setattr(tool, 'slug', slugify(tool_data.name))
     
+    await bump_content_versions(db, "tools")
+    await refresh_site_stats(db, "tools")
     await db.commit()
     await db.refresh(tool)
+    detail_cache.evict("tools", old_slug, tool.slug)
+    await api_snapshot.refresh(db, "tools", [old_slug, tool.slug])
+    await retrieval_index.refresh(db, "tools", tool_id)
     
     return tool
 
@@ -465,8 +550,14 @@ async def delete_tool(
     if not tool:
         raise HTTPException(status_code=404, detail="Tool not found")
     
+    slug = tool.slug
     await db.delete(tool)
+    await bump_content_versions(db, "tools")
+    await refresh_site_stats(db, "tools")
     await db.commit()
+    detail_cache.evict("tools", slug)
+    await api_snapshot.refresh(db, "tools", [slug])
+    await retrieval_index.refresh(db, "tools", tool_id)
     
     return {"message": "Tool deleted successfully"}
 
@@ -484,8 +575,10 @@ async def create_category(
     category = Category(**category_data.model_dump(), slug=slug)
     
     db.add(category)
+    await bump_content_versions(db, "categories")
     await db.commit()
     await db.refresh(category)
+    await api_snapshot.refresh(db, "categories")
     
     return category
 
@@ -504,7 +597,15 @@ async def delete_category(
         raise HTTPException(status_code=404, detail="Category not found")
     
     await db.delete(category)
+    await bump_content_versions(db, "categories", "blogs", "projects")
+    await forget_feature(db, CATEGORY_FEATURE, category_id)
     await db.commit()
+    detail_cache.evict("blogs")
+    detail_cache.evict("projects")
+    for entity in ("categories", "blogs", "projects"):
+        await api_snapshot.refresh(db, entity)
+    # Every list in the category may change: rescore everything off the request path
+    related_rebuilder.schedule()
     
     return {"message": "Category deleted successfully"}
 
@@ -522,8 +623,10 @@ async def create_tag(
     tag = Tag(**tag_data.model_dump(), slug=slug)
     
     db.add(tag)
+    await bump_content_versions(db, "tags")
     await db.commit()
     await db.refresh(tag)
+    await api_snapshot.refresh(db, "tags")
     
     return tag
 
@@ -542,7 +645,11 @@ async def delete_tag(
         raise HTTPException(status_code=404, detail="Tag not found")
     
     await db.delete(tag)
+    await bump_content_versions(db, "tags")
+    await forget_feature(db, TAG_FEATURE, tag_id)
     await db.commit()
+    await api_snapshot.refresh(db, "tags")
+    related_rebuilder.schedule()
     
     return {"message": "Tag deleted successfully"}
 
@@ -650,3 +757,108 @@ async def delete_asset(
     await db.commit()
     
     return {"message": "Asset deleted successfully"}
+
+
+# === Export ===
+
+@router.get("/export")
+async def get_export_summary(
+    db: AsyncSession = Depends(get_db),
+    current_user: str = Depends(get_current_user)
+) -> Dict[str, Dict[str, int]]:
+    """Exportable entities with their row counts and highest ids"""
+    return await content_exporter.summary(db)
+
+
+@router.get("/export/{entity}")
+async def export_entity(
+    entity: str,
+    request: Request,
+    after_id: int = Query(0, ge=0, description="Resume after this id (the last complete line received)"),
+    limit: Optional[int] = Query(None, ge=1),
+    gzip: bool = True,
+    current_user: str = Depends(get_current_user)
+):
+    """Stream every row of an entity (including unpublished) as NDJSON, in id order"""
+    if entity not in EXPORT_ENTITIES:
+        raise HTTPException(status_code=404, detail=f"Unknown export entity: {entity}")
+    return content_exporter.response(request, entity, after_id, limit, compress=gzip)
+
+
+# === Cache ===
+
+@router.get("/cache/stats")
+async def get_cache_stats(current_user: str = Depends(get_current_user)) -> Dict[str, Any]:
+    """Response and detail cache hit/miss counters, memory usage and write-behind counter backlog"""
+    return {
+        **response_cache.stats(),
+        "detail": detail_cache.stats(),
+        "counters": counter_buffer.stats(),
+    }
+
+
+@router.get("/chat/stats")
+async def get_chat_stats(current_user: str = Depends(get_current_user)) -> Dict[str, Any]:
+    """Chat slots in use, queue depth, requests shed, answer cache hits, retrieval and sessions (this worker)"""
+    return {
+        **chat_engine.stats(),
+        "cache": answer_cache.stats(),
+        "retrieval": retrieval_index.stats(),
+        "sessions": session_store.stats(),
+    }
+
+
+@router.get("/sql/stats")
+async def get_sql_stats(
+    reset: bool = False,
+    current_user: str = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """Per-route statement counts, DB time, slowest statements and N+1 reports (this worker)"""
+    stats = sql_metrics.stats()
+    if reset:
+        sql_metrics.reset()
+    return stats
+
+
+@router.post("/stats/reconcile")
+async def reconcile_stats(
+    db: AsyncSession = Depends(get_db),
+    current_user: str = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """Recompute /api/stats from the source tables and report any drift"""
+    return await reconcile_site_stats(db)
+
+
+@router.get("/related/status")
+async def related_status(current_user: str = Depends(get_current_user)) -> Dict[str, Any]:
+    """Background rebuilds of the related-content lists (after category/tag deletes, first start)"""
+    return related_rebuilder.stats()
+
+
+@router.post("/related/rebuild")
+async def rebuild_related_content(
+    db: AsyncSession = Depends(get_db),
+    current_user: str = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """Recompute every related-content list from scratch"""
+    rows = await rebuild_related(db)
+    await bump_content_versions(db, "blogs", "projects")
+    await db.commit()
+    return {"rows": rows}
+
+
+@router.post("/snapshot/export")
+async def export_snapshot(
+    db: AsyncSession = Depends(get_db),
+    current_user: str = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """Write the static JSON snapshot of every public payload"""
+    return await api_snapshot.export(db)
+
+
+@router.post("/cache/clear")
+async def clear_cache(current_user: str = Depends(get_current_user)):
+    """Drop every cached public response and detail entry"""
+    response_cache.clear()
+    detail_cache.clear()
+    return {"message": "Cache cleared successfully"}
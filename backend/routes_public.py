@@ -2,24 +2,35 @@
 Public API routes for frontend consumption
 No authentication required - read-only access
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_, update
-from typing import List, Optional
+from sqlalchemy import select
+from typing import List, Optional, Union
 
-from database import get_db
+from config import settings
+from database import get_db, get_read_db
 from storage import storage_service
-from models import Blog, Project, Service, Tool, Category, Tag, ResumeDownload
+from cache import open_view
+from counters import counter_buffer
+from detail_cache import detail_cache
+from site_stats import read_site_stats
+from bundle import build_bundle, parse_sections, section_entities
+from related import get_related
+from pagination import fetch_page
+from search import search_blogs
+from projections import PROJECTIONS, blog_projection, project_projection
+from serializers import serializer_for
+from models import Blog, Project, Service, Tool, Category, Tag
 import os
 from fastapi.responses import FileResponse
-from datetime import datetime, timezone
 from fastapi import Request
 from utils.security import check_rate_limit, sanitize_input
 from schemas import ContactRequest, ContactResponse
 from utils.email_utils import send_email
+from metrics import observe_duration
 from schemas import (
-    BlogResponse, ProjectResponse, ServiceResponse,
-    ToolResponse, CategoryResponse, TagResponse
+    BlogResponse, BlogSummaryResponse, ProjectResponse, ProjectSummaryResponse,
+    ServiceResponse, ToolResponse, CategoryResponse, TagResponse, RelatedItemResponse
 )
 
 router = APIRouter(prefix="/api", tags=["Public"])
@@ -27,18 +38,40 @@ router = APIRouter(prefix="/api", tags=["Public"])
 
 # === Blog Endpoints ===
 
-@router.get("/blogs", response_model=List[BlogResponse])
+@router.get("/blogs", response_model=List[Union[BlogSummaryResponse, BlogResponse]])
 async def get_blogs(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
     category: Optional[str] = None,
     tag: Optional[str] = None,
     search: Optional[str] = None,
     featured: Optional[bool] = None,
-    db: AsyncSession = Depends(get_db)
+    projection: str = Query("summary", pattern=f"^({'|'.join(PROJECTIONS)})$"),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get all published blogs with optional filtering"""
-    query = select(Blog).where(Blog.published == True)
+    """Get all published blogs with optional filtering
+
+    Pages with skip/limit, or with the opaque cursor returned in the
+    X-Next-Cursor header of the previous page (constant cost at any depth).
+    With search, results are ordered by relevance and include a snippet.
+    Rows use the "summary" projection (no content body) unless projection=full
+    or an explicit comma-separated fields= list is given.
+    """
+    fields = blog_projection.normalize_fields(fields)
+    view = await open_view(
+        request, db, ("blogs", "categories", "tags"), "blogs",
+        skip=skip, limit=limit, cursor=cursor, category=category, tag=tag,
+        search=search, featured=featured, projection=projection, fields=fields
+    )
+    cached = view.lookup()
+    if cached is not None:
+        return cached
+    
+    load_columns, serialize = blog_projection.resolve(projection, fields)
+    query = select(Blog).options(load_columns).where(Blog.published == True)
     
     # Filter by category
     if category:
@@ -48,78 +81,96 @@ async def get_blogs(
     if tag:
         query = query.join(Blog.tags).where(Tag.slug == tag)
     
-    # Search
-    if search:
-        query = query.where(
-            or_(
-                Blog.title.ilike(f"%{search}%"),
-                Blog.excerpt.ilike(f"%{search}%"),
-                Blog.content.ilike(f"%{search}%")
-            )
-        )
-    
     # Filter by featured
     if featured is not None:
         query = query.where(Blog.featured == featured)
     
-    # Order by published date
-    query = query.order_by(Blog.published_at.desc())
+    # Search: ranked by relevance with highlighted snippets (full-text index on SQLite)
+    if search:
+        if cursor:
+            raise HTTPException(status_code=400, detail="cursor cannot be combined with search")
+        
+        results = await search_blogs(db, query, search, skip, limit)
+        return view.respond(
+            [{**serialize(blog), "snippet": snippet} for blog, snippet in results]
+        )
     
-    # Pagination
-    query = query.offset(skip).limit(limit)
+    # Order by published date and paginate
+    blogs, cursor_next = await fetch_page(db, query, Blog, skip, limit, cursor)
     
-    result = await db.execute(query)
-    blogs = result.scalars().all()
+    return view.respond(
+        [serialize(blog) for blog in blogs],
+        headers={"X-Next-Cursor": cursor_next} if cursor_next else None
+    )
+
+
+async def _load_blog(db: AsyncSession, slug: str) -> Optional[dict]:
+    result = await db.execute(
+        select(Blog).where(Blog.slug == slug, Blog.published == True)
+    )
+    blog = result.scalar_one_or_none()
+    if not blog:
+        return None
     
-    return blogs
+    # Convert to dict to avoid SQLAlchemy relationship access issues
+    return {
+        "id": blog.id,
+        "title": blog.title,
+        "slug": blog.slug,
+        "excerpt": blog.excerpt,
+        "content": blog.content,
+        "author": blog.author,
+        "featured_image": blog.featured_image,
+        "thumbnail_image": blog.thumbnail_image,
+        "read_time": blog.read_time,
+        "meta_title": blog.meta_title,
+        "meta_description": blog.meta_description,
+        "meta_keywords": blog.meta_keywords,
+        "published": blog.published,
+        "featured": blog.featured,
+        "category_id": blog.category_id,
+        "views": blog.views or 0,
+        "likes": blog.likes or 0,
+        "created_at": blog.created_at,
+        "updated_at": blog.updated_at,
+        "published_at": blog.published_at,
+    }
 
 
 @router.get("/blogs/{slug}", response_model=BlogResponse)
 async def get_blog_by_slug(
     slug: str,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response
 ):
-    """Get a single blog post by slug"""
+    """Get a single blog post by slug (served from the per-slug detail cache)"""
     try:
-        result = await db.execute(
-            select(Blog).where(Blog.slug == slug, Blog.published == True)
-        )
-        blog = result.scalar_one_or_none()
+        not_modified = await detail_cache.not_modified(request, "blogs", slug, "blog")
+        if not_modified is not None:
+            return not_modified
         
-        if not blog:
+        entry = await detail_cache.get("blogs", slug, _load_blog)
+        if not entry.found:
             raise HTTPException(status_code=404, detail="Blog not found")
         
-        # Increment views using UPDATE statement
-        await db.execute(
-            update(Blog).where(Blog.id == blog.id).values(views=Blog.views + 1)
-        )
-        await db.commit()
+        view = entry.view(request, "blog", slug)
+        not_modified = view.not_modified()
+        if not_modified is not None:
+            return not_modified
         
-        # Convert to dict to avoid SQLAlchemy relationship access issues
-        blog_dict = {
-            "id": blog.id,
-            "title": blog.title,
-            "slug": blog.slug,
-            "excerpt": blog.excerpt,
-            "content": blog.content,
-            "author": blog.author,
-            "featured_image": blog.featured_image,
-            "thumbnail_image": blog.thumbnail_image,
-            "read_time": blog.read_time,
-            "meta_title": blog.meta_title,
-            "meta_description": blog.meta_description,
-            "meta_keywords": blog.meta_keywords,
-            "published": blog.published,
-            "featured": blog.featured,
-            "category_id": blog.category_id,
-            "views": (blog.views or 0) + 1,  # Return incremented value
-            "likes": blog.likes or 0,
-            "created_at": blog.created_at,
-            "updated_at": blog.updated_at,
-            "published_at": blog.published_at,
-        }
+        blog = entry.value
+        
+        # Count the view (written behind in a batched flush)
+        pending_views = counter_buffer.increment("blogs", blog["id"], "views")
         
-        return blog_dict
+        response.headers.update(view.headers)
+        return {
+            **blog,
+            "views": blog["views"] + pending_views,  # Include buffered views
+            "likes": blog["likes"] + counter_buffer.pending("blogs", blog["id"], "likes"),
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         import traceback, pathlib
         tb = traceback.format_exc()
@@ -133,37 +184,55 @@ async def get_blog_by_slug(
 @router.post("/blogs/{slug}/like")
 async def like_blog(
     slug: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Like a blog post"""
     result = await db.execute(
-        select(Blog).where(Blog.slug == slug, Blog.published == True)
+        select(Blog.id, Blog.likes).where(Blog.slug == slug, Blog.published == True)
     )
-    blog = result.scalar_one_or_none()
+    blog = result.one_or_none()
     
     if not blog:
         raise HTTPException(status_code=404, detail="Blog not found")
     
-    blog.likes += 1
-    await db.commit()
+    pending_likes = counter_buffer.increment("blogs", blog.id, "likes")
     
-    return {"likes": blog.likes}
+    return {"likes": (blog.likes or 0) + pending_likes}
 
 
 # === Project Endpoints ===
 
-@router.get("/projects", response_model=List[ProjectResponse])
+@router.get("/projects", response_model=List[Union[ProjectSummaryResponse, ProjectResponse]])
 async def get_projects(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
     category: Optional[str] = None,
     tag: Optional[str] = None,
     status: Optional[str] = None,
     featured: Optional[bool] = None,
-    db: AsyncSession = Depends(get_db)
+    projection: str = Query("summary", pattern=f"^({'|'.join(PROJECTIONS)})$"),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get all published projects with optional filtering"""
-    query = select(Project).where(Project.published == True)
+    """Get all published projects with optional filtering
+
+    Paging, projection and fields= behave as in get_blogs; the summary
+    projection leaves out long_description and gallery_images.
+    """
+    fields = project_projection.normalize_fields(fields)
+    view = await open_view(
+        request, db, ("projects", "categories", "tags"), "projects",
+        skip=skip, limit=limit, cursor=cursor, category=category, tag=tag,
+        status=status, featured=featured, projection=projection, fields=fields
+    )
+    cached = view.lookup()
+    if cached is not None:
+        return cached
+    
+    load_columns, serialize = project_projection.resolve(projection, fields)
+    query = select(Project).options(load_columns).where(Project.published == True)
     
     if category:
         query = query.join(Category).where(Category.slug == category)
@@ -177,46 +246,129 @@ async def get_projects(
     if featured is not None:
         query = query.where(Project.featured == featured)
     
-    query = query.order_by(Project.published_at.desc())
-    query = query.offset(skip).limit(limit)
-    
-    result = await db.execute(query)
-    projects = result.scalars().all()
+    projects, cursor_next = await fetch_page(db, query, Project, skip, limit, cursor)
     
-    return projects
+    return view.respond(
+        [serialize(project) for project in projects],
+        headers={"X-Next-Cursor": cursor_next} if cursor_next else None
+    )
 
 
-@router.get("/projects/{slug}", response_model=ProjectResponse)
-async def get_project_by_slug(
-    slug: str,
-    db: AsyncSession = Depends(get_db)
-):
-    """Get a single project by slug"""
+async def _load_project(db: AsyncSession, slug: str) -> Optional[ProjectResponse]:
     result = await db.execute(
         select(Project).where(Project.slug == slug, Project.published == True)
     )
     project = result.scalar_one_or_none()
+    return ProjectResponse.model_validate(project) if project else None
+
+
+@router.get("/projects/{slug}", response_model=ProjectResponse)
+async def get_project_by_slug(
+    slug: str,
+    request: Request,
+    response: Response
+):
+    """Get a single project by slug (served from the per-slug detail cache)"""
+    not_modified = await detail_cache.not_modified(request, "projects", slug, "project")
+    if not_modified is not None:
+        return not_modified
     
-    if not project:
+    entry = await detail_cache.get("projects", slug, _load_project)
+    if not entry.found:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    # Increment views
-    project.views += 1
-    await db.commit()
+    view = entry.view(request, "project", slug)
+    not_modified = view.not_modified()
+    if not_modified is not None:
+        return not_modified
     
-    return project
+    project = entry.value
+    
+    # Count the view (written behind in a batched flush)
+    pending_views = counter_buffer.increment("projects", project.id, "views")
+    
+    response.headers.update(view.headers)
+    return project.model_copy(
+        update={"views": (project.views or 0) + pending_views}
+    )
+
+
+# === Related Content Endpoints ===
+
+async def _related_response(request: Request, db: AsyncSession, entity: str, model, slug: str):
+    view = await open_view(
+        request, db, ("blogs", "projects", "categories", "tags"), "related",
+        entity=entity, slug=slug
+    )
+    cached = view.lookup()
+    if cached is not None:
+        return cached
+    
+    items = await get_related(db, entity, slug)
+    
+    # Published items with nothing in common with anything have an empty list
+    if not items:
+        result = await db.execute(
+            select(model.id).where(model.slug == slug, model.published == True)
+        )
+        if result.scalar_one_or_none() is None:
+            label = "Blog" if entity == "blogs" else "Project"
+            raise HTTPException(status_code=404, detail=f"{label} not found")
+    
+    return view.respond([
+        RelatedItemResponse(
+            type=item.target_type,
+            id=item.target_id,
+            slug=item.target_slug,
+            title=item.target_title,
+            summary=item.target_summary,
+            thumbnail_image=item.target_thumbnail,
+            score=item.score
+        )
+        for item in items
+    ])
+
+
+@router.get("/blogs/{slug}/related", response_model=List[RelatedItemResponse])
+async def get_related_to_blog(
+    slug: str,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Blogs and projects most related to a blog post (precomputed top-K)"""
+    return await _related_response(request, db, "blogs", Blog, slug)
+
+
+@router.get("/projects/{slug}/related", response_model=List[RelatedItemResponse])
+async def get_related_to_project(
+    slug: str,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Blogs and projects most related to a project (precomputed top-K)"""
+    return await _related_response(request, db, "projects", Project, slug)
 
 
 # === Service Endpoints ===
 
 @router.get("/services", response_model=List[ServiceResponse])
 async def get_services(
+    request: Request,
     active_only: bool = True,
     featured: Optional[bool] = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all services"""
-    query = select(Service)
+    view = await open_view(
+        request, db, ("services",), "services",
+        active_only=active_only, featured=featured
+    )
+    cached = view.lookup()
+    if cached is not None:
+        return cached
+    
+    serializer = serializer_for(ServiceResponse)
+    query = select(*serializer.columns(Service))
     
     if active_only:
         query = query.where(Service.active == True)
@@ -227,39 +379,62 @@ async def get_services(
     query = query.order_by(Service.order.asc(), Service.created_at.desc())
     
     result = await db.execute(query)
-    services = result.scalars().all()
-    
-    return services
+    return view.respond(serializer.many(result.all()))
 
 
-@router.get("/services/{slug}", response_model=ServiceResponse)
-async def get_service_by_slug(
-    slug: str,
-    db: AsyncSession = Depends(get_db)
-):
-    """Get a single service by slug"""
+async def _load_service(db: AsyncSession, slug: str) -> Optional[ServiceResponse]:
     result = await db.execute(
         select(Service).where(Service.slug == slug, Service.active == True)
     )
     service = result.scalar_one_or_none()
+    return ServiceResponse.model_validate(service) if service else None
+
+
+@router.get("/services/{slug}", response_model=ServiceResponse)
+async def get_service_by_slug(
+    slug: str,
+    request: Request,
+    response: Response
+):
+    """Get a single service by slug (served from the per-slug detail cache)"""
+    not_modified = await detail_cache.not_modified(request, "services", slug, "service")
+    if not_modified is not None:
+        return not_modified
     
-    if not service:
+    entry = await detail_cache.get("services", slug, _load_service)
+    if not entry.found:
         raise HTTPException(status_code=404, detail="Service not found")
     
-    return service
+    view = entry.view(request, "service", slug)
+    not_modified = view.not_modified()
+    if not_modified is not None:
+        return not_modified
+    
+    response.headers.update(view.headers)
+    return entry.value
 
 
 # === Tool Endpoints ===
 
 @router.get("/tools", response_model=List[ToolResponse])
 async def get_tools(
+    request: Request,
     category: Optional[str] = None,
     active_only: bool = True,
     featured: Optional[bool] = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all tools"""
-    query = select(Tool)
+    view = await open_view(
+        request, db, ("tools",), "tools",
+        category=category, active_only=active_only, featured=featured
+    )
+    cached = view.lookup()
+    if cached is not None:
+        return cached
+    
+    serializer = serializer_for(ToolResponse)
+    query = select(*serializer.columns(Tool))
     
     if active_only:
         query = query.where(Tool.active == True)
@@ -273,13 +448,11 @@ async def get_tools(
     query = query.order_by(Tool.order.asc(), Tool.created_at.desc())
     
     result = await db.execute(query)
-    tools = result.scalars().all()
-    
-    return tools
+    return view.respond(serializer.many(result.all()))
 
 
 @router.get('/resumes/{slug}')
-async def download_resume(slug: str, db: AsyncSession = Depends(get_db)):
+async def download_resume(slug: str):
     """Serve a resume file and increment its download count.
 
     Slugs supported: onepage, full, technical
@@ -300,17 +473,8 @@ async def download_resume(slug: str, db: AsyncSession = Depends(get_db)):
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail='File not found')
 
-    # Track download
-    result = await db.execute(select(ResumeDownload).where(ResumeDownload.slug == slug))
-    record = result.scalar_one_or_none()
-    if not record:
-        record = ResumeDownload(slug=slug, filename=filename, count=1, last_download_at=datetime.now(timezone.utc))
-        db.add(record)
-    else:
-        record.count += 1
-        record.last_download_at = datetime.now(timezone.utc)
-
-    await db.commit()
+    # Track download (written behind; the row is created on first flush)
+    counter_buffer.increment("resume_downloads", slug, "count", insert_values={"filename": filename})
 
     # Return file
     return FileResponse(file_path, media_type='application/pdf', filename=filename)
@@ -338,109 +502,128 @@ async def presigned_resume(slug: str):
         raise HTTPException(status_code=500, detail=f"Failed to generate presigned URL: {e}")
 
 
-@router.get("/tools/{slug}", response_model=ToolResponse)
-async def get_tool_by_slug(
-    slug: str,
-    db: AsyncSession = Depends(get_db)
-):
-    """Get a single tool by slug"""
+async def _load_tool(db: AsyncSession, slug: str) -> Optional[ToolResponse]:
     result = await db.execute(
         select(Tool).where(Tool.slug == slug, Tool.active == True)
     )
     tool = result.scalar_one_or_none()
+    return ToolResponse.model_validate(tool) if tool else None
+
+
+@router.get("/tools/{slug}", response_model=ToolResponse)
+async def get_tool_by_slug(
+    slug: str,
+    request: Request,
+    response: Response
+):
+    """Get a single tool by slug (served from the per-slug detail cache)"""
+    not_modified = await detail_cache.not_modified(request, "tools", slug, "tool")
+    if not_modified is not None:
+        return not_modified
     
-    if not tool:
+    entry = await detail_cache.get("tools", slug, _load_tool)
+    if not entry.found:
         raise HTTPException(status_code=404, detail="Tool not found")
     
-    # Increment views
-    tool.views += 1
-    await db.commit()
+    view = entry.view(request, "tool", slug)
+    not_modified = view.not_modified()
+    if not_modified is not None:
+        return not_modified
+    
+    tool = entry.value
     
-    return tool
+    # Count the view (written behind in a batched flush)
+    pending_views = counter_buffer.increment("tools", tool.id, "views")
+    
+    response.headers.update(view.headers)
+    return tool.model_copy(
+        update={
+            "views": (tool.views or 0) + pending_views,
+            "clicks": (tool.clicks or 0) + counter_buffer.pending("tools", tool.id, "clicks"),
+        }
+    )
 
 
 @router.post("/tools/{slug}/click")
 async def track_tool_click(
     slug: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Track tool click/visit"""
     result = await db.execute(
-        select(Tool).where(Tool.slug == slug, Tool.active == True)
+        select(Tool.id, Tool.clicks).where(Tool.slug == slug, Tool.active == True)
     )
-    tool = result.scalar_one_or_none()
+    tool = result.one_or_none()
     
     if not tool:
         raise HTTPException(status_code=404, detail="Tool not found")
     
-    tool.clicks += 1
-    await db.commit()
+    pending_clicks = counter_buffer.increment("tools", tool.id, "clicks")
     
-    return {"clicks": tool.clicks}
+    return {"clicks": (tool.clicks or 0) + pending_clicks}
 
 
 # === Category & Tag Endpoints ===
 
 @router.get("/categories", response_model=List[CategoryResponse])
-async def get_categories(db: AsyncSession = Depends(get_db)):
+async def get_categories(request: Request, db: AsyncSession = Depends(get_read_db)):
     """Get all categories"""
-    result = await db.execute(select(Category).order_by(Category.name))
-    categories = result.scalars().all()
-    return categories
+    view = await open_view(request, db, ("categories",), "categories")
+    cached = view.lookup()
+    if cached is not None:
+        return cached
+    
+    serializer = serializer_for(CategoryResponse)
+    result = await db.execute(select(*serializer.columns(Category)).order_by(Category.name))
+    return view.respond(serializer.many(result.all()))
 
 
 @router.get("/tags", response_model=List[TagResponse])
-async def get_tags(db: AsyncSession = Depends(get_db)):
+async def get_tags(request: Request, db: AsyncSession = Depends(get_read_db)):
     """Get all tags"""
-    result = await db.execute(select(Tag).order_by(Tag.name))
-    tags = result.scalars().all()
-    return tags
+    view = await open_view(request, db, ("tags",), "tags")
+    cached = view.lookup()
+    if cached is not None:
+        return cached
+    
+    serializer = serializer_for(TagResponse)
+    result = await db.execute(select(*serializer.columns(Tag)).order_by(Tag.name))
+    return view.respond(serializer.many(result.all()))
 
 
 # === Stats Endpoints ===
 
 @router.get("/stats")
-async def get_stats(db: AsyncSession = Depends(get_db)):
-    """Get general statistics"""
-    # Count blogs
-    blog_count = await db.execute(
-        select(func.count(Blog.id)).where(Blog.published == True)
-    )
-    
-    # Count projects
-    project_count = await db.execute(
-        select(func.count(Project.id)).where(Project.published == True)
-    )
-    
-    # Count services
-    service_count = await db.execute(
-        select(func.count(Service.id)).where(Service.active == True)
-    )
-    
-    # Count tools
-    tool_count = await db.execute(
-        select(func.count(Tool.id)).where(Tool.active == True)
-    )
-    
-    # Total blog views
-    blog_views = await db.execute(
-        select(func.sum(Blog.views)).where(Blog.published == True)
-    )
-    
-    # Total project views
-    project_views = await db.execute(
-        select(func.sum(Project.views)).where(Project.published == True)
+async def get_stats(db: AsyncSession = Depends(get_read_db)):
+    """Get general statistics (single read of the maintained site_stats row)"""
+    return await read_site_stats(db)
+
+
+# === Bundle Endpoints ===
+
+@router.get("/bundle/home")
+async def get_home_bundle(
+    request: Request,
+    sections: Optional[str] = None,
+    limit: int = Query(settings.HOME_BUNDLE_FEATURED_LIMIT, ge=1, le=50),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Everything the homepage needs in one response
+
+    sections is a comma-separated subset of featured_blogs, featured_projects,
+    services, tools and stats (default: HOME_BUNDLE_SECTIONS); limit caps the
+    featured lists. The bundle is cached and ETag-ed as a single unit.
+    """
+    names = parse_sections(sections)
+    view = await open_view(
+        request, db, section_entities(names), "bundle/home",
+        sections=",".join(names), limit=limit
     )
-    
-    return {
-        "blogs": blog_count.scalar() or 0,
-        "projects": project_count.scalar() or 0,
-        "services": service_count.scalar() or 0,
-        "tools": tool_count.scalar() or 0,
-        "blog_views": blog_views.scalar() or 0,
-        "project_views": project_views.scalar() or 0,
-        "total_views": (blog_views.scalar() or 0) + (project_views.scalar() or 0)
-    }
+    cached = view.lookup()
+    if cached is not None:
+        return cached
+
+    return view.respond(await build_bundle(db, names, limit))
 
 
 @router.post('/contact', response_model=ContactResponse)
@@ -500,7 +683,8 @@ Priority Level:     {priority}
 """
 
     try:
-        await send_email(subject, body)
+        with observe_duration("email_send"):
+            await send_email(subject, body)
         return {"message": "Message sent successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to send email: {e}")
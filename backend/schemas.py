@@ -59,6 +59,29 @@ class BlogResponse(BlogBase):
         from_attributes = True
 
 
+class BlogSummaryResponse(BaseModel):
+    """Card-grid projection of a blog: no content body or SEO fields"""
+    id: int
+    title: str
+    slug: str
+    excerpt: str
+    author: str
+    featured_image: Optional[str] = None
+    thumbnail_image: Optional[str] = None
+    read_time: Optional[int] = None
+    published: bool
+    featured: bool
+    category_id: Optional[int] = None
+    views: int
+    likes: int
+    created_at: datetime
+    updated_at: Optional[datetime]
+    published_at: Optional[datetime]
+    
+    class Config:
+        from_attributes = True
+
+
 # === Project Schemas ===
 
 class ProjectBase(BaseModel):
@@ -123,6 +146,38 @@ class ProjectResponse(ProjectBase):
         from_attributes = True
 
 
+class ProjectSummaryResponse(BaseModel):
+    """Card-grid projection of a project: no long_description or gallery_images"""
+    id: int
+    title: str
+    slug: str
+    description: str
+    featured_image: Optional[str] = None
+    thumbnail_image: Optional[str] = None
+    demo_video_url: Optional[str] = None
+    demo_url: Optional[str] = None
+    github_url: Optional[str] = None
+    live_url: Optional[str] = None
+    tech_stack: Optional[str] = None  # JSON string
+    client: Optional[str] = None
+    duration: Optional[str] = None
+    team_size: Optional[int] = None
+    published: bool
+    featured: bool
+    status: str
+    category_id: Optional[int] = None
+    stars: int
+    forks: int
+    views: int
+    created_at: datetime
+    updated_at: Optional[datetime]
+    published_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    
+    class Config:
+        from_attributes = True
+
+
 # === Service Schemas ===
 
 class ServiceBase(BaseModel):
@@ -288,6 +343,19 @@ class TagResponse(TagBase):
         from_attributes = True
 
 
+# === Related Content Schemas ===
+
+class RelatedItemResponse(BaseModel):
+    """A related blog or project card"""
+    type: str  # blogs, projects
+    id: int
+    slug: str
+    title: str
+    summary: Optional[str] = None
+    thumbnail_image: Optional[str] = None
+    score: float
+
+
 # === Authentication Schemas ===
 
 class LoginRequest(BaseModel):
@@ -313,3 +381,28 @@ class UploadResponse(BaseModel):
     file_size: int
     width: Optional[int]
     height: Optional[int]
+
+
+class AssetResponse(BaseModel):
+    id: int
+    filename: str
+    original_filename: str
+    file_type: str
+    file_size: int
+    storage_url: str
+    blob_name: str
+    container_name: str
+    thumbnail_url: Optional[str] = None
+    medium_url: Optional[str] = None
+    large_url: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    alt_text: Optional[str] = None
+    tags: Optional[str] = None
+    used_in: Optional[str] = None
+    used_in_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
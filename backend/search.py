@@ -0,0 +1,163 @@
+"""
+Full-text search over blog posts (indexes are created by migration 0003)
+SQLite: FTS5 external-content index (blogs_fts) kept in sync by triggers on
+blogs, ranked with bm25 and returning highlighted snippets.
+PostgreSQL: weighted tsvector expression with a GIN index, ranked with
+ts_rank_cd and returning ts_headline snippets.
+Other databases: ILIKE fallback on title, excerpt and content.
+
+Rebuild the index of an existing database:  python search.py rebuild
+"""
+import asyncio
+import re
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import column, func, literal_column, or_, select, table, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from models import Blog
+from pagination import keyset_order
+
+FTS_TABLE = "blogs_fts"
+
+# Column weights for bm25(): title matches count most, body matches least
+TITLE_WEIGHT = 10.0
+EXCERPT_WEIGHT = 5.0
+CONTENT_WEIGHT = 1.0
+
+SNIPPET_TOKENS = 24
+
+blogs_fts = table(FTS_TABLE, column("rowid"), column("title"), column("excerpt"), column("content"))
+
+# Weighted document the PostgreSQL GIN index (migration 0003) is built on; the
+# expression must stay identical to the index for the planner to use it
+PG_DOCUMENT = literal_column(
+    "(setweight(to_tsvector('english', coalesce(blogs.title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(blogs.excerpt, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(blogs.content, '')), 'C'))"
+)
+PG_HEADLINE_OPTIONS = f"StartSel=<mark>, StopSel=</mark>, MaxWords={SNIPPET_TOKENS}, MinWords={SNIPPET_TOKENS // 2}"
+
+
+async def rebuild_search_index(conn: AsyncConnection) -> None:
+    """Re-read every blog row into the FTS5 index (SQLite) or rebuild the GIN index (PostgreSQL)"""
+    if conn.dialect.name == "sqlite":
+        await conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+    elif conn.dialect.name == "postgresql":
+        await conn.execute(text("REINDEX INDEX ix_blogs_search"))
+
+
+def build_match_query(term: str) -> Optional[str]:
+    """Turn free user input into a safe FTS5 query (all words, prefix match on the last)"""
+    words = re.findall(r"\w+", term)
+    if not words:
+        return None
+    quoted = [f'"{word}"' for word in words]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def build_tsquery(term: str) -> Optional[str]:
+    """The same query for PostgreSQL to_tsquery: all words, prefix match on the last"""
+    words = re.findall(r"\w+", term)
+    if not words:
+        return None
+    words[-1] += ":*"
+    return " & ".join(words)
+
+
+async def search_blogs(
+    db: Any,
+    query: Any,
+    term: str,
+    skip: int,
+    limit: int
+) -> List[Tuple[Blog, Optional[str]]]:
+    """Run a Blog select restricted to rows matching term, returning (blog, snippet) pairs
+
+    On SQLite and PostgreSQL the select is filtered by the full-text index and
+    ordered by relevance; elsewhere ILIKE is used, newest first, without snippets.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return await _search_postgres(db, query, term, skip, limit)
+    if dialect != "sqlite":
+        query = query.where(
+            or_(
+                Blog.title.ilike(f"%{term}%"),
+                Blog.excerpt.ilike(f"%{term}%"),
+                Blog.content.ilike(f"%{term}%")
+            )
+        )
+        result = await db.execute(query.order_by(*keyset_order(Blog)).offset(skip).limit(limit))
+        return [(blog, None) for blog in result.scalars().all()]
+
+    match_query = build_match_query(term)
+    if match_query is None:
+        return []
+
+    fts = literal_column(FTS_TABLE)
+    matches = (
+        select(
+            blogs_fts.c.rowid.label("blog_id"),
+            func.bm25(fts, TITLE_WEIGHT, EXCERPT_WEIGHT, CONTENT_WEIGHT).label("rank"),
+            func.snippet(fts, -1, "<mark>", "</mark>", "…", SNIPPET_TOKENS).label("snippet"),
+        )
+        .where(fts.op("MATCH")(match_query))
+        .subquery()
+    )
+    result = await db.execute(
+        query.join(matches, matches.c.blog_id == Blog.id)
+        .add_columns(matches.c.snippet)
+        .order_by(matches.c.rank, Blog.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return [(blog, snippet) for blog, snippet in result.all()]
+
+
+async def _search_postgres(db: Any, query: Any, term: str, skip: int, limit: int) -> List[Tuple[Blog, Optional[str]]]:
+    tsquery_text = build_tsquery(term)
+    if tsquery_text is None:
+        return []
+
+    tsquery = func.to_tsquery(literal_column("'english'"), tsquery_text)
+    rank = func.ts_rank_cd(PG_DOCUMENT, tsquery)
+    # ts_headline is costly; PostgreSQL evaluates it only for the rows that survive the LIMIT.
+    # Like snippet(..., -1, ...) on SQLite it picks the best passage across all three columns.
+    text_columns = func.concat_ws(" ", Blog.title, Blog.excerpt, Blog.content)
+    snippet = func.ts_headline(literal_column("'english'"), text_columns, tsquery, PG_HEADLINE_OPTIONS)
+    result = await db.execute(
+        query.where(PG_DOCUMENT.op("@@")(tsquery))
+        .add_columns(snippet.label("snippet"))
+        .order_by(rank.desc(), Blog.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return [(blog, snippet) for blog, snippet in result.all()]
+
+
+async def _main() -> None:
+    import sys
+    from database import engine
+
+    if sys.argv[1:] != ["rebuild"]:
+        print("Usage: python search.py rebuild")
+        return
+
+    async with engine.begin() as conn:
+        if conn.dialect.name not in ("sqlite", "postgresql"):
+            print(f"No full-text index on {conn.dialect.name}; search uses ILIKE")
+            return
+        await rebuild_search_index(conn)
+        if conn.dialect.name == "sqlite":
+            count = await conn.execute(text(f"SELECT count(*) FROM {FTS_TABLE}"))
+            print(f"✅ Rebuilt {FTS_TABLE} ({count.scalar()} rows)")
+        else:
+            print("✅ Rebuilt ix_blogs_search")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
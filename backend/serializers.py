@@ -0,0 +1,142 @@
+"""
+Fast JSON serialization of trusted ORM rows for the API responses
+A RowSerializer is compiled once per response schema (and field subset): one
+attrgetter for the schema's fields plus float coercion where the schema
+declares floats. Rows - ORM objects or column tuples - become plain dicts that
+orjson encodes straight to bytes, skipping per-row Pydantic validation. The
+bytes are identical to what the schema produces (Pydantic's datetime format,
+with Z for UTC).
+
+Check parity with the Pydantic path on the configured database:  python serializers.py
+(exits non-zero on any difference)
+"""
+import asyncio
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union, get_args, get_origin
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    """Values orjson cannot encode natively (Pydantic models, Decimal, sets, ...)"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return jsonable_encoder(value)
+
+
+def dumps(payload: Any) -> bytes:
+    """Encode payload as compact UTF-8 JSON"""
+    return orjson.dumps(payload, default=_default, option=JSON_OPTIONS)
+
+
+def _is_float(annotation: Any) -> bool:
+    if get_origin(annotation) is Union:
+        return any(_is_float(arg) for arg in get_args(annotation))
+    return annotation is float
+
+
+class RowSerializer:
+    """Dumps rows the way a response schema would, without validating them"""
+    __slots__ = ("schema", "fields", "_get", "_floats")
+
+    def __init__(self, schema: Type[BaseModel], fields: Optional[Sequence[str]] = None):
+        self.schema = schema
+        self.fields: Tuple[str, ...] = tuple(fields or schema.model_fields)
+        getter = attrgetter(*self.fields)
+        self._get = getter if len(self.fields) > 1 else (lambda row: (getter(row),))
+        # Pydantic turns ints into floats for float fields (500 -> 500.0)
+        self._floats = tuple(name for name in self.fields if _is_float(schema.model_fields[name].annotation))
+
+    def columns(self, model: Any) -> List[Any]:
+        """Model columns to select() so rows come back as plain tuples instead of ORM objects"""
+        return [getattr(model, name) for name in self.fields]
+
+    def to_dict(self, row: Any) -> Dict[str, Any]:
+        data = dict(zip(self.fields, self._get(row)))
+        for name in self._floats:
+            value = data[name]
+            if value is not None:
+                if type(value) is not float:
+                    value = data[name] = float(value)
+                if value and not 1e-4 <= abs(value) < 1e16:
+                    # Exponent notation: json.dumps writes 1e+21 / 1e-05, orjson 1e21 / 1e-5
+                    data[name] = orjson.Fragment(repr(value))
+        return data
+
+    def many(self, rows: Iterable[Any]) -> List[Dict[str, Any]]:
+        return [self.to_dict(row) for row in rows]
+
+    def response(self, rows: Iterable[Any]) -> Response:
+        """JSON response for a list of rows (bypasses response_model validation)"""
+        return Response(content=dumps(self.many(rows)), media_type="application/json")
+
+
+@lru_cache(maxsize=None)
+def serializer_for(schema: Type[BaseModel], fields: Optional[Tuple[str, ...]] = None) -> RowSerializer:
+    """The compiled serializer for a schema, or for a subset of its fields"""
+    return RowSerializer(schema, fields)
+
+
+def _pydantic_bytes(schema: Type[BaseModel], rows: Sequence[Any]) -> bytes:
+    """What FastAPI sends for response_model=List[schema]"""
+    import json
+    return json.dumps(
+        [schema.model_validate(row).model_dump(mode="json") for row in rows],
+        ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"),
+    ).encode("utf-8")
+
+
+async def check_parity(db: Any) -> Dict[str, Optional[str]]:
+    """{schema: first difference or None} for every list schema over every row in the database"""
+    from sqlalchemy import select
+    from models import Blog, Project, Service, Tool, Category, Tag
+    from schemas import (
+        BlogResponse, BlogSummaryResponse, ProjectResponse, ProjectSummaryResponse,
+        ServiceResponse, ToolResponse, CategoryResponse, TagResponse
+    )
+
+    pairs = (
+        (BlogResponse, Blog), (BlogSummaryResponse, Blog),
+        (ProjectResponse, Project), (ProjectSummaryResponse, Project),
+        (ServiceResponse, Service), (ToolResponse, Tool),
+        (CategoryResponse, Category), (TagResponse, Tag),
+    )
+    report: Dict[str, Optional[str]] = {}
+    for schema, model in pairs:
+        serializer = serializer_for(schema)
+        rows = (await db.execute(select(model).order_by(model.id))).scalars().all()
+        tuples = (await db.execute(select(*serializer.columns(model)).order_by(model.id))).all()
+
+        expected = _pydantic_bytes(schema, rows)
+        problem = None
+        for label, actual in (("ORM rows", dumps(serializer.many(rows))), ("column tuples", dumps(serializer.many(tuples)))):
+            if actual != expected:
+                at = next((i for i, (a, b) in enumerate(zip(actual, expected)) if a != b), min(len(actual), len(expected)))
+                problem = f"{label} differ at byte {at}: {actual[at - 40:at + 40]!r} vs {expected[at - 40:at + 40]!r}"
+                break
+        report[f"{schema.__name__} ({len(rows)} rows)"] = problem
+    return report
+
+
+async def _main() -> None:
+    import sys
+    from database import AsyncSessionLocal, engine
+
+    async with AsyncSessionLocal() as db:
+        report = await check_parity(db)
+    await engine.dispose()
+
+    for name, problem in report.items():
+        print(f"{'❌' if problem else '✅'} {name}" + (f": {problem}" if problem else ""))
+    if any(report.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,147 @@
+"""
+Incrementally maintained site statistics behind /api/stats
+A single site_stats row is refreshed per entity type by admin writes and bumped
+by counter flushes, so /api/stats is one primary-key read
+
+Recompute from the source tables and report drift:  python site_stats.py reconcile
+"""
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Blog, Project, Service, Tool, SiteStats
+
+SITE_STATS_ID = 1
+
+# Which summary columns each entity type's admin writes can change
+ENTITY_COLUMNS = {
+    "blogs": ("blogs", "blog_views"),
+    "projects": ("projects", "project_views"),
+    "services": ("services",),
+    "tools": ("tools",),
+}
+
+STAT_COLUMNS = ("blogs", "projects", "services", "tools", "blog_views", "project_views")
+
+
+def _aggregate(column: str) -> Any:
+    """Source-of-truth aggregate for one summary column"""
+    return {
+        "blogs": select(func.count(Blog.id)).where(Blog.published == True),
+        "projects": select(func.count(Project.id)).where(Project.published == True),
+        "services": select(func.count(Service.id)).where(Service.active == True),
+        "tools": select(func.count(Tool.id)).where(Tool.active == True),
+        "blog_views": select(func.coalesce(func.sum(Blog.views), 0)).where(Blog.published == True),
+        "project_views": select(func.coalesce(func.sum(Project.views), 0)).where(Project.published == True),
+    }[column]
+
+
+async def compute_site_stats(db: AsyncSession, columns: Sequence[str] = STAT_COLUMNS) -> Dict[str, int]:
+    """Recompute columns from the source tables in a single round trip"""
+    result = await db.execute(
+        select(*(_aggregate(column).scalar_subquery().label(column) for column in columns))
+    )
+    row = result.one()
+    return {column: int(getattr(row, column) or 0) for column in columns}
+
+
+async def refresh_site_stats(db: AsyncSession, *entities: str) -> None:
+    """Recompute the summary columns touched by entities (within the caller's transaction)"""
+    columns = [column for entity in entities for column in ENTITY_COLUMNS.get(entity, ())]
+    if not columns:
+        return
+
+    await db.flush()
+    values = await compute_site_stats(db, columns)
+    await _write(db, values)
+
+
+async def add_view_deltas(conn: Any, blog_views: int, project_views: int) -> None:
+    """Add flushed view increments to the summary row (used by the counter buffer flush)"""
+    if not blog_views and not project_views:
+        return
+
+    table = SiteStats.__table__
+    await conn.execute(
+        table.update()
+        .where(table.c.id == SITE_STATS_ID)
+        .values(
+            blog_views=table.c.blog_views + blog_views,
+            project_views=table.c.project_views + project_views,
+            updated_at=datetime.now(timezone.utc)
+        )
+    )
+
+
+async def read_site_stats(db: AsyncSession) -> Dict[str, int]:
+    """Current summary as served by /api/stats (read-only; computed live if the row is missing)
+
+    The row itself is created by reconcile_site_stats at startup and by admin writes.
+    """
+    result = await db.execute(select(SiteStats).where(SiteStats.id == SITE_STATS_ID))
+    stats: Optional[SiteStats] = result.scalar_one_or_none()
+
+    if stats is None:
+        values = await compute_site_stats(db)
+    else:
+        values = {column: getattr(stats, column) or 0 for column in STAT_COLUMNS}
+
+    return {**values, "total_views": values["blog_views"] + values["project_views"]}
+
+
+async def reconcile_site_stats(db: AsyncSession) -> Dict[str, Any]:
+    """Recompute the summary row from the source tables and report any drift"""
+    result = await db.execute(select(SiteStats).where(SiteStats.id == SITE_STATS_ID))
+    stored: Optional[SiteStats] = result.scalar_one_or_none()
+    actual = await compute_site_stats(db)
+
+    drift = {}
+    for column in STAT_COLUMNS:
+        stored_value = (getattr(stored, column) or 0) if stored is not None else None
+        if stored_value != actual[column]:
+            drift[column] = {"stored": stored_value, "actual": actual[column]}
+
+    if drift:
+        await _write(db, actual)
+        await db.commit()
+
+    return {"drift": drift, "stats": actual}
+
+
+async def _write(db: AsyncSession, values: Dict[str, int]) -> None:
+    now = datetime.now(timezone.utc)
+    result = await db.execute(
+        update(SiteStats).where(SiteStats.id == SITE_STATS_ID).values(**values, updated_at=now)
+    )
+    if result.rowcount == 0:
+        full = values if set(values) >= set(STAT_COLUMNS) else await compute_site_stats(db)
+        db.add(SiteStats(id=SITE_STATS_ID, **full, updated_at=now))
+        await db.flush()
+
+
+async def _main() -> None:
+    import sys
+    from database import AsyncSessionLocal, engine
+
+    if sys.argv[1:] != ["reconcile"]:
+        print("Usage: python site_stats.py reconcile")
+        return
+
+    async with AsyncSessionLocal() as db:
+        report = await reconcile_site_stats(db)
+
+    if report["drift"]:
+        for column, values in report["drift"].items():
+            print(f"⚠️  {column}: stored {values['stored']} -> actual {values['actual']}")
+        print("✅ site_stats repaired")
+    else:
+        print("✅ site_stats is in sync")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,348 @@
+"""
+Static JSON snapshot of the public content API
+Every list page, detail-by-slug, category and tag payload served by
+routes_public is pre-rendered under API_SNAPSHOT_DIR as .json plus
+pre-compressed .json.gz (and .json.br when the brotli package is installed),
+laid out so a static file server can answer the same URLs without Python:
+
+    blogs.json  blogs/page/2.json  blogs/{slug}.json      (same for projects)
+    services.json  services/{slug}.json                   (same for tools)
+    categories.json  tags.json  manifest.json
+
+Admin writes regenerate only the files they affect. View/like counters in
+the files are as of the last write to them. Views of snapshot-served blog,
+project and tool details are still counted: the manifest maps their slugs to
+ids for the middleware (details missing from that map go to the router).
+
+Export everything:  python snapshot.py export
+"""
+import asyncio
+import gzip
+import json
+import os
+import re
+import shutil
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+try:
+    import brotli
+except ImportError:  # Optional: .br variants are skipped without it
+    brotli = None
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cache import serialize_json
+from config import settings
+from content_versions import ENTITY_TYPES, get_content_state
+from counters import counter_buffer
+from models import Blog, Project, Service, Tool, Category, Tag
+from pagination import keyset_order
+from projections import blog_projection, project_projection
+from serializers import serializer_for
+from schemas import (
+    BlogResponse, ProjectResponse, ServiceResponse, ToolResponse, CategoryResponse, TagResponse
+)
+
+# entity -> (model, public filter, detail schema, list projection or None for unpaged lists)
+CONTENT_ENTITIES: Dict[str, Tuple[Any, Any, Any, Any]] = {
+    "blogs": (Blog, Blog.published == True, BlogResponse, blog_projection),
+    "projects": (Project, Project.published == True, ProjectResponse, project_projection),
+    "services": (Service, Service.active == True, ServiceResponse, None),
+    "tools": (Tool, Tool.active == True, ToolResponse, None),
+}
+
+TAXONOMY_ENTITIES: Dict[str, Tuple[Any, Any]] = {
+    "categories": (Category, CategoryResponse),
+    "tags": (Tag, TagResponse),
+}
+
+# Entities whose detail routes count a view (routes_public)
+VIEW_COUNTED_ENTITIES = ("blogs", "projects", "tools")
+
+# Default limit of the paged public list routes
+LIST_DEFAULT_LIMIT = 10
+
+_SNAPSHOT_PATH = re.compile(r"/api/(blogs|projects|services|tools|categories|tags)(?:/([\w-]+))?")
+
+Files = Dict[str, Any]
+
+
+class ApiSnapshot:
+    """Writes, refreshes and serves the pre-rendered public API snapshot"""
+
+    def __init__(self, root: str, page_size: int = LIST_DEFAULT_LIMIT):
+        self.root = root
+        self.page_size = page_size
+        self._item_ids: Dict[str, Dict[str, int]] = {}
+        self._manifest_mtime: Optional[float] = None
+
+    @property
+    def exists(self) -> bool:
+        """Whether a snapshot has been exported (admin writes only refresh an existing one)"""
+        return os.path.exists(os.path.join(self.root, "manifest.json"))
+
+    # --- Rendering ---
+
+    async def render(self, db: AsyncSession, entity: str, slugs: Optional[Iterable[str]] = None) -> Tuple[Files, Set[str]]:
+        """Render entity's list file(s) and detail files (all, or only slugs)
+
+        Returns ({relative path: payload}, requested slugs that are not public).
+        """
+        if entity in TAXONOMY_ENTITIES:
+            model, schema = TAXONOMY_ENTITIES[entity]
+            serializer = serializer_for(schema)
+            result = await db.execute(select(*serializer.columns(model)).order_by(model.name))
+            return {entity: serializer.many(result.all())}, set()
+
+        model, is_public, detail_schema, projection = CONTENT_ENTITIES[entity]
+        files: Files = {}
+
+        if projection is not None:
+            load_columns, serialize = projection.resolve("summary", None)
+            result = await db.execute(
+                select(model).options(load_columns).where(is_public).order_by(*keyset_order(model))
+            )
+            rows = [serialize(row) for row in result.scalars().all()]
+            for start in range(0, max(len(rows), 1), self.page_size):
+                files[self._page_path(entity, start // self.page_size + 1)] = rows[start:start + self.page_size]
+        else:
+            serializer = serializer_for(detail_schema)
+            result = await db.execute(
+                select(*serializer.columns(model)).where(is_public).order_by(model.order.asc(), model.created_at.desc())
+            )
+            files[entity] = serializer.many(result.all())
+
+        query = select(model).where(is_public)
+        wanted = None if slugs is None else {slug for slug in slugs if slug}
+        if wanted is not None:
+            if not wanted:
+                return files, set()
+            query = query.where(model.slug.in_(wanted))
+
+        result = await db.execute(query)
+        found = set()
+        to_dict = serializer_for(detail_schema).to_dict
+        for row in result.scalars().all():
+            files[f"{entity}/{row.slug}"] = to_dict(row)
+            found.add(row.slug)
+
+        return files, (wanted - found) if wanted is not None else set()
+
+    # --- Writing ---
+
+    async def export(self, db: AsyncSession) -> Dict[str, Any]:
+        """Render every public payload into a fresh snapshot and swap it in atomically"""
+        files: Files = {}
+        for entity in (*CONTENT_ENTITIES, *TAXONOMY_ENTITIES):
+            rendered, _ = await self.render(db, entity)
+            files.update(rendered)
+
+        manifest = await self._manifest(db)
+        staging = f"{self.root}.tmp"
+        await asyncio.to_thread(self._export_files, staging, files, manifest)
+        return {"files": len(files), "path": self.root, "brotli": brotli is not None}
+
+    def _export_files(self, staging: str, files: Files, manifest: Dict[str, Any]) -> None:
+        shutil.rmtree(staging, ignore_errors=True)
+        for path, payload in files.items():
+            _write_variants(os.path.join(staging, path), serialize_json(payload))
+        _write_variants(os.path.join(staging, "manifest"), serialize_json(manifest), compress=False)
+
+        previous = f"{self.root}.old"
+        shutil.rmtree(previous, ignore_errors=True)
+        if os.path.exists(self.root):
+            os.replace(self.root, previous)
+        os.replace(staging, self.root)
+        shutil.rmtree(previous, ignore_errors=True)
+
+    async def refresh(self, db: AsyncSession, entity: str, slugs: Optional[Iterable[str]] = None) -> None:
+        """Regenerate the files an admin write to entity affects (no-op without a snapshot)
+
+        slugs limits detail files to the written items (old and new slug on a
+        rename); None regenerates every detail file of the entity.
+        """
+        if not self.exists:
+            return
+
+        try:
+            files, gone = await self.render(db, entity, slugs)
+            manifest = await self._manifest(db)
+            await asyncio.to_thread(self._refresh_files, entity, files, gone, manifest)
+        except Exception as e:
+            print(f"❌ API snapshot refresh failed for {entity}: {e}")
+
+    def _refresh_files(self, entity: str, files: Files, gone: Set[str], manifest: Dict[str, Any]) -> None:
+        for path, payload in files.items():
+            _write_variants(os.path.join(self.root, path), serialize_json(payload))
+
+        # List pages past the new end and details of items that are no longer public
+        page_dir = os.path.join(self.root, entity, "page")
+        if os.path.isdir(page_dir):
+            for name in os.listdir(page_dir):
+                stem = name.split(".", 1)[0]
+                if f"{entity}/page/{stem}" not in files:
+                    os.remove(os.path.join(page_dir, name))
+        for slug in gone:
+            for suffix in (".json", ".json.gz", ".json.br"):
+                path = os.path.join(self.root, entity, slug + suffix)
+                if os.path.exists(path):
+                    os.remove(path)
+
+        _write_variants(os.path.join(self.root, "manifest"), serialize_json(manifest), compress=False)
+
+    async def _manifest(self, db: AsyncSession) -> Dict[str, Any]:
+        state = await get_content_state(db, ENTITY_TYPES)
+        ids: Dict[str, Dict[str, int]] = {}
+        for entity in VIEW_COUNTED_ENTITIES:
+            model, is_public, _, _ = CONTENT_ENTITIES[entity]
+            result = await db.execute(select(model.slug, model.id).where(is_public))
+            ids[entity] = dict(result.all())
+        return {
+            "generated_at": datetime.now(timezone.utc),
+            "page_size": self.page_size,
+            "versions": dict(state.versions),
+            "ids": ids,
+        }
+
+    def _page_path(self, entity: str, page: int) -> str:
+        return entity if page == 1 else f"{entity}/page/{page}"
+
+    # --- Serving ---
+
+    def item_id(self, entity: str, slug: str) -> Optional[int]:
+        """Id of a snapshot detail from the manifest (reloaded when another worker rewrites it)"""
+        path = os.path.join(self.root, "manifest.json")
+        try:
+            mtime = os.stat(path).st_mtime
+            if mtime != self._manifest_mtime:
+                with open(path, "rb") as f:
+                    self._item_ids = json.load(f).get("ids", {})
+                self._manifest_mtime = mtime
+        except (OSError, ValueError):
+            return None
+        return self._item_ids.get(entity, {}).get(slug)
+
+    def resolve(self, path: str, params: Dict[str, str]) -> Optional[str]:
+        """Snapshot file (without extension) equivalent to a public GET, if there is one"""
+        match = _SNAPSHOT_PATH.fullmatch(path)
+        if match is None:
+            return None
+        entity, slug = match.groups()
+
+        if slug is not None:
+            if params or entity in TAXONOMY_ENTITIES:
+                return None
+            # Views must be counted, so a detail without a known id is left to the router
+            if entity in VIEW_COUNTED_ENTITIES and self.item_id(entity, slug) is None:
+                return None
+            return os.path.join(self.root, entity, slug)
+
+        if entity in TAXONOMY_ENTITIES:
+            return None if params else os.path.join(self.root, entity)
+
+        if CONTENT_ENTITIES[entity][3] is None:
+            if set(params) - {"active_only"} or params.get("active_only", "true").lower() != "true":
+                return None
+            return os.path.join(self.root, entity)
+
+        if set(params) - {"skip", "limit", "projection"} or params.get("projection", "summary") != "summary":
+            return None
+        try:
+            skip = int(params.get("skip", 0))
+            limit = int(params.get("limit", LIST_DEFAULT_LIMIT))
+        except ValueError:
+            return None
+        if limit != self.page_size or skip < 0 or skip % self.page_size:
+            return None
+        return os.path.join(self.root, self._page_path(entity, skip // self.page_size + 1))
+
+    def response(self, request: Request) -> Optional[Response]:
+        """Serve a public GET from the snapshot, picking a pre-compressed variant when accepted"""
+        base = self.resolve(request.url.path, dict(request.query_params))
+        if base is None or not os.path.isfile(f"{base}.json"):
+            return None
+        self._count_view(request.url.path)
+
+        headers = {
+            "Cache-Control": f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, must-revalidate",
+            "Vary": "Accept-Encoding",
+            "X-Snapshot": "HIT",
+        }
+        accept_encoding = request.headers.get("accept-encoding", "")
+        for suffix, encoding in ((".json.br", "br"), (".json.gz", "gzip")):
+            if encoding in accept_encoding and os.path.isfile(base + suffix):
+                return FileResponse(
+                    base + suffix,
+                    media_type="application/json",
+                    headers={**headers, "Content-Encoding": encoding}
+                )
+        return FileResponse(f"{base}.json", media_type="application/json", headers=headers)
+
+
+    def _count_view(self, path: str) -> None:
+        """Buffer the view the detail route would have counted"""
+        entity, slug = _SNAPSHOT_PATH.fullmatch(path).groups()
+        if slug is not None and entity in VIEW_COUNTED_ENTITIES:
+            item_id = self.item_id(entity, slug)
+            if item_id is not None:
+                counter_buffer.increment(entity, item_id, "views")
+
+
+def _write_variants(base: str, body: bytes, compress: bool = True) -> None:
+    variants = {".json": body}
+    if compress:
+        variants[".json.gz"] = gzip.compress(body, compresslevel=9, mtime=0)
+        if brotli is not None:
+            variants[".json.br"] = brotli.compress(body)
+
+    os.makedirs(os.path.dirname(base), exist_ok=True)
+    for suffix, data in variants.items():
+        temp_path = f"{base}{suffix}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, base + suffix)
+
+
+async def serve_api_snapshot(request: Request, call_next: Any) -> Response:
+    """HTTP middleware answering snapshot-backed public GETs before they reach the router"""
+    if request.method == "GET":
+        response = api_snapshot.response(request)
+        if response is not None:
+            return response
+    return await call_next(request)
+
+
+def _snapshot_root() -> str:
+    root = settings.API_SNAPSHOT_DIR
+    if not os.path.isabs(root):
+        root = os.path.join(os.path.dirname(os.path.abspath(__file__)), root)
+    return root
+
+
+# Global instance
+api_snapshot = ApiSnapshot(_snapshot_root(), page_size=settings.API_SNAPSHOT_PAGE_SIZE)
+
+
+async def _main() -> None:
+    import sys
+    from database import AsyncSessionLocal, engine
+
+    if sys.argv[1:] != ["export"]:
+        print("Usage: python snapshot.py export")
+        return
+
+    async with AsyncSessionLocal() as db:
+        report = await api_snapshot.export(db)
+    print(f"✅ Exported {report['files']} payloads to {report['path']}")
+    if not report["brotli"]:
+        print("ℹ️  brotli not installed; wrote .json and .json.gz only")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
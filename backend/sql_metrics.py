@@ -0,0 +1,218 @@
+"""
+Per-request SQL instrumentation
+Cursor events on the app engines record every statement a request runs:
+statement count, total DB time and the slowest statement. Each response gets
+a Server-Timing header, requests are aggregated per route
+(GET /api/admin/sql/stats), a statement repeated SQL_N_PLUS_ONE_THRESHOLD
+times within one request is reported as N+1, and statements slower than
+SQL_SLOW_QUERY_MS are written to the slow-query log as JSON lines.
+Aggregates are per worker process.
+"""
+import json
+import time
+from collections import Counter
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Set, Tuple
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from config import settings
+from database import engine, read_engine
+
+STATEMENT_PREVIEW_CHARS = 500
+
+
+class RequestQueries:
+    """Statements recorded while one request was being handled"""
+    __slots__ = ("count", "total_ms", "slowest_ms", "slowest_statement", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.shapes: Counter = Counter()
+
+    def n_plus_one(self, threshold: int) -> Dict[str, int]:
+        """{statement: executions} for statements repeated at least threshold times"""
+        if threshold <= 0:
+            return {}
+        return {statement: n for statement, n in self.shapes.items() if n >= threshold}
+
+    def server_timing(self) -> str:
+        """Server-Timing header value (durations in milliseconds)"""
+        value = f'db;dur={self.total_ms:.2f};desc="{self.count} queries"'
+        if self.count:
+            value += f", db-slowest;dur={self.slowest_ms:.2f}"
+        return value
+
+
+class _RouteStats:
+    """Running totals for one route"""
+    __slots__ = ("requests", "queries", "db_ms", "max_queries", "max_db_ms",
+                 "slowest_ms", "slowest_statement", "n_plus_one")
+
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.db_ms = 0.0
+        self.max_queries = 0
+        self.max_db_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.n_plus_one = 0
+
+
+_current: ContextVar[Optional[RequestQueries]] = ContextVar("sql_metrics_request", default=None)
+
+
+class SQLMetrics:
+    """Statement timing hooks plus per-route aggregates"""
+
+    def __init__(
+        self,
+        slow_query_ms: float = 100,
+        n_plus_one_threshold: int = 5,
+        slow_query_log: str = "",
+        enabled: bool = True
+    ):
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.slow_query_log = slow_query_log
+        self.enabled = enabled
+
+        self._routes: Dict[str, _RouteStats] = {}
+        self._reported_n_plus_one: Set[Tuple[str, str]] = set()
+        self.slow_queries = 0
+
+    def instrument(self, target: AsyncEngine) -> None:
+        """Time every cursor execution on target"""
+        if not self.enabled:
+            return
+
+        @event.listens_for(target.sync_engine, "before_cursor_execute")
+        def _before(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+            conn.info.setdefault("sql_metrics_start", []).append(time.perf_counter())
+
+        @event.listens_for(target.sync_engine, "after_cursor_execute")
+        def _after(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+            elapsed_ms = (time.perf_counter() - conn.info["sql_metrics_start"].pop()) * 1000
+            self.record(statement, elapsed_ms)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        """Add one statement to the current request and log it if slow"""
+        queries = _current.get()
+        if queries is not None:
+            queries.count += 1
+            queries.total_ms += elapsed_ms
+            queries.shapes[statement] += 1
+            if elapsed_ms > queries.slowest_ms:
+                queries.slowest_ms = elapsed_ms
+                queries.slowest_statement = statement
+
+        if self.slow_query_ms and elapsed_ms >= self.slow_query_ms:
+            self.slow_queries += 1
+            self._log_slow_query(statement, elapsed_ms)
+
+    def _log_slow_query(self, statement: str, elapsed_ms: float) -> None:
+        entry = json.dumps({
+            "event": "slow_query",
+            "at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(elapsed_ms, 2),
+            "statement": " ".join(statement.split())[:STATEMENT_PREVIEW_CHARS],
+        })
+        if self.slow_query_log:
+            with open(self.slow_query_log, "a", encoding="utf-8") as log:
+                log.write(entry + "\n")
+        else:
+            print(f"🐢 {entry}")
+
+    def finish(self, route: str, queries: RequestQueries) -> None:
+        """Fold a finished request into its route's totals and report N+1 statements"""
+        stats = self._routes.get(route)
+        if stats is None:
+            stats = self._routes[route] = _RouteStats()
+
+        stats.requests += 1
+        stats.queries += queries.count
+        stats.db_ms += queries.total_ms
+        stats.max_queries = max(stats.max_queries, queries.count)
+        stats.max_db_ms = max(stats.max_db_ms, queries.total_ms)
+        if queries.slowest_ms > stats.slowest_ms:
+            stats.slowest_ms = queries.slowest_ms
+            stats.slowest_statement = queries.slowest_statement
+
+        repeated = queries.n_plus_one(self.n_plus_one_threshold)
+        if repeated:
+            stats.n_plus_one += 1
+        for statement, executions in repeated.items():
+            # Once per route and statement, so a hot endpoint does not flood the log
+            if (route, statement) not in self._reported_n_plus_one:
+                self._reported_n_plus_one.add((route, statement))
+                preview = " ".join(statement.split())[:STATEMENT_PREVIEW_CHARS]
+                print(f"⚠️  N+1 in {route}: {executions}x {preview}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-route statement counts and DB time, busiest routes first"""
+        routes = {
+            route: {
+                "requests": s.requests,
+                "queries": s.queries,
+                "avg_queries": round(s.queries / s.requests, 2),
+                "max_queries": s.max_queries,
+                "db_ms": round(s.db_ms, 2),
+                "avg_db_ms": round(s.db_ms / s.requests, 2),
+                "max_db_ms": round(s.max_db_ms, 2),
+                "slowest_ms": round(s.slowest_ms, 2),
+                "slowest_statement": s.slowest_statement,
+                "n_plus_one_requests": s.n_plus_one,
+            }
+            for route, s in sorted(self._routes.items(), key=lambda item: -item[1].db_ms)
+        }
+        return {
+            "enabled": self.enabled,
+            "slow_query_ms": self.slow_query_ms,
+            "n_plus_one_threshold": self.n_plus_one_threshold,
+            "slow_queries": self.slow_queries,
+            "routes": routes,
+        }
+
+    def reset(self) -> None:
+        """Drop the per-route totals"""
+        self._routes.clear()
+        self._reported_n_plus_one.clear()
+        self.slow_queries = 0
+
+    async def middleware(self, request: Request, call_next: Any) -> Any:
+        """HTTP middleware: collect the request's statements and add Server-Timing"""
+        if not self.enabled:
+            return await call_next(request)
+
+        queries = RequestQueries()
+        token = _current.set(queries)
+        try:
+            response = await call_next(request)
+        finally:
+            _current.reset(token)
+
+        response.headers.append("Server-Timing", queries.server_timing())
+        # Requests that matched no route (404s, static mounts) would add a key per path
+        route = request.scope.get("route")
+        if route is not None:
+            self.finish(f"{request.method} {route.path}", queries)
+        return response
+
+
+# Global instance
+sql_metrics = SQLMetrics(
+    slow_query_ms=settings.SQL_SLOW_QUERY_MS,
+    n_plus_one_threshold=settings.SQL_N_PLUS_ONE_THRESHOLD,
+    slow_query_log=settings.SQL_SLOW_QUERY_LOG,
+    enabled=settings.SQL_METRICS_ENABLED
+)
+sql_metrics.instrument(engine)
+if read_engine is not engine:
+    sql_metrics.instrument(read_engine)
@@ -0,0 +1,164 @@
+"""
+In-memory delivery of the built React frontend (static_dist)
+At startup every file is indexed once: small files are held in memory along
+with pre-built Brotli and gzip variants, and the variant is picked per
+request from Accept-Encoding. Hashed Vite bundles (assets/index-D1Pec2V-.js)
+are served as immutable; index.html stays in memory for the SPA fallback.
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from typing import Dict, Optional
+
+try:
+    import brotli
+except ImportError:  # Optional: only gzip variants are built without it
+    brotli = None
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+
+from config import settings
+
+# Vite emits <name>-<8 char hash>.<ext> under assets/
+HASHED_ASSET = re.compile(r"^assets/.+-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+
+COMPRESSIBLE_TYPES = (
+    "text/", "application/javascript", "application/json", "application/xml",
+    "image/svg+xml", "application/manifest+json", "application/wasm",
+)
+
+# Below this size compression saves less than the Content-Encoding costs
+MIN_COMPRESS_BYTES = 512
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+# Directories under static_dist that change at runtime and are not indexed
+EXCLUDED_DIRS = ("api-snapshot",)
+
+
+class StaticFile:
+    """One indexed file: its bytes (or disk path when large) and pre-compressed variants"""
+    __slots__ = ("path", "media_type", "etag", "cache_control", "body", "variants")
+
+    def __init__(self, path: str, media_type: str, etag: str, cache_control: str, body: Optional[bytes]):
+        self.path = path
+        self.media_type = media_type
+        self.etag = etag
+        self.cache_control = cache_control
+        self.body = body
+        self.variants: Dict[str, bytes] = {}
+
+
+class StaticSite:
+    """Manifest of static_dist built once and served from memory"""
+
+    def __init__(self, root: str, max_memory_file_bytes: int = 4 * 1024 * 1024):
+        self.root = root
+        self.max_memory_file_bytes = max_memory_file_bytes
+        self.files: Dict[str, StaticFile] = {}
+        self.index: Optional[StaticFile] = None
+
+    @property
+    def available(self) -> bool:
+        return os.path.isdir(self.root)
+
+    def load(self) -> Dict[str, int]:
+        """Index every file under root and pre-compress the compressible ones"""
+        files: Dict[str, StaticFile] = {}
+        original_bytes = 0
+        compressed_bytes = 0
+
+        for directory, subdirs, names in os.walk(self.root):
+            if directory == self.root:
+                subdirs[:] = [name for name in subdirs if name not in EXCLUDED_DIRS]
+            for name in names:
+                path = os.path.join(directory, name)
+                relative = os.path.relpath(path, self.root).replace(os.sep, "/")
+                entry = self._index_file(relative, path)
+                files[relative] = entry
+                if entry.body is not None:
+                    original_bytes += len(entry.body)
+                    compressed_bytes += min((len(body) for body in entry.variants.values()), default=len(entry.body))
+
+        self.files = files
+        self.index = files.get("index.html")
+        return {
+            "files": len(files),
+            "compressed": sum(1 for entry in files.values() if entry.variants),
+            "bytes": original_bytes,
+            "smallest_variant_bytes": compressed_bytes,
+        }
+
+    def _index_file(self, relative: str, path: str) -> StaticFile:
+        media_type = mimetypes.guess_type(relative)[0] or "application/octet-stream"
+        cache_control = IMMUTABLE_CACHE_CONTROL if HASHED_ASSET.match(relative) else REVALIDATE_CACHE_CONTROL
+
+        stat = os.stat(path)
+        if stat.st_size > self.max_memory_file_bytes:
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            return StaticFile(path, media_type, etag, cache_control, None)
+
+        with open(path, "rb") as f:
+            body = f.read()
+        entry = StaticFile(path, media_type, f'"{hashlib.sha1(body).hexdigest()[:20]}"', cache_control, body)
+
+        if len(body) >= MIN_COMPRESS_BYTES and media_type.startswith(COMPRESSIBLE_TYPES):
+            candidates = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                candidates["br"] = brotli.compress(body, quality=11)
+            entry.variants = {
+                encoding: data for encoding, data in candidates.items() if len(data) < len(body)
+            }
+        return entry
+
+    def lookup(self, path: str) -> Optional[StaticFile]:
+        """Indexed file for a URL path (no filesystem access)"""
+        return self.files.get(path.lstrip("/"))
+
+    def response(self, request: Request, entry: StaticFile) -> Response:
+        """Serve an indexed file, honouring If-None-Match and Accept-Encoding"""
+        headers = {"Cache-Control": entry.cache_control}
+
+        if entry.body is None:
+            return FileResponse(entry.path, media_type=entry.media_type, headers=headers)
+
+        encoding = _pick_encoding(request.headers.get("accept-encoding", ""), entry.variants)
+        if entry.variants:
+            headers["Vary"] = "Accept-Encoding"
+        etag = entry.etag if encoding is None else f'{entry.etag[:-1]}-{encoding}"'
+        headers["ETag"] = etag
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+
+        if encoding is None:
+            return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+        headers["Content-Encoding"] = encoding
+        return Response(content=entry.variants[encoding], media_type=entry.media_type, headers=headers)
+
+
+def _pick_encoding(accept_encoding: str, variants: Dict[str, bytes]) -> Optional[str]:
+    if not variants:
+        return None
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(token.strip())
+    for encoding in ("br", "gzip"):
+        if encoding in variants and (encoding in accepted or "*" in accepted):
+            return encoding
+    return None
+
+
+# Global instance
+static_site = StaticSite(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "static_dist"),
+    max_memory_file_bytes=settings.STATIC_MAX_MEMORY_FILE_BYTES
+)
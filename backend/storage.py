@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from datetime import timedelta
 import hashlib
 from config import settings
+from metrics import observe_duration
 
 # Initialize Azure Blob Storage client
 blob_service_client = BlobServiceClient.from_connection_string(
@@ -209,35 +210,36 @@ class StorageService:
     
     def _resize_image(self, image: Image.Image, width: int) -> bytes:
         """Resize image maintaining aspect ratio"""
-        # Calculate new height
-        aspect_ratio = image.height / image.width
-        new_height = int(width * aspect_ratio)
-        
-        # Resize
-        resized = image.resize((width, new_height), Image.Resampling.LANCZOS)
-        
-        # Convert to bytes
-        output = io.BytesIO()
-        
-        # Determine format
-        format_map = {
-            'JPEG': 'JPEG',
-            'JPG': 'JPEG',
-            'PNG': 'PNG',
-            'WEBP': 'WEBP',
-            'GIF': 'GIF'
-        }
-        img_format = format_map.get(image.format or 'JPEG', 'JPEG')
-        
-        # Save with optimization
-        if img_format == 'JPEG':
-            resized.save(output, format=img_format, quality=85, optimize=True)
-        elif img_format == 'PNG':
-            resized.save(output, format=img_format, optimize=True)
-        else:
-            resized.save(output, format=img_format)
-        
-        return output.getvalue()
+        with observe_duration("image_resize"):
+            # Calculate new height
+            aspect_ratio = image.height / image.width
+            new_height = int(width * aspect_ratio)
+            
+            # Resize
+            resized = image.resize((width, new_height), Image.Resampling.LANCZOS)
+            
+            # Convert to bytes
+            output = io.BytesIO()
+            
+            # Determine format
+            format_map = {
+                'JPEG': 'JPEG',
+                'JPG': 'JPEG',
+                'PNG': 'PNG',
+                'WEBP': 'WEBP',
+                'GIF': 'GIF'
+            }
+            img_format = format_map.get(image.format or 'JPEG', 'JPEG')
+            
+            # Save with optimization
+            if img_format == 'JPEG':
+                resized.save(output, format=img_format, quality=85, optimize=True)
+            elif img_format == 'PNG':
+                resized.save(output, format=img_format, optimize=True)
+            else:
+                resized.save(output, format=img_format)
+            
+            return output.getvalue()
     
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for safe storage"""
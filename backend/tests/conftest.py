@@ -0,0 +1,26 @@
+"""
+Shared test setup
+The app reads its settings when modules are imported, so the environment (a
+throwaway SQLite database, dummy secrets, the fake chat model) is set here,
+before any backend module is imported. Run from backend/:  python -m pytest -q
+"""
+import os
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+TEST_DATA_DIR = tempfile.mkdtemp(prefix="cms-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(TEST_DATA_DIR, 'test.db')}"
+os.environ["API_SNAPSHOT_SERVE"] = "false"
+os.environ["CHAT_MODEL_BACKEND"] = "fake"
+for name in ("GEMINI_API_KEY", "ADMIN_PASSWORD_HASH", "SECRET_KEY"):
+    os.environ.setdefault(name, "test")
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
@@ -0,0 +1,64 @@
+"""
+Growth of the chat_sessions table (chat_sessions.SessionStore, /api/chat)
+An anonymous first exchange is stored with the short first-turn TTL, and
+only gets the full TTL once the client continues the conversation; an
+answer-cache hit that would open a new anonymous session stores nothing.
+"""
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+
+import main
+from chat_models import FakeChatModel
+from chat_sessions import session_store
+from content_versions import ensure_content_versions
+from database import AsyncSessionLocal, dispose_engines, init_db
+from models import ChatSession
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    await init_db()
+    async with AsyncSessionLocal() as db:
+        await ensure_content_versions(db)
+    monkeypatch.setattr(main, "chat_model", FakeChatModel(token_delay_ms=0, tokens=5))
+    monkeypatch.setattr(session_store, "first_turn_ttl_seconds", 60)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as client:
+        yield client
+    await dispose_engines()
+
+
+async def _remaining_ttl(session_id: str) -> float:
+    async with AsyncSessionLocal() as db:
+        row = await db.get(ChatSession, session_id)
+    return (row.expires_at.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)).total_seconds()
+
+
+async def _count() -> int:
+    async with AsyncSessionLocal() as db:
+        return await db.scalar(select(func.count()).select_from(ChatSession))
+
+
+async def test_first_turn_gets_the_short_ttl_until_the_conversation_continues(client):
+    first = (await client.post("/api/chat", json={"message": "what is a first turn ttl"})).json()
+    assert 0 < await _remaining_ttl(first["session_id"]) <= 60
+
+    second = (await client.post("/api/chat", json={"message": "and then?", "session_id": first["session_id"]})).json()
+    assert second["session_id"] == first["session_id"]
+    assert await _remaining_ttl(first["session_id"]) > session_store.ttl_seconds - 60
+
+
+async def test_cached_one_shot_answers_leave_no_rows(client):
+    message = {"message": "which tools do you build for one-shot visitors"}
+    assert (await client.post("/api/chat", json=message)).json()["session_id"]
+    before = await _count()
+
+    for _ in range(3):
+        response = (await client.post("/api/chat", json=message)).json()
+        assert response["session_id"] is None
+
+    assert await _count() == before
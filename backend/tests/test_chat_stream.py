@@ -0,0 +1,133 @@
+"""
+Streaming chat (/api/chat/stream, chat_models)
+The first token event must reach the client while the model is still
+generating, and a client that disconnects mid-answer must stop the
+generation and give its chat_engine slot back. The app is driven over raw
+ASGI so each body message is seen as it is sent and a disconnect can be
+delivered mid-stream.
+"""
+import asyncio
+import json
+from typing import Any, AsyncIterator, List, Optional
+
+import pytest
+
+import main
+from chat_engine import chat_engine
+from chat_models import FakeChatModel, GeminiChatModel
+from content_versions import ensure_content_versions
+from database import AsyncSessionLocal, dispose_engines, init_db
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingChatModel(FakeChatModel):
+    """FakeChatModel that records how far each stream got"""
+
+    def __init__(self) -> None:
+        super().__init__(token_delay_ms=20, tokens=30)
+        self.generated = 0
+        self.finished = False
+
+    async def stream(self, history: Any, message: str) -> AsyncIterator[str]:
+        async for text in super().stream(history, message):
+            self.generated += 1
+            yield text
+        self.finished = True
+
+
+@pytest.fixture
+async def model(monkeypatch):
+    await init_db()
+    async with AsyncSessionLocal() as db:
+        await ensure_content_versions(db)
+    model = RecordingChatModel()
+    monkeypatch.setattr(main, "chat_model", model)
+    yield model
+    await dispose_engines()
+
+
+async def _post_stream(message: str, disconnect_after: Optional[int] = None, on_token: Any = None) -> List[bytes]:
+    """Body messages of POST /api/chat/stream; the client disconnects after disconnect_after of them"""
+    body = json.dumps({"message": message}).encode()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": "/api/chat/stream", "raw_path": b"/api/chat/stream",
+        "query_string": b"", "root_path": "", "client": ("10.9.8.7", 40000), "server": ("test", 80),
+        "headers": [(b"host", b"test"), (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode())],
+    }
+    request_sent = False
+    gone = asyncio.Event()
+    chunks: List[bytes] = []
+
+    async def receive() -> dict:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await gone.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.body" and message.get("body"):
+            chunks.append(message["body"])
+            if on_token is not None and len(chunks) == 1:
+                on_token()
+            if disconnect_after is not None and len(chunks) >= disconnect_after:
+                gone.set()
+
+    await asyncio.wait_for(main.app(scope, receive, send), 10)
+    return chunks
+
+
+async def test_first_token_arrives_before_generation_finishes(model):
+    finished_at_first_token = []
+    chunks = await _post_stream("first token timing", on_token=lambda: finished_at_first_token.append(model.finished))
+
+    assert finished_at_first_token == [False]
+    assert chunks[0].startswith(b"event: token\n")
+    assert chunks[-1].startswith(b"event: done\n")
+    assert model.finished
+    assert chat_engine.running == 0
+
+
+async def test_disconnect_stops_generation_and_releases_the_slot(model):
+    await _post_stream("disconnect mid answer", disconnect_after=3)
+    await asyncio.sleep(0.1)  # Longer than a token: a generation still running would move on
+
+    assert not model.finished
+    assert model.generated < model.tokens
+    assert chat_engine.running == 0
+    assert chat_engine.stats()["clients"] == 0
+
+
+class _HangingResponse:
+    """Stands in for the SDK's streamed response: one chunk, then waits on the RPC forever"""
+
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        yield type("Chunk", (), {"text": "Hello"})()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+async def test_closing_a_gemini_stream_cancels_the_upstream_read(monkeypatch):
+    response = _HangingResponse()
+
+    class Session:
+        async def send_message_async(self, message: str, stream: bool = False) -> _HangingResponse:
+            return response
+
+    gemini = GeminiChatModel("system prompt")
+    monkeypatch.setattr(gemini, "_session", lambda history: Session())
+    tokens = gemini.stream([], "hi")
+
+    assert await tokens.__anext__() == "Hello"
+    await tokens.aclose()
+    assert response.cancelled
@@ -0,0 +1,113 @@
+"""
+Conditional GETs on the public content routes (cache.CachedView)
+A request carrying the current ETag must be answered 304 from the content
+versions alone: the SQL counter (sql_metrics) may only see the
+content_versions lookup, never the main query. An admin write must change
+the ETag.
+"""
+from typing import List
+
+import httpx
+import pytest
+
+from auth import create_access_token
+from content_versions import ensure_content_versions
+from database import AsyncSessionLocal, dispose_engines, init_db
+from detail_cache import detail_cache
+from main import app
+from sql_metrics import sql_metrics
+
+pytestmark = pytest.mark.anyio
+
+ADMIN_HEADERS = {"Authorization": "Bearer " + create_access_token({"sub": "admin"})}
+
+CONDITIONAL_ROUTES = [
+    "/api/blogs",
+    "/api/blogs/etag-blog",
+    "/api/projects",
+    "/api/projects/etag-project",
+    "/api/services",
+    "/api/tools",
+    "/api/tools/etag-tool",
+]
+
+
+@pytest.fixture
+async def client():
+    await init_db()
+    async with AsyncSessionLocal() as db:
+        await ensure_content_versions(db)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # The database lives for the whole session, so the items are created once
+        if (await client.get("/api/blogs/etag-blog")).status_code == 404:
+            for path, payload in (
+                ("/api/admin/blogs", {"title": "ETag blog", "excerpt": "e", "content": "c", "published": True}),
+                ("/api/admin/projects", {"title": "ETag project", "description": "d", "published": True}),
+                ("/api/admin/services", {"title": "ETag service", "description": "d"}),
+                ("/api/admin/tools", {"name": "ETag tool", "description": "d"}),
+            ):
+                response = await client.post(path, json=payload, headers=ADMIN_HEADERS)
+                assert response.status_code == 200, response.text
+        detail_cache.clear()
+        yield client
+
+    await dispose_engines()
+
+
+@pytest.fixture
+def statements(monkeypatch) -> List[List[str]]:
+    """SQL statements of each finished request, in order"""
+    captured: List[List[str]] = []
+    finish = sql_metrics.finish
+
+    def record(route, queries):
+        captured.append(list(queries.shapes.elements()))
+        finish(route, queries)
+
+    monkeypatch.setattr(sql_metrics, "finish", record)
+    return captured
+
+
+@pytest.mark.parametrize("path", CONDITIONAL_ROUTES)
+async def test_current_etag_is_answered_304_without_the_main_query(client, statements, path):
+    first = await client.get(path)
+    assert first.status_code == 200, first.text
+    etag = first.headers["etag"]
+
+    # Detail routes would otherwise answer from memory without any SQL at all
+    detail_cache.clear()
+    statements.clear()
+    revalidated = await client.get(path, headers={"If-None-Match": etag})
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+    assert len(statements) == 1
+    assert len(statements[0]) == 1, statements[0]
+    assert "FROM content_versions" in statements[0][0]
+
+
+async def test_cached_detail_is_revalidated_without_sql(client, statements):
+    etag = (await client.get("/api/blogs/etag-blog")).headers["etag"]
+
+    statements.clear()
+    revalidated = await client.get("/api/blogs/etag-blog", headers={"If-None-Match": etag})
+
+    assert revalidated.status_code == 304
+    assert statements == [[]]
+
+
+@pytest.mark.parametrize("path", ["/api/blogs", "/api/blogs/etag-blog"])
+async def test_admin_write_changes_the_etag(client, path):
+    before = (await client.get(path)).headers["etag"]
+
+    blog_id = (await client.get("/api/blogs/etag-blog")).json()["id"]
+    response = await client.put(
+        f"/api/admin/blogs/{blog_id}", json={"excerpt": f"edited {before}"}, headers=ADMIN_HEADERS
+    )
+    assert response.status_code == 200, response.text
+
+    after = await client.get(path, headers={"If-None-Match": before})
+    assert after.status_code == 200
+    assert after.headers["etag"] != before
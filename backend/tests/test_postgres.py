@@ -0,0 +1,226 @@
+"""
+PostgreSQL end to end: migrations, full-text search, copy_database.py,
+concurrent startup and related-content refreshes, against a throwaway
+cluster created with initdb/pg_ctl in a temporary directory. Skipped when
+the PostgreSQL binaries are not found (on PATH, or in the directory named by
+PG_BIN). initdb refuses to run as root, so as root the cluster runs as
+PG_TEST_OS_USER (default: nobody).
+"""
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Callable, Iterator, List
+
+import pytest
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from config import settings
+from copy_database import copy_database
+from database import ALEMBIC_INI, upgrade_schema
+from models import Blog, Category, RelatedItem, Tag
+from related import rebuild_related, refresh_related
+from search import search_blogs
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+pytestmark = pytest.mark.anyio
+
+
+def _pg_binary(name: str) -> str:
+    if os.environ.get("PG_BIN"):
+        path = os.path.join(os.environ["PG_BIN"], name)
+        return path if os.access(path, os.X_OK) else ""
+    return shutil.which(name) or ""
+
+
+def _head_revision() -> str:
+    return ScriptDirectory.from_config(Config(ALEMBIC_INI)).get_current_head()
+
+
+@pytest.fixture(scope="module")
+def create_database() -> Iterator[Callable[[str], str]]:
+    """Start a cluster for this module; yields a function creating a database and returning its URL"""
+    initdb, pg_ctl, createdb = (_pg_binary(name) for name in ("initdb", "pg_ctl", "createdb"))
+    if not (initdb and pg_ctl and createdb):
+        pytest.skip("initdb/pg_ctl not found (put them on PATH or set PG_BIN)")
+
+    run_as: List[str] = []
+    workdir = tempfile.mkdtemp(prefix="cms-pg-")
+    if os.geteuid() == 0:
+        runuser = shutil.which("runuser")
+        if runuser is None:
+            shutil.rmtree(workdir)
+            pytest.skip("running as root without runuser; initdb cannot run as root")
+        user = os.environ.get("PG_TEST_OS_USER", "nobody")
+        shutil.chown(workdir, user)
+        run_as = [runuser, "-u", user, "--"]
+
+    data = os.path.join(workdir, "data")
+    subprocess.run(run_as + [initdb, "-D", data, "-U", "postgres", "-A", "trust"],
+                   check=True, capture_output=True)
+    subprocess.run(run_as + [pg_ctl, "-D", data, "-o", f"-k {workdir} -h ''",
+                             "-l", os.path.join(workdir, "postgres.log"), "-w", "start"],
+                   check=True, capture_output=True)
+
+    def create(name: str) -> str:
+        subprocess.run([createdb, "-h", workdir, "-U", "postgres", name], check=True, capture_output=True)
+        return f"postgresql+asyncpg://postgres@/{name}?host={workdir}"
+
+    try:
+        yield create
+    finally:
+        subprocess.run(run_as + [pg_ctl, "-D", data, "-m", "immediate", "stop"], capture_output=True)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+async def _migrate(url: str) -> None:
+    engine = create_async_engine(url)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(upgrade_schema)
+    finally:
+        await engine.dispose()
+
+
+def _blog(number: int, **fields) -> Blog:
+    defaults = dict(title=f"Post {number}", slug=f"post-{number}", excerpt=f"Excerpt {number}",
+                    content=f"Body of post {number}.", published=True)
+    return Blog(**{**defaults, **fields})
+
+
+async def test_migrations_reach_head(create_database):
+    url = create_database("migrations")
+    await _migrate(url)
+    await _migrate(url)  # A second run on an up-to-date database is a no-op
+
+    engine = create_async_engine(url)
+    try:
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("SELECT version_num FROM alembic_version"))).scalars().all() == [
+                _head_revision()
+            ]
+            assert await conn.scalar(text("SELECT to_regclass('chat_sessions')")) is not None
+            assert await conn.scalar(text("SELECT to_regclass('ix_blogs_search')")) is not None
+    finally:
+        await engine.dispose()
+
+
+async def test_search_uses_the_postgres_text_index(create_database):
+    url = create_database("search")
+    await _migrate(url)
+
+    engine = create_async_engine(url)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            db.add_all([
+                _blog(1, title="Running FastAPI in production", content="Workers, timeouts and health checks."),
+                _blog(2, title="Caching", content="The service runs behind a CDN."),
+                _blog(3, title="Unrelated", content="Nothing to see here."),
+            ])
+            await db.commit()
+
+            results = await search_blogs(db, select(Blog), "runs", 0, 10)
+            assert {blog.slug for blog, _ in results} == {"post-1", "post-2"}  # "runs" also stems "running"
+            assert all("<mark>" in snippet for _, snippet in results)
+
+            prefix = await search_blogs(db, select(Blog), "fast", 0, 10)
+            assert [blog.slug for blog, _ in prefix] == ["post-1"]
+            assert await search_blogs(db, select(Blog), "!!", 0, 10) == []
+    finally:
+        await engine.dispose()
+
+
+async def test_copy_database_copies_rows_and_resets_sequences(create_database, tmp_path):
+    source_url = f"sqlite+aiosqlite:///{tmp_path / 'source.db'}"
+    await _migrate(source_url)
+    source = create_async_engine(source_url)
+    try:
+        async with AsyncSession(source) as db:
+            category = Category(name="Notes", slug="notes")
+            db.add(category)
+            await db.flush()
+            db.add_all([_blog(number, category_id=category.id) for number in range(1, 26)])
+            await db.commit()
+    finally:
+        await source.dispose()
+
+    target_url = create_database("copy")
+    report = await copy_database(source_url, target_url, batch_size=10)
+    assert report["blogs"] == (25, 25)
+    assert report["categories"] == (1, 1)
+    assert all(source_rows == target_rows for source_rows, target_rows in report.values())
+
+    with pytest.raises(RuntimeError, match="already has rows"):
+        await copy_database(source_url, target_url)
+
+    target = create_async_engine(target_url)
+    try:
+        async with AsyncSession(target, expire_on_commit=False) as db:
+            blog = _blog(26)
+            db.add(blog)
+            await db.commit()
+            assert blog.id == 26  # The id sequence continues after the copied rows
+    finally:
+        await target.dispose()
+
+
+async def test_concurrent_init_db_migrates_once(create_database):
+    url = create_database("startup")
+    env = {**os.environ, "DATABASE_URL": url, "DATABASE_READ_URL": ""}
+    code = "import asyncio, database; asyncio.run(database.init_db())"
+    workers = [
+        await asyncio.create_subprocess_exec(
+            sys.executable, "-c", code, cwd=BACKEND_DIR, env=env,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+        )
+        for _ in range(3)
+    ]
+    for worker in workers:
+        output, _ = await worker.communicate()
+        assert worker.returncode == 0, output.decode()
+
+    engine = create_async_engine(url)
+    try:
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("SELECT version_num FROM alembic_version"))).scalars().all() == [
+                _head_revision()
+            ]
+    finally:
+        await engine.dispose()
+
+
+async def test_related_refresh_matches_a_rebuild(create_database, monkeypatch):
+    monkeypatch.setattr(settings, "RELATED_TFIDF_ENABLED", False)
+    url = create_database("related")
+    await _migrate(url)
+
+    engine = create_async_engine(url)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            category = Category(name="Notes", slug="notes")
+            tags = [Tag(name=f"Tag {i}", slug=f"tag-{i}") for i in range(4)]
+            db.add_all([category, *tags])
+            await db.flush()
+            db.add_all([_blog(number, category_id=category.id, tags=tags[number % 4:number % 4 + 2])
+                        for number in range(1, 13)])
+            await db.flush()
+            await rebuild_related(db)
+
+            blog = _blog(13, category_id=category.id, tags=tags[:3])
+            db.add(blog)
+            await db.flush()
+            await refresh_related(db, "blogs", blog.id)
+            await db.commit()
+
+            query = select(RelatedItem.source_id, RelatedItem.rank, RelatedItem.target_id, RelatedItem.score)
+            incremental = (await db.execute(query.order_by(RelatedItem.source_id, RelatedItem.rank))).all()
+            await rebuild_related(db)
+            assert incremental == (await db.execute(query.order_by(RelatedItem.source_id, RelatedItem.rank))).all()
+    finally:
+        await engine.dispose()
@@ -0,0 +1,39 @@
+"""
+EXPLAIN-plan regression test for the public query shapes (query_plans.py)
+Every entry of PUBLIC_QUERIES must use its index on a freshly migrated
+database, so a migration or model change that loses an index fails here.
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from database import upgrade_schema
+from query_plans import PUBLIC_QUERIES, check_query_plans
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def conn(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'plans.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(upgrade_schema)
+    async with engine.connect() as connection:
+        yield connection
+    await engine.dispose()
+
+
+async def test_every_public_query_uses_its_index(conn):
+    report = await check_query_plans(conn)
+
+    assert set(report) == set(PUBLIC_QUERIES)
+    assert {name: problem for name, problem in report.items() if problem} == {}
+
+
+async def test_a_lost_index_is_reported(conn):
+    await conn.execute(text("DROP INDEX ix_blogs_published_published_at_id"))
+
+    report = await check_query_plans(conn)
+
+    assert report["blogs list"] is not None
+    assert report["projects list"] is None
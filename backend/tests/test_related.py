@@ -0,0 +1,108 @@
+"""
+Incremental related-content refreshes (related.refresh_related)
+Every admin write rescores only the written item; with TF-IDF off (no IDF
+drift) the lists must end up exactly as a full rebuild computes them.
+"""
+import random
+from typing import Dict, List, Tuple
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload
+
+import related
+from config import settings
+from database import upgrade_schema
+from models import Blog, Category, Project, RelatedFeature, RelatedItem, Tag
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "RELATED_TFIDF_ENABLED", False)
+    monkeypatch.setattr(settings, "RELATED_TOP_K", 3)
+    monkeypatch.setattr(settings, "RELATED_CATEGORY_CANDIDATES", 4)
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'related.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_schema)
+
+    rng = random.Random(7)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        categories = [Category(name=f"Category {i}", slug=f"category-{i}") for i in range(3)]
+        tags = [Tag(name=f"Tag {i}", slug=f"tag-{i}") for i in range(6)]
+        session.add_all(categories + tags)
+        await session.flush()
+        for i in range(40):
+            session.add(Blog(title=f"Post {i}", slug=f"post-{i}", excerpt="e", content="c", published=i % 9 != 0,
+                             category_id=rng.choice(categories).id, tags=rng.sample(tags, rng.randint(0, 3))))
+        for i in range(8):
+            session.add(Project(title=f"Project {i}", slug=f"project-{i}", description="d", published=True,
+                                category_id=rng.choice(categories).id, tags=rng.sample(tags, 2)))
+        await related.rebuild_related(session)
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+async def _lists(db: AsyncSession) -> Dict[Tuple[str, int], List[Tuple[str, int, str, float]]]:
+    result = await db.execute(select(RelatedItem).order_by(RelatedItem.rank))
+    lists: Dict[Tuple[str, int], List[Tuple[str, int, str, float]]] = {}
+    for row in result.scalars().all():
+        lists.setdefault((row.source_type, row.source_id), []).append(
+            (row.target_type, row.target_id, row.target_title, row.score)
+        )
+    return lists
+
+
+async def test_refreshes_match_a_full_rebuild(db):
+    rng = random.Random(11)
+    tags = (await db.execute(select(Tag))).scalars().all()
+    for step in range(40):
+        blog_id = rng.randint(1, 40)
+        blog = (await db.execute(
+            select(Blog).options(selectinload(Blog.tags)).where(Blog.id == blog_id)
+        )).scalar_one_or_none()
+        if blog is None:
+            continue
+        operation = rng.choice(["retitle", "retag", "recategorize", "publish", "create", "delete"])
+        if operation == "retitle":
+            blog.title = f"Edited {step}"
+        elif operation == "retag":
+            blog.tags = rng.sample(tags, rng.randint(0, 3))
+        elif operation == "recategorize":
+            blog.category_id = rng.choice([None, 1, 2, 3])
+        elif operation == "publish":
+            blog.published = not blog.published
+        elif operation == "delete":
+            await db.delete(blog)
+        else:
+            blog = Blog(title=f"New {step}", slug=f"new-{step}", excerpt="e", content="c", published=True,
+                        category_id=blog.category_id, tags=rng.sample(tags, 2))
+            db.add(blog)
+            await db.flush()
+        await related.refresh_related(db, "blogs", blog.id)
+        await db.commit()
+
+    incremental = await _lists(db)
+    await related.rebuild_related(db)
+    await db.commit()
+    assert incremental == await _lists(db)
+
+
+async def test_unpublished_item_leaves_every_list(db):
+    target = (await db.execute(select(RelatedItem).limit(1))).scalar_one()
+    entity, item_id = target.target_type, target.target_id
+    item = await db.get(Blog if entity == "blogs" else Project, item_id)
+    item.published = False
+    await related.refresh_related(db, entity, item_id)
+    await db.commit()
+
+    for query in (
+        select(RelatedItem.id).where(RelatedItem.target_type == entity, RelatedItem.target_id == item_id),
+        select(RelatedItem.id).where(RelatedItem.source_type == entity, RelatedItem.source_id == item_id),
+        select(RelatedFeature.feature).where(RelatedFeature.source_type == entity, RelatedFeature.source_id == item_id),
+    ):
+        assert (await db.execute(query)).all() == []
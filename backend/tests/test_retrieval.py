@@ -0,0 +1,74 @@
+"""
+Retrieval index upkeep (retrieval.RetrievalIndex)
+An admin write re-embeds only the written item and leaves the index current
+for its entity, and the startup build runs in the background: questions
+asked meanwhile are answered ungrounded instead of waiting for it.
+"""
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from content_versions import bump_content_versions, ensure_content_versions
+from database import upgrade_schema
+from models import Blog
+from retrieval import HashingEmbedder, RetrievalIndex
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def db(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'retrieval.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_schema)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        await ensure_content_versions(session)
+        session.add_all([Blog(title=f"Post {i}", slug=f"post-{i}", excerpt="e", content=f"Notes on topic {i}",
+                              published=True) for i in range(20)])
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+async def test_refresh_re_embeds_only_the_written_item(db):
+    index = RetrievalIndex(HashingEmbedder(128), min_score=0)
+    await index.sync(db)
+    assert index.embedded_items == 20
+
+    blog = (await db.execute(select(Blog).where(Blog.slug == "post-3"))).scalar_one()
+    blog.content = "Kubernetes autoscaling with custom metrics"
+    await bump_content_versions(db, "blogs")
+    await db.commit()
+    await index.refresh(db, "blogs", blog.id)
+
+    assert index.embedded_items == 21
+    assert index.search("kubernetes autoscaling", 1)[0][0].key == ("blogs", blog.id)
+    versions = dict(index.stats()["versions"])
+    await index.sync(db)  # Nothing left to do: the refresh brought the entity up to date
+    assert index.embedded_items == 21 and dict(index.stats()["versions"]) == versions
+
+    blog.published = False
+    await bump_content_versions(db, "blogs")
+    await db.commit()
+    await index.refresh(db, "blogs", blog.id)
+    assert ("blogs", blog.id) not in {chunk.key for chunk, _ in index.search("kubernetes autoscaling", 5)}
+
+
+async def test_questions_do_not_wait_for_the_startup_build(db):
+    class SlowEmbedder(HashingEmbedder):
+        def embed(self, texts):
+            if len(texts) > 1:
+                time.sleep(0.3)  # In the worker thread: the event loop keeps running
+            return super().embed(texts)
+
+    index = RetrievalIndex(SlowEmbedder(128), min_score=0)
+    index._warmup = asyncio.create_task(index.sync(db))  # What start() runs, on this test's session
+    await asyncio.sleep(0.05)
+
+    assert index.warming
+    assert await asyncio.wait_for(index.context_for(db, "topic 3"), 0.1) == ""
+    await index._warmup
+    assert "Post 3" in await index.context_for(db, "notes on topic 3")
@@ -0,0 +1,87 @@
+"""
+Parity of the orjson fast path (serializers.RowSerializer) with Pydantic
+check_parity() must find no byte difference for any list schema, over rows
+holding the values most likely to diverge: NULL columns, int-valued and
+exponent floats, naive and aware datetimes (with and without microseconds),
+JSON-array text columns and non-ASCII / escaped text.
+"""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from database import upgrade_schema
+from models import Blog, Category, Project, Service, Tag, Tool
+from schemas import ServiceResponse, ToolResponse
+from serializers import _pydantic_bytes, check_parity, dumps, serializer_for
+
+pytestmark = pytest.mark.anyio
+
+TEXT = "Ünïcødé – नमस्ते 🚀 \"quoted\" back\\slash\ttab\nline sep </script>"
+JSON_LIST = '["FastAPI", "Ünïcødé", "quote \\" inside", 3]'
+
+NAIVE = datetime(2025, 3, 1, 12, 30, 0)
+AWARE = datetime(2025, 3, 1, 12, 30, 0, 123456, tzinfo=timezone.utc)
+OFFSET = datetime(2025, 3, 1, 18, 0, 0, 500, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+
+
+@pytest.fixture
+async def db(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'parity.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_schema)
+
+    async with AsyncSession(engine) as session:
+        category = Category(name=TEXT[:40], slug="unicode", description=None)
+        tag = Tag(name="Ünïcødé 🚀", slug="unicode")
+        session.add_all([category, tag, Category(name="Plain", slug="plain", description=TEXT)])
+        await session.flush()
+
+        for number, moment in enumerate((NAIVE, AWARE, OFFSET, None), start=1):
+            session.add(Blog(
+                title=f"{TEXT[:60]} {number}", slug=f"blog-{number}", excerpt=TEXT, content=TEXT,
+                meta_title=None if number % 2 else TEXT[:60], read_time=None if number % 2 else 7,
+                views=2 ** 40 if number == 1 else 0, published=True, featured=number == 2,
+                published_at=moment, updated_at=moment, category_id=category.id if number % 2 else None,
+                tags=[tag],
+            ))
+            session.add(Project(
+                title=f"Project {number} 🚀", slug=f"project-{number}", description=TEXT,
+                long_description=None if number % 2 else TEXT, tech_stack=JSON_LIST if number % 2 else None,
+                gallery_images=JSON_LIST, published=True, published_at=moment, completed_at=moment,
+                category_id=category.id, tags=[tag],
+            ))
+            session.add(Service(
+                title=f"Service {number}", slug=f"service-{number}", description=TEXT,
+                price=(500, 99.5, 1e-05, None)[number - 1], features=JSON_LIST, deliverables=None,
+            ))
+            session.add(Tool(
+                name=f"Tool {number} ✓", slug=f"tool-{number}", description=TEXT,
+                price=(None, 12, 0.1, 1e21)[number - 1], rating=(4, None, 4.75, 0)[number - 1],
+                tech_stack=JSON_LIST, features=None if number % 2 else JSON_LIST, category="AI",
+            ))
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+async def test_fast_path_matches_pydantic_for_every_list_schema(db):
+    report = await check_parity(db)
+
+    assert len(report) == 8
+    assert not [name for name in report if "(0 rows)" in name]
+    assert {name: problem for name, problem in report.items() if problem} == {}
+
+
+async def test_int_valued_floats_are_written_as_floats(db):
+    # The database hands REAL columns back as floats; rows built in Python may still hold ints
+    for schema, model in ((ServiceResponse, Service), (ToolResponse, Tool)):
+        serializer = serializer_for(schema)
+        stored = (await db.execute(select(model).order_by(model.id))).scalars().all()
+        rows = [SimpleNamespace(**{**{name: getattr(row, name) for name in serializer.fields},
+                                   "price": price, **({"rating": 4} if model is Tool else {})})
+                for row, price in zip(stored, (500, 0, -3, 10 ** 17))]
+
+        assert dumps(serializer.many(rows)) == _pydantic_bytes(schema, rows)
@@ -95,6 +95,26 @@ export interface Stats {
   total_views: number;
 }
 
+export interface RelatedItem {
+  type: 'blogs' | 'projects';
+  id: number;
+  slug: string;
+  title: string;
+  summary?: string;
+  thumbnail_image?: string;
+  score: number;
+}
+
+export type HomeBundleSection = 'featured_blogs' | 'featured_projects' | 'services' | 'tools' | 'stats';
+
+export interface HomeBundle {
+  featured_blogs?: Blog[];
+  featured_projects?: Project[];
+  services?: Service[];
+  tools?: Tool[];
+  stats?: Stats;
+}
+
 // API Client
 export const cmsApi = {
   // === Public Endpoints ===
@@ -107,6 +127,8 @@ export const cmsApi = {
     tag?: string;
     search?: string;
     featured?: boolean;
+    projection?: 'summary' | 'full';
+    fields?: string;
   } = {}): Promise<Blog[]> {
     const query = new URLSearchParams(
       Object.entries(params)
@@ -165,6 +187,8 @@ export const cmsApi = {
     tag?: string;
     status?: string;
     featured?: boolean;
+    projection?: 'summary' | 'full';
+    fields?: string;
   } = {}): Promise<Project[]> {
     const query = new URLSearchParams(
       Object.entries(params)
@@ -247,6 +271,27 @@ export const cmsApi = {
     return response.json();
   },
 
+  // Related content (precomputed top-K blogs and projects)
+  async getRelated(type: 'blogs' | 'projects', slug: string): Promise<RelatedItem[]> {
+    const response = await fetch(`${API_URL}/api/${type}/${slug}/related`);
+    if (!response.ok) throw new Error('Failed to fetch related content');
+    return response.json();
+  },
+
+  // Homepage bundle: every homepage section in one request
+  async getHomeBundle(params: {
+    sections?: HomeBundleSection[];
+    limit?: number;
+  } = {}): Promise<HomeBundle> {
+    const query = new URLSearchParams();
+    if (params.sections?.length) query.set('sections', params.sections.join(','));
+    if (params.limit !== undefined) query.set('limit', String(params.limit));
+
+    const response = await fetch(`${API_URL}/api/bundle/home?${query.toString()}`);
+    if (!response.ok) throw new Error('Failed to fetch homepage bundle');
+    return response.json();
+  },
+
   // === Admin Endpoints ===
 
   async adminLogin(username: string, password: string): Promise<{ access_token: string; token_type: string }> {
@@ -33,6 +33,8 @@ export const TechnoBoyzChat: React.FC = () => {
     input: ''
   });
 
+  // The server keeps the conversation; only the new message and this id are sent
+  const sessionIdRef = useRef<string | null>(null);
   const messagesEndRef = useRef<HTMLDivElement>(null);
   const inputRef = useRef<HTMLInputElement>(null);
 
@@ -100,10 +102,7 @@ export const TechnoBoyzChat: React.FC = () => {
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({
           message: textToSend,
-          history: state.messages.slice(-5).map(m => ({
-            role: m.role,
-            content: m.content
-          }))
+          session_id: sessionIdRef.current ?? undefined
         })
       });
 
@@ -112,6 +111,9 @@ export const TechnoBoyzChat: React.FC = () => {
       }
 
       const data = await response.json();
+      if (data.session_id) {
+        sessionIdRef.current = data.session_id;
+      }
 
       const aiMessage: Message = {
         id: (Date.now() + 1).toString(),
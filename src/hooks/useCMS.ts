@@ -3,7 +3,7 @@
  */
 
 import { useState, useEffect, useCallback } from 'react';
-import { cmsApi, Blog, Project, Service, Tool, Stats } from '../api/cms';
+import { cmsApi, Blog, Project, Service, Tool, Stats, HomeBundleSection } from '../api/cms';
 import resolveContentMedia from '../lib/resolveMedia';
 
 // Generic data fetching hook with loading and error states
@@ -252,6 +252,25 @@ export function useStats() {
   };
 }
 
+// === Homepage Bundle ===
+
+export function useHomeBundle(params: {
+  sections?: HomeBundleSection[];
+  limit?: number;
+} = {}) {
+  const { data, loading, error, refetch } = useAPIData(
+    () => cmsApi.getHomeBundle(params),
+    [JSON.stringify(params)]
+  );
+
+  return {
+    bundle: data,
+    loading,
+    error,
+    refetch
+  };
+}
+
 // === Admin Hook ===
 
 export function useAuth() {
@@ -17,7 +17,10 @@ const DevilLabsPage: React.FC = () => {
     useEffect(() => {
         const fetchProjects = async () => {
             try {
-                const data = await cmsApi.getProjects({ limit: 100 });
+                const data = await cmsApi.getProjects({
+                    limit: 100,
+                    fields: 'title,description,long_description,featured_image,thumbnail_image,github_url,demo_url,live_url,featured,tech_stack'
+                });
                 setProjects(data);
             } catch (err) {
                 console.error('Failed to fetch projects:', err);